@@ -4,6 +4,11 @@ Tests for workflow_data_utils module.
 
 Covers:
 - gh CLI availability check
+- Checking gh CLI once per process and session
+- Following Link headers to later pages, only as far as needed
+- Fetching run timing concurrently, in order, with rate limit retries
+- Taking run timing from the list of runs
+- Choosing a transport, and the HTTPS transport against a local stand-in server
 - API response parsing
 - Date filtering
 - Error handling
@@ -19,22 +24,54 @@ Some tests use mock data to avoid requiring network access.
 
 import sys
 import json
+import subprocess
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, parse_qs
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import workflow_data_utils
 from workflow_data_utils import (
+    GitHubSession,
+    GhCliTransport,
+    HttpTransport,
+    select_transport,
+    get_default_session,
+    reset_gh_cli_check,
     _check_gh_cli,
+    _run_gh_api,
     _filter_fields,
     list_workflow_runs,
     get_workflow_run_details,
     list_workflow_jobs,
     get_workflow_job_details,
+    list_workflow_run_timing,
     get_workflow_run_timing
 )
 
+# Transport of the default session before setup_module(), restored by teardown_module()
+_saved_transport = None
+
+
+def setup_module():
+    """Use the gh transport for the tests that stand in for gh, even if a token is set."""
+    global _saved_transport
+    _saved_transport = get_default_session().transport
+    get_default_session().set_transport(GhCliTransport())
+    reset_gh_cli_check()
+
+
+def teardown_module():
+    """Restore the default session's transport and forget the gh CLI check."""
+    get_default_session().set_transport(_saved_transport)
+    reset_gh_cli_check()
+
 
 def test_check_gh_cli():
     """Test gh CLI availability check."""
@@ -55,6 +92,419 @@ def test_check_gh_cli():
     print("  ✓ gh CLI check completed without crashing")
 
 
+class FakeGh:
+    """
+    Stand-in for subprocess.run that records gh commands.
+    
+    gh api requests are answered from lists of runs and jobs, in pages
+    of per_page items with a Link header to the next page. A run's own
+    endpoint answers with the run. The first rate_limited requests are
+    refused with a secondary rate limit, and each request takes delay
+    seconds.
+    """
+    
+    def __init__(self, authenticated=True, runs=None, jobs=None, delay=0.0, rate_limited=0):
+        self.commands = []
+        self.authenticated = authenticated
+        self.runs = runs or []
+        self.jobs = jobs or []
+        self.delay = delay
+        self.rate_limited = rate_limited
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+    
+    def api_calls(self):
+        return [cmd for cmd in self.commands if cmd[:2] == ['gh', 'api']]
+    
+    def __call__(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        if cmd[:3] == ['gh', 'auth', 'status'] and not self.authenticated:
+            return subprocess.CompletedProcess(cmd, 1, '', 'not logged in')
+        if cmd[:2] != ['gh', 'api']:
+            return subprocess.CompletedProcess(cmd, 0, '', '')
+        
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            refuse = self.rate_limited > 0
+            self.rate_limited -= 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if refuse:
+            return subprocess.CompletedProcess(
+                cmd, 1, 'HTTP/2.0 403 Forbidden\r\nRetry-After: 0\r\n\r\n{}',
+                'gh: You have exceeded a secondary rate limit. (HTTP 403)')
+        
+        url = urlsplit(cmd[-1])
+        data, next_query = api_page(url.path, url.query, self.runs, self.jobs)
+        headers = 'HTTP/2.0 200 OK\r\nContent-Type: application/json\r\n'
+        if next_query:
+            next_url = f"https://api.github.com{url.path}?{next_query}"
+            headers += f'Link: <{next_url}>; rel="next", <{next_url}>; rel="last"\r\n'
+        return subprocess.CompletedProcess(cmd, 0, headers + '\r\n' + json.dumps(data), '')
+
+
+def api_page(path, query, runs, jobs):
+    """
+    Answer a stand-in API request from lists of runs and jobs.
+    
+    Returns:
+        Tuple of (response data, query of the next page or None); data is
+        None for unknown runs
+    """
+    run_id = path.rsplit('/', 1)[-1]
+    if run_id.isdigit():
+        return next((run for run in runs if run['id'] == int(run_id)), None), None
+    
+    query = parse_qs(query)
+    per_page = int(query.get('per_page', ['30'])[0])
+    page = int(query.get('page', ['1'])[0])
+    key, items = ('jobs', jobs) if path.endswith('/jobs') else ('workflow_runs', runs)
+    data = {'total_count': len(items), key: items[(page - 1) * per_page:page * per_page]}
+    next_query = f"per_page={per_page}&page={page + 1}" if page * per_page < len(items) else None
+    return data, next_query
+
+
+class StandInApi(BaseHTTPRequestHandler):
+    """Local stand-in for the GitHub REST API under /api, with keep-alive connections."""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.requests.append((url.path, self.headers.get('Authorization')))
+        if self.server.rate_limited > 0:
+            self.server.rate_limited -= 1
+            self.respond(403, {'message': 'You have exceeded a secondary rate limit.'}, {'Retry-After': '0'})
+            return
+        
+        data, next_query = None, None
+        if url.path.startswith('/api/repos/o/r/actions/'):
+            data, next_query = api_page(url.path, url.query, self.server.runs, self.server.jobs)
+        if data is None:
+            self.respond(404, {'message': 'Not Found'})
+            return
+        
+        headers = {}
+        if next_query:
+            host, port = self.server.server_address
+            headers['Link'] = f'<http://{host}:{port}{url.path}?{next_query}>; rel="next"'
+        self.respond(200, data, headers)
+    
+    def respond(self, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def test_gh_cli_check_memoized():
+    """Test that the gh CLI is checked once until the check is reset."""
+    print("\n" + "="*60)
+    print("TEST: gh CLI check memoized")
+    print("="*60)
+    
+    saved_run = workflow_data_utils.subprocess.run
+    fake = FakeGh()
+    workflow_data_utils.subprocess.run = fake
+    reset_gh_cli_check()
+    try:
+        # Test 1: Three API calls run the two check commands once
+        for _ in range(3):
+            assert _run_gh_api('/repos/o/r/actions/runs') == {'total_count': 0, 'workflow_runs': []}
+        checks = [cmd for cmd in fake.commands if cmd[:2] != ['gh', 'api']]
+        assert checks == [['gh', '--version'], ['gh', 'auth', 'status']], f"Unexpected: {checks}"
+        print("  ✓ gh CLI checked once for 3 API calls")
+        
+        # Test 2: A failed check is kept too, and reset checks again
+        fake.authenticated = False
+        reset_gh_cli_check()
+        assert _check_gh_cli() is False and _check_gh_cli() is False
+        assert len(fake.commands) == 7, f"Unexpected commands: {fake.commands}"
+        fake.authenticated = True
+        reset_gh_cli_check()
+        assert _check_gh_cli() is True
+        print("  ✓ Reset checks gh CLI again")
+        
+        # Test 3: A session keeps its result and counts requests
+        session = GitHubSession()
+        list_workflow_runs('o', 'r', limit=5, session=session)
+        list_workflow_jobs('o', 'r', 1, session=session)
+        assert session.verified is True and session.request_count == 2
+        session.reset()
+        assert session.verified is None
+        print("  ✓ Session checks once and counts requests")
+    finally:
+        workflow_data_utils.subprocess.run = saved_run
+        reset_gh_cli_check()
+    
+    print("  ✓ All gh CLI check tests passed")
+
+
+def test_pagination():
+    """Test that list functions follow Link headers only as far as needed."""
+    print("\n" + "="*60)
+    print("TEST: Pagination")
+    print("="*60)
+    
+    now = datetime.now(timezone.utc)
+    runs = [{
+        'id': index,
+        'name': 'PR Validation' if index % 2 else 'Other',
+        'path': '.github/workflows/pr-validation.yml' if index % 2 else '.github/workflows/other.yml',
+        'created_at': (now - timedelta(hours=index + 0.5)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    } for index in range(250)]
+    jobs = [{'id': index, 'name': f'job {index}'} for index in range(230)]
+    
+    saved_run = workflow_data_utils.subprocess.run
+    reset_gh_cli_check()
+    
+    def fetch(function, *args, **kwargs):
+        fake = FakeGh(runs=runs, jobs=jobs)
+        workflow_data_utils.subprocess.run = fake
+        return function(*args, **kwargs), len(fake.api_calls())
+    
+    try:
+        # Test 1: A limit over 100 reads just enough pages
+        result, calls = fetch(list_workflow_runs, 'o', 'r', limit=150)
+        assert [run['id'] for run in result] == list(range(150)) and calls == 2, f"{calls} calls"
+        print("  ✓ --limit 150 read 2 pages")
+        
+        # Test 2: Unlimited reads every page
+        result, calls = fetch(list_workflow_runs, 'o', 'r', limit=0)
+        assert len(result) == 250 and calls == 3, f"{len(result)} runs, {calls} calls"
+        print("  ✓ --limit 0 read all 3 pages")
+        
+        # Test 3: A small limit asks for a small page
+        fake = FakeGh(runs=runs)
+        workflow_data_utils.subprocess.run = fake
+        assert len(list_workflow_runs('o', 'r')) == 10
+        assert 'per_page=10' in fake.api_calls()[0][-1]
+        print("  ✓ Default limit read one page of 10")
+        
+        # Test 4: Pages past the date cutoff aren't read
+        result, calls = fetch(list_workflow_runs, 'o', 'r', days_back=5)
+        assert len(result) == 120 and calls == 2, f"{len(result)} runs, {calls} calls"
+        print("  ✓ --days 5 stopped at the cutoff")
+        
+        # Test 5: Runs filtered by workflow keep reading pages until the limit
+        result, calls = fetch(list_workflow_runs, 'o', 'r', workflow_name='pr-validation.yml', limit=60)
+        assert len(result) == 60 and all(run['id'] % 2 for run in result) and calls == 2
+        print("  ✓ Workflow filter read pages until the limit")
+        
+        # Test 6: Jobs past the first 100 are included
+        result, calls = fetch(list_workflow_jobs, 'o', 'r', 1)
+        assert [job['id'] for job in result] == list(range(230)) and calls == 3
+        print("  ✓ All 230 jobs read from 3 pages")
+    finally:
+        workflow_data_utils.subprocess.run = saved_run
+        reset_gh_cli_check()
+    
+    print("  ✓ All pagination tests passed")
+
+
+def test_concurrent_run_timing():
+    """Test fetching run timing concurrently."""
+    print("\n" + "="*60)
+    print("TEST: list_workflow_run_timing() concurrency")
+    print("="*60)
+    
+    runs = [{
+        'id': index + 1,
+        'name': 'PR Validation',
+        'run_number': index + 1,
+        'created_at': '2024-12-12T10:00:00Z',
+        'run_started_at': '2024-12-12T10:00:00Z',
+        'updated_at': f'2024-12-12T10:0{index % 10}:00Z',
+        'status': 'completed',
+        'conclusion': 'success',
+        'actor': {'login': 'octocat'},
+    } for index in range(12)]
+    jobs = [{'name': 'Lint', 'started_at': '2024-12-12T10:00:00Z', 'completed_at': '2024-12-12T10:00:30Z'}]
+    
+    saved_run = workflow_data_utils.subprocess.run
+    reset_gh_cli_check()
+    try:
+        # Test 1: Runs are fetched at once and come back in order
+        fake = FakeGh(runs=runs, jobs=jobs, delay=0.02)
+        workflow_data_utils.subprocess.run = fake
+        timings = list_workflow_run_timing('o', 'r', limit=12, concurrency=4)
+        assert [timing['run_id'] for timing in timings] == list(range(1, 13))
+        assert timings[3]['run_duration_seconds'] == 180.0
+        assert timings[0]['total_job_time_seconds'] == 30.0
+        assert 1 < fake.max_in_flight <= 4, f"{fake.max_in_flight} requests at once"
+        print(f"  ✓ 12 runs in order, {fake.max_in_flight} requests at once")
+        
+        # Test 2: Concurrency 1 sends one request at a time
+        fake = FakeGh(runs=runs, jobs=jobs, delay=0.005)
+        workflow_data_utils.subprocess.run = fake
+        assert len(list_workflow_run_timing('o', 'r', limit=12, concurrency=1)) == 12
+        assert fake.max_in_flight == 1
+        print("  ✓ Concurrency 1 is sequential")
+        
+        # Test 3: Requests refused by a secondary rate limit are retried
+        fake = FakeGh(runs=runs, jobs=jobs, rate_limited=2)
+        workflow_data_utils.subprocess.run = fake
+        timings = list_workflow_run_timing('o', 'r', limit=3)
+        assert [timing['run_id'] for timing in timings] == [1, 2, 3]
+        assert len(fake.api_calls()) == 1 + 3 + 2, f"{len(fake.api_calls())} calls"
+        print("  ✓ Rate-limited requests retried")
+        
+        # Test 4: Details are fetched only for runs missing timing fields
+        partial = [dict(run) for run in runs[:4]]
+        del partial[2]['run_started_at']
+        fake = FakeGh(runs=partial, jobs=jobs)
+        workflow_data_utils.subprocess.run = fake
+        timings = list_workflow_run_timing('o', 'r', limit=4)
+        detail_calls = [cmd for cmd in fake.api_calls() if cmd[-1].split('?')[0].endswith('/runs/3')]
+        assert len(fake.api_calls()) == 1 + 4 + 1 and len(detail_calls) == 1
+        assert [timing['run_id'] for timing in timings] == [1, 2, 3, 4]
+        print("  ✓ Run details fetched only when timing fields are missing")
+    finally:
+        workflow_data_utils.subprocess.run = saved_run
+        reset_gh_cli_check()
+    
+    print("  ✓ All concurrency tests passed")
+
+
+def test_select_transport():
+    """Test choosing between the HTTPS and gh transports."""
+    print("\n" + "="*60)
+    print("TEST: select_transport()")
+    print("="*60)
+    
+    names = ['GH_TOKEN', 'GITHUB_TOKEN', 'GH_ENTERPRISE_TOKEN', 'GITHUB_ENTERPRISE_TOKEN',
+             'GH_HOST', 'GITHUB_API_URL', 'WORKFLOW_DATA_TRANSPORT']
+    saved = {name: os.environ.pop(name, None) for name in names}
+    try:
+        # Test 1: Without a token, gh is used
+        assert isinstance(select_transport(), GhCliTransport)
+        print("  ✓ gh used without a token")
+        
+        # Test 2: A token selects HTTPS, with the API URL from the environment
+        os.environ['GITHUB_TOKEN'] = 'secret'
+        os.environ['GITHUB_API_URL'] = 'https://ghe.example.com/api/v3/'
+        transport = select_transport()
+        assert isinstance(transport, HttpTransport) and transport.token == 'secret'
+        assert transport.base_url == 'https://ghe.example.com/api/v3'
+        print("  ✓ HTTPS used with a token")
+        
+        # Test 3: The transport can be forced either way
+        os.environ['WORKFLOW_DATA_TRANSPORT'] = 'gh'
+        assert isinstance(select_transport(), GhCliTransport)
+        del os.environ['GITHUB_TOKEN']
+        assert isinstance(select_transport('https'), HttpTransport)
+        assert select_transport('https').available() is False
+        print("  ✓ Transport forced by name")
+        
+        # Test 4: An Enterprise Server GH_HOST needs its own token, and sets the API URL
+        del os.environ['WORKFLOW_DATA_TRANSPORT']
+        del os.environ['GITHUB_API_URL']
+        os.environ['GH_HOST'] = 'github.example.com'
+        os.environ['GH_TOKEN'] = 'dotcom-secret'
+        assert isinstance(select_transport(), GhCliTransport)
+        os.environ['GH_ENTERPRISE_TOKEN'] = 'ghes-secret'
+        transport = select_transport()
+        assert isinstance(transport, HttpTransport) and transport.token == 'ghes-secret'
+        assert transport.base_url == 'https://github.example.com/api/v3'
+        os.environ['GH_HOST'] = 'octo.ghe.com'
+        transport = select_transport()
+        assert transport.token == 'dotcom-secret' and transport.base_url == 'https://api.octo.ghe.com'
+        os.environ['GH_HOST'] = 'github.com'
+        assert select_transport().base_url == 'https://api.github.com'
+        print("  ✓ GH_HOST picks the API URL and token")
+    finally:
+        for name, value in saved.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+    
+    print("  ✓ All select_transport tests passed")
+
+
+def test_https_transport():
+    """Test the HTTPS transport against a local stand-in server."""
+    print("\n" + "="*60)
+    print("TEST: HttpTransport")
+    print("="*60)
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInApi)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    server.rate_limited = 0
+    server.runs = [{
+        'id': index + 1,
+        'name': 'PR Validation',
+        'run_number': index + 1,
+        'created_at': '2024-12-12T10:00:00Z',
+        'run_started_at': '2024-12-12T10:00:00Z',
+        'updated_at': '2024-12-12T10:01:00Z',
+        'status': 'completed',
+        'conclusion': 'success',
+        'actor': {'login': 'octocat'},
+    } for index in range(250)]
+    server.jobs = [{'name': 'Lint', 'started_at': '2024-12-12T10:00:00Z', 'completed_at': '2024-12-12T10:00:30Z'}]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    host, port = server.server_address
+    transport = HttpTransport('secret', base_url=f'http://{host}:{port}/api/')
+    session = GitHubSession(transport)
+    try:
+        # Test 1: Pages are read over one kept-alive connection
+        runs = list_workflow_runs('o', 'r', limit=0, session=session)
+        assert len(runs) == 250 and len(server.requests) == 3, f"{len(server.requests)} requests"
+        assert server.connections == 1 and transport.connections_opened == 1
+        assert all(auth == 'Bearer secret' for _, auth in server.requests)
+        assert server.requests[0][0] == '/api/repos/o/r/actions/runs'
+        print("  ✓ 3 pages over 1 connection, with the token")
+        
+        # Test 2: Concurrent requests share a small pool of connections
+        timings = list_workflow_run_timing('o', 'r', limit=20, session=session, concurrency=4)
+        assert [timing['run_id'] for timing in timings] == list(range(1, 21))
+        assert timings[0]['run_duration_seconds'] == 60.0
+        assert transport.connections_opened <= 4 and server.connections == transport.connections_opened
+        print(f"  ✓ 21 requests over {transport.connections_opened} connection(s)")
+        
+        # Test 3: Secondary rate limits are retried, and errors return None
+        server.rate_limited = 1
+        assert list_workflow_jobs('o', 'r', 1, session=session) == server.jobs
+        assert get_workflow_job_details('o', 'r', 99999999, session=session) is None
+        print("  ✓ Rate limit retried and 404 returned None")
+        
+        # Test 4: The token isn't sent to other hosts
+        succeeded, _, _, error = transport.send('https://example.com/api/repos/o/r/actions/runs')
+        assert not succeeded and 'Not sending the token' in error
+        print("  ✓ Link to another host refused")
+        
+        # Test 5: Connections closed by the server are replaced
+        session.close()
+        server_connections = server.connections
+        assert get_workflow_run_details('o', 'r', 1, session=session)['id'] == 1
+        assert server.connections == server_connections + 1
+        print("  ✓ New connection after the pool was closed")
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+    
+    print("  ✓ All HttpTransport tests passed")
+
+
 def test_list_workflow_runs_params():
     """Test list_workflow_runs parameter handling."""
     print("\n" + "="*60)
@@ -329,6 +779,11 @@ def run_all_tests():
     
     tests = [
         test_check_gh_cli,
+        test_gh_cli_check_memoized,
+        test_pagination,
+        test_concurrent_run_timing,
+        test_select_transport,
+        test_https_transport,
         test_list_workflow_runs_params,
         test_list_workflow_runs_limit_defaults,
         test_get_workflow_run_details_invalid,
@@ -343,18 +798,22 @@ def run_all_tests():
     passed = 0
     failed = 0
     
-    for test_func in tests:
-        try:
-            test_func()
-            passed += 1
-        except AssertionError as e:
-            failed += 1
-            print(f"\n  ✗ FAILED: {test_func.__name__}")
-            print(f"    {str(e)}")
-        except Exception as e:
-            failed += 1
-            print(f"\n  ✗ ERROR: {test_func.__name__}")
-            print(f"    {str(e)}")
+    setup_module()
+    try:
+        for test_func in tests:
+            try:
+                test_func()
+                passed += 1
+            except AssertionError as e:
+                failed += 1
+                print(f"\n  ✗ FAILED: {test_func.__name__}")
+                print(f"    {str(e)}")
+            except Exception as e:
+                failed += 1
+                print(f"\n  ✗ ERROR: {test_func.__name__}")
+                print(f"    {str(e)}")
+    finally:
+        teardown_module()
     
     print("\n" + "="*70)
     print(f" TEST SUMMARY: {passed} passed, {failed} failed")
@@ -65,8 +65,14 @@ Examples:
     workflow-data.py list-run-timing <owner> <repo> --limit 25 \
         --format csv --schema schema_run_timing.yaml
     
+    # Fetch timing for 8 runs at a time
+    workflow-data.py list-run-timing <owner> <repo> --days 7 --concurrency 8
+    
     # Get timing for a single run
     workflow-data.py get-run-timing <owner> <repo> <run-id>
+    
+    # Call GitHub Enterprise Server over HTTPS (token from GH_ENTERPRISE_TOKEN)
+    GH_HOST=github.example.com workflow-data.py list-runs <owner> <repo> --transport https
 """
 
 import sys
@@ -87,11 +93,25 @@ from workflow_data_utils import (
     list_workflow_jobs,
     get_workflow_job_details,
     list_workflow_run_timing,
-    get_workflow_run_timing
+    get_workflow_run_timing,
+    get_default_session,
+    select_transport,
+    DEFAULT_CONCURRENCY
 )
 from csv_formatter import load_schema, format_as_csv, save_csv
 
 
+def positive_int(value):
+    """Parse an argument that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_fields(fields_str):
     """Parse comma-separated field list, handling whitespace."""
     if not fields_str:
@@ -227,7 +247,8 @@ def cmd_list_run_timing(args):
         days_back=args.days if hasattr(args, 'days') else None,
         branch=args.branch if hasattr(args, 'branch') else None,
         status=args.status if hasattr(args, 'status') else None,
-        limit=args.limit if hasattr(args, 'limit') else None
+        limit=args.limit if hasattr(args, 'limit') else None,
+        concurrency=args.concurrency
     )
     
     if timing_data is None:
@@ -276,6 +297,13 @@ def main():
                              help='Output file path (default: stdout)')
         subparser.add_argument('--append', action='store_true',
                              help='Append to output file instead of overwriting (CSV only)')
+        subparser.add_argument('--transport', choices=['auto', 'https', 'gh'],
+                             help='How to call the API: https needs a token for GH_HOST '
+                                  '(GH_TOKEN or GITHUB_TOKEN for github.com), auto uses it when '
+                                  'one is set (default: auto)')
+        subparser.add_argument('--api-url',
+                             help='API root for the https transport (default: GITHUB_API_URL '
+                                  'or the API of GH_HOST, https://api.github.com)')
     
     # list-runs command
     parser_list = subparsers.add_parser('list-runs',
@@ -329,6 +357,8 @@ def main():
                                    help='Filter to specific branch')
     parser_list_timing.add_argument('--status',
                                    help='Filter by status (completed, success, failure)')
+    parser_list_timing.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                                   help=f'Number of runs to fetch at once (default: {DEFAULT_CONCURRENCY})')
     parser_list_timing.set_defaults(func=cmd_list_run_timing)
     
     # get-run-timing command
@@ -339,7 +369,12 @@ def main():
     parser_get_timing.set_defaults(func=cmd_get_run_timing)
     
     args = parser.parse_args()
-    args.func(args)
+    session = get_default_session()
+    session.set_transport(select_transport(args.transport, args.api_url))
+    try:
+        args.func(args)
+    finally:
+        session.close()
 
 
 if __name__ == '__main__':
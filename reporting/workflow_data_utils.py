@@ -8,24 +8,119 @@ This module provides functions for:
 - Querying workflow execution history
 - Supporting workflow performance analysis
 
-All functions use the GitHub CLI (gh) via bash commands.
+Requests are sent by one of two transports:
+- HttpTransport talks to the REST API over pooled keep-alive connections,
+  with a token from the environment
+- GhCliTransport runs the GitHub CLI (gh api) for each request
+
+select_transport() uses the HTTPS API when a token for gh's host is set
+and falls back to gh otherwise; WORKFLOW_DATA_TRANSPORT (auto, https, gh)
+overrides it. Like gh, the host is GH_HOST (default github.com), and
+GitHub Enterprise Server hosts use GH_ENTERPRISE_TOKEN or
+GITHUB_ENTERPRISE_TOKEN instead of GH_TOKEN or GITHUB_TOKEN.
+GITHUB_API_URL sets the API root directly. A GitHubSession holds the checked
+transport for a series of calls. The gh CLI is checked once per process,
+and reset_gh_cli_check() forgets the result.
 """
 
+import http.client
 import json
+import os
+import queue
+import re
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, List, Any
-from urllib.parse import urlencode
+from typing import Optional, Dict, List, Any, Iterator, Tuple
+from urllib.parse import urlencode, urlsplit
+
+
+# Largest page size the GitHub REST API allows
+MAX_PER_PAGE = 100
+
+# API root used by the HTTPS transport unless GITHUB_API_URL or GH_HOST is set
+DEFAULT_API_URL = 'https://api.github.com'
+
+# Host gh uses unless GH_HOST is set
+DEFAULT_HOST = 'github.com'
+
+# Token variables gh reads, in order, for github.com and GitHub Enterprise Cloud (*.ghe.com)
+TOKEN_VARIABLES = ('GH_TOKEN', 'GITHUB_TOKEN')
+
+# Token variables gh reads, in order, for GitHub Enterprise Server hosts
+ENTERPRISE_TOKEN_VARIABLES = ('GH_ENTERPRISE_TOKEN', 'GITHUB_ENTERPRISE_TOKEN')
+
+# REST API version requested by the HTTPS transport
+API_VERSION = '2022-11-28'
+
+# Seconds to wait for one API response
+REQUEST_TIMEOUT = 30
+
+# Idle keep-alive connections the HTTPS transport keeps open
+MAX_POOL_SIZE = 10
+
+# Runs whose details and jobs list_workflow_run_timing() fetches at once
+DEFAULT_CONCURRENCY = 4
+
+# Run fields a timing record is built from; list_workflow_runs() returns them all
+RUN_TIMING_FIELDS = (
+    'id', 'name', 'run_number', 'created_at', 'updated_at',
+    'run_started_at', 'status', 'conclusion', 'actor',
+)
+
+# Times a request refused by a secondary rate limit is sent again
+RATE_LIMIT_RETRIES = 3
+
+# Seconds to wait after a secondary rate limit without a Retry-After header
+DEFAULT_RETRY_AFTER = 60.0
+
+# Blank line between the headers and body of gh api --include output
+_HEADER_END_PATTERN = re.compile(r'\r?\n\r?\n')
+
+# Next page's URL in a Link header
+_NEXT_LINK_PATTERN = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+# Result of the gh CLI check, or None until it has run
+_gh_cli_status: Optional[bool] = None
+_gh_cli_lock = threading.Lock()
 
 
 def _check_gh_cli() -> bool:
     """
     Verify gh CLI is available and authenticated.
     
+    The check runs two gh commands, so its result is kept for the rest
+    of the process. Call reset_gh_cli_check() to check again, for example
+    after running 'gh auth login'.
+    
     Returns:
         True if gh CLI is available and authenticated, False otherwise
     """
+    global _gh_cli_status
+    with _gh_cli_lock:
+        if _gh_cli_status is None:
+            _gh_cli_status = _run_gh_cli_check()
+        return _gh_cli_status
+
+
+def reset_gh_cli_check() -> None:
+    """
+    Forget the result of the gh CLI check, so the next API call checks again.
+    
+    The default session checks again too; other sessions keep their
+    result until their reset() is called.
+    """
+    global _gh_cli_status
+    with _gh_cli_lock:
+        _gh_cli_status = None
+    _default_session.verified = None
+
+
+def _run_gh_cli_check() -> bool:
+    """Run gh --version and gh auth status, and print why gh can't be used."""
     try:
         result = subprocess.run(
             ['gh', '--version'],
@@ -60,13 +155,347 @@ def _check_gh_cli() -> bool:
         return False
 
 
-def _run_gh_api(endpoint: str, params: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+# (succeeded, headers with lowercase names and the status under ':status', body, error message)
+TransportResponse = Tuple[bool, Dict[str, str], str, str]
+
+
+class GhCliTransport:
+    """
+    Sends API requests with gh api, one subprocess per request.
+    
+    Works wherever gh is installed and authenticated, but each request
+    starts a process and opens its own TLS connection.
+    """
+    
+    name = 'gh api'
+    
+    def available(self) -> bool:
+        """Return True if gh is installed and authenticated (checked once per process)."""
+        return _check_gh_cli()
+    
+    def send(self, url: str) -> TransportResponse:
+        """
+        Send a GET request.
+        
+        Args:
+            url: Endpoint with query string, or a full URL like a Link header's
+            
+        Returns:
+            TransportResponse tuple
+        """
+        cmd = ['gh', 'api', '--include', url]
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=REQUEST_TIMEOUT
+        )
+        headers, body = _split_headers(result.stdout)
+        if result.returncode == 0:
+            return True, headers, body, ''
+        return False, headers, body, f"gh api failed: {result.stderr}\n-- Command used: {' '.join(cmd)}"
+    
+    def close(self) -> None:
+        """Nothing to close; each request is its own process."""
+
+
+class HttpTransport:
+    """
+    Sends API requests over pooled keep-alive HTTP connections.
+    
+    Connections are reused across requests and threads, so a bulk command
+    pays for TCP and TLS setup once per connection instead of once per
+    request. Full URLs, like those in Link headers, are only followed
+    if they're under base_url, so the token isn't sent to other hosts.
+    
+    Attributes:
+        base_url: API root, like https://api.github.com or a local
+                  stand-in server such as http://127.0.0.1:8080
+        connections_opened: Number of connections opened so far
+        
+    Example:
+        >>> session = GitHubSession(HttpTransport(os.environ['GH_TOKEN']))
+        >>> runs = list_workflow_runs('<owner>', '<repo>', limit=50, session=session)
+        >>> session.transport.connections_opened
+        1
+    """
+    
+    name = 'HTTPS API'
+    
+    def __init__(
+        self,
+        token: Optional[str],
+        base_url: str = DEFAULT_API_URL,
+        pool_size: int = MAX_POOL_SIZE,
+        timeout: float = REQUEST_TIMEOUT
+    ):
+        self.token = token
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.connections_opened = 0
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._base_path = parts.path
+        self._idle: 'queue.LifoQueue[http.client.HTTPConnection]' = queue.LifoQueue(maxsize=pool_size)
+        self._lock = threading.Lock()
+        self._headers = {
+            'Accept': 'application/vnd.github+json',
+            'Authorization': f'Bearer {token}',
+            'User-Agent': 'workflow-data-utils',
+            'X-GitHub-Api-Version': API_VERSION,
+        }
+    
+    def available(self) -> bool:
+        """Return True if a token and a usable base URL are set."""
+        if not self.token:
+            print("Error: No GitHub token for the HTTPS API. Set GH_TOKEN or GITHUB_TOKEN, "
+                  "or GH_ENTERPRISE_TOKEN for a GitHub Enterprise Server GH_HOST", file=sys.stderr)
+            return False
+        if self._scheme not in ('http', 'https') or not self._netloc:
+            print(f"Error: Invalid GitHub API URL: {self.base_url}", file=sys.stderr)
+            return False
+        return True
+    
+    def _request_path(self, url: str) -> Optional[str]:
+        """Path and query to request for an endpoint or full URL, or None if it's on another host."""
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc:
+            if (parts.scheme, parts.netloc) != (self._scheme, self._netloc) or \
+                    not parts.path.startswith(self._base_path):
+                return None
+            path = parts.path
+        else:
+            path = self._base_path + parts.path
+        return f"{path}?{parts.query}" if parts.query else path
+    
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection to the API host."""
+        with self._lock:
+            self.connections_opened += 1
+        if self._scheme == 'https':
+            return http.client.HTTPSConnection(self._netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self._netloc, timeout=self.timeout)
+    
+    def send(self, url: str) -> TransportResponse:
+        """
+        Send a GET request on a pooled connection.
+        
+        A reused connection that the server has closed is replaced once.
+        
+        Args:
+            url: Endpoint with query string, or a full URL like a Link header's
+            
+        Returns:
+            TransportResponse tuple
+        """
+        path = self._request_path(url)
+        if path is None:
+            return False, {}, '', f"Not sending the token to {url}, which isn't under {self.base_url}"
+        
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._connect()
+                reused = False
+            
+            try:
+                connection.request('GET', path, headers=self._headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused:
+                    # The server closed an idle keep-alive connection
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            break
+        
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        headers[':status'] = str(response.status)
+        body = data.decode('utf-8', errors='replace')
+        if 200 <= response.status < 300:
+            return True, headers, body, ''
+        return False, headers, body, f"HTTP {response.status} for {path}: {_error_message(body) or response.reason}"
+    
+    def close(self) -> None:
+        """Close the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _error_message(body: str) -> Optional[str]:
+    """The message of a GitHub API error response, if it has one."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    return data.get('message') if isinstance(data, dict) else None
+
+
+def _host_api_settings() -> Tuple[str, Optional[str]]:
+    """
+    API root and token for gh's host, the way gh picks them.
+    
+    Returns:
+        Tuple of (API root for GH_HOST, token from the environment or None)
+    """
+    host = (os.environ.get('GH_HOST') or DEFAULT_HOST).strip().lower()
+    if host == DEFAULT_HOST:
+        api_url, variables = DEFAULT_API_URL, TOKEN_VARIABLES
+    elif host.endswith('.ghe.com'):
+        api_url, variables = f"https://api.{host}", TOKEN_VARIABLES
+    else:
+        api_url, variables = f"https://{host}/api/v3", ENTERPRISE_TOKEN_VARIABLES
+    token = next((os.environ[name] for name in variables if os.environ.get(name)), None)
+    return api_url, token
+
+
+def select_transport(name: Optional[str] = None, base_url: Optional[str] = None) -> Any:
     """
-    Execute a gh api command and return parsed JSON response.
+    Choose how API requests are sent.
+    
+    The HTTPS transport calls the same host as gh with the token gh would
+    use for it: GH_HOST (default github.com) with GH_TOKEN or GITHUB_TOKEN,
+    or GH_ENTERPRISE_TOKEN or GITHUB_ENTERPRISE_TOKEN for a GitHub
+    Enterprise Server host.
+    
+    Args:
+        name: 'https', 'gh', or 'auto'; None reads WORKFLOW_DATA_TRANSPORT
+              (default: auto)
+        base_url: API root for the HTTPS transport; None reads
+                  GITHUB_API_URL (default: the API of GH_HOST)
+        
+    Returns:
+        HttpTransport for 'https', or for 'auto' when a token for the host
+        is set; otherwise GhCliTransport
+        
+    Example:
+        >>> os.environ['GH_HOST'] = 'github.example.com'
+        >>> os.environ['GH_ENTERPRISE_TOKEN'] = 'secret'
+        >>> select_transport().base_url
+        'https://github.example.com/api/v3'
+    """
+    name = name or os.environ.get('WORKFLOW_DATA_TRANSPORT') or 'auto'
+    api_url, token = _host_api_settings()
+    if name == 'https' or (name == 'auto' and token):
+        return HttpTransport(token, base_url or os.environ.get('GITHUB_API_URL') or api_url)
+    return GhCliTransport()
+
+
+class GitHubSession:
+    """
+    Verified API client for a series of API calls.
+    
+    The transport is checked on the session's first call, and the result
+    is kept, so bulk commands pay for the check once. Functions that take
+    a session use a shared default session when none is given.
+    
+    Attributes:
+        transport: HttpTransport or GhCliTransport; chosen by
+                   select_transport() on the first call if None
+        verified: Result of the transport check, or None until the first call
+        request_count: Number of API requests sent
+        
+    Example:
+        >>> session = GitHubSession()
+        >>> runs = list_workflow_runs('<owner>', '<repo>', session=session)
+        >>> jobs = list_workflow_jobs('<owner>', '<repo>', runs[0]['id'], session=session)
+        >>> session.request_count
+        2
+    """
+    
+    def __init__(self, transport: Any = None):
+        self.transport = transport
+        self.verified: Optional[bool] = None
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+    
+    def check(self) -> bool:
+        """Check the transport once for this session; return True if it can be used."""
+        if self.verified is None:
+            if self.transport is None:
+                self.transport = select_transport()
+            self.verified = self.transport.available()
+        return self.verified
+    
+    def reset(self) -> None:
+        """Check the transport again on the next call."""
+        reset_gh_cli_check()
+        self.verified = None
+    
+    def set_transport(self, transport: Any) -> None:
+        """Send later requests with another transport, closing the current one."""
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = transport
+        self.verified = None
+    
+    def close(self) -> None:
+        """Close the transport's connections."""
+        if self.transport is not None:
+            self.transport.close()
+    
+    def count_request(self) -> None:
+        """Count one API request."""
+        with self._lock:
+            self.request_count += 1
+    
+    def pause(self, seconds: float) -> None:
+        """Hold every request of this session for a number of seconds."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+    
+    def wait_for_rate_limit(self) -> None:
+        """Wait until a pause set by pause() is over."""
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+
+_default_session = GitHubSession()
+
+
+def get_default_session() -> GitHubSession:
+    """Return the session used by calls that don't pass one."""
+    return _default_session
+
+
+def _run_gh_api(
+    endpoint: str,
+    params: Optional[Dict[str, str]] = None,
+    session: Optional[GitHubSession] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Send a GitHub API request and return parsed JSON response.
+    
+    The request goes through the session's transport: the HTTPS API when
+    a token is set, otherwise a gh api command.
     
     Args:
         endpoint: GitHub API endpoint (e.g., '/repos/owner/repo/actions/runs')
         params: Optional query parameters as key-value pairs
+        session: Session to send the request with, or None for the default
         
     Returns:
         Parsed JSON response as dict, or None on error
@@ -74,43 +503,169 @@ def _run_gh_api(endpoint: str, params: Optional[Dict[str, str]] = None) -> Optio
     Note:
         Errors are logged but not raised. Caller should check for None.
     """
-    if not _check_gh_cli():
+    response = _api_request(_build_url(endpoint, params), session)
+    if response is None:
         return None
-    
-    # Build URL with query parameters
-    url = endpoint
+    return response[0]
+
+
+def _build_url(endpoint: str, params: Optional[Dict[str, str]] = None) -> str:
+    """Add URL-encoded query parameters to an endpoint."""
     if params:
-        query_string = urlencode(params)
-        url = f"{endpoint}?{query_string}"
+        return f"{endpoint}?{urlencode(params)}"
+    return endpoint
+
+
+def _api_request(
+    url: str,
+    session: Optional[GitHubSession] = None
+) -> Optional[Tuple[Any, Dict[str, str]]]:
+    """
+    Send a GET request for an endpoint or full URL with a session's transport.
     
-    cmd = ['gh', 'api', url]
+    When GitHub answers with a secondary rate limit, the whole session
+    waits for the time GitHub asks for, then the request is sent again,
+    up to RATE_LIMIT_RETRIES times.
     
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    Args:
+        url: Endpoint with query string, or a full URL like a Link header's
+        session: Session to send the request with, or None for the default
         
-        if result.returncode != 0:
-            print(f"Error: gh api failed: {result.stderr}", file=sys.stderr)
-            print(f"-- Command used: {' '.join(cmd)}", file=sys.stderr)
-            return None
+    Returns:
+        Tuple of (parsed JSON, headers with lowercase names), or None on error
+    """
+    session = session or _default_session
+    if not session.check():
+        return None
+    transport = session.transport
+    
+    try:
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            session.wait_for_rate_limit()
+            session.count_request()
+            succeeded, headers, body, error = transport.send(url)
+            if succeeded:
+                return json.loads(body), headers
+            
+            delay = _rate_limit_delay(headers, error)
+            if delay is None or attempt == RATE_LIMIT_RETRIES:
+                break
+            print(f"Warning: GitHub secondary rate limit reached; retrying in {delay:.0f} seconds",
+                  file=sys.stderr)
+            session.pause(delay)
         
-        return json.loads(result.stdout)
+        print(f"Error: {error}", file=sys.stderr)
+        return None
         
-    except subprocess.TimeoutExpired:
-        print(f"Error: gh api request timed out for {endpoint}", file=sys.stderr)
+    except (subprocess.TimeoutExpired, TimeoutError):
+        print(f"Error: {transport.name} request timed out for {url}", file=sys.stderr)
         return None
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON response: {e}", file=sys.stderr)
         return None
     except Exception as e:
-        print(f"Error running gh api: {e}", file=sys.stderr)
+        print(f"Error running {transport.name}: {e}", file=sys.stderr)
         return None
 
 
+def _rate_limit_delay(headers: Dict[str, str], error: str) -> Optional[float]:
+    """
+    Seconds to wait before retrying a request refused by a secondary rate limit.
+    
+    Args:
+        headers: Response headers with lowercase names
+        error: Error message from the transport
+        
+    Returns:
+        The Retry-After header's value, DEFAULT_RETRY_AFTER if the error is
+        a secondary rate limit without one, or None for other errors
+    """
+    status = headers.get(':status', '')
+    if 'retry-after' in headers and status in ('403', '429'):
+        try:
+            return max(0.0, float(headers['retry-after']))
+        except ValueError:
+            return DEFAULT_RETRY_AFTER
+    if status == '429' or 'secondary rate limit' in error.lower():
+        return DEFAULT_RETRY_AFTER
+    return None
+
+
+def _split_headers(output: str) -> Tuple[Dict[str, str], str]:
+    """
+    Split gh api --include output into headers and body.
+    
+    Args:
+        output: Status line, header lines, a blank line, then the body
+        
+    Returns:
+        Tuple of (headers with lowercase names, body); the status code is
+        under ':status'
+    """
+    match = _HEADER_END_PATTERN.search(output)
+    if match is None or not output.startswith('HTTP/'):
+        return {}, output
+    
+    lines = output[:match.start()].splitlines()
+    status = lines[0].split()
+    headers = {':status': status[1] if len(status) > 1 else ''}
+    for line in lines[1:]:
+        name, separator, value = line.partition(':')
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+    return headers, output[match.end():]
+
+
+def _next_page_url(headers: Dict[str, str]) -> Optional[str]:
+    """
+    Find the next page's URL in a Link header.
+    
+    Example:
+        >>> _next_page_url({'link': '<https://api.github.com/x?page=2>; rel="next"'})
+        'https://api.github.com/x?page=2'
+    """
+    match = _NEXT_LINK_PATTERN.search(headers.get('link', ''))
+    return match.group(1) if match else None
+
+
+def _paginate(
+    endpoint: str,
+    params: Dict[str, str],
+    items_key: str,
+    session: Optional[GitHubSession] = None
+) -> Iterator[Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch the pages of a list endpoint as they're needed.
+    
+    Each page is requested only when the caller asks for it, by following
+    the previous page's Link header, so a caller that stops iterating
+    doesn't fetch the remaining pages.
+    
+    Args:
+        endpoint: GitHub API endpoint (e.g., '/repos/owner/repo/actions/runs')
+        params: Query parameters of the first page, including per_page
+        items_key: Key of the item list in each page (e.g., 'workflow_runs')
+        session: Session to send the requests with, or None for the default
+        
+    Yields:
+        Each page's items, or None once if a request fails
+        
+    Example:
+        >>> for page in _paginate('/repos/o/r/actions/runs', {'per_page': '100'}, 'workflow_runs'):
+        ...     if page is None:
+        ...         break
+    """
+    url: Optional[str] = _build_url(endpoint, params)
+    while url:
+        response = _api_request(url, session)
+        if response is None:
+            yield None
+            return
+        data, headers = response
+        yield data.get(items_key, [])
+        url = _next_page_url(headers)
+
+
 def _filter_fields(data: Any, fields: Optional[List[str]]) -> Any:
     """
     Filter data to include only specified fields.
@@ -205,7 +760,8 @@ def list_workflow_runs(
     branch: Optional[str] = None,
     status: Optional[str] = None,
     limit: Optional[int] = None,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    session: Optional[GitHubSession] = None
 ) -> Optional[List[Dict[str, Any]]]:
     """
     List workflow runs for a repository.
@@ -225,6 +781,7 @@ def list_workflow_runs(
         fields: Optional list of field names to include in results
                 Supports dot notation (e.g., ['id', 'name', 'actor.login'])
                 If None, returns all fields
+        session: Optional GitHubSession to send requests with
         
     Returns:
         List of workflow run dictionaries, or None on error
@@ -237,6 +794,11 @@ def list_workflow_runs(
         - --days 7 --limit 50: Returns up to 50 runs within last 7 days
         - --limit 0: Returns all runs (no limit)
         
+    Pagination:
+        Pages of up to 100 runs are fetched one at a time by following the
+        Link header, and fetching stops once the limit is met or a page
+        reaches past the days_back cutoff.
+        
     Example:
         >>> # Default: 10 most recent runs
         >>> runs = list_workflow_runs('<owner>', '<repo>')
@@ -273,9 +835,14 @@ def list_workflow_runs(
     # Use general actions/runs endpoint (more reliable than workflow-specific)
     endpoint = f'/repos/{repo_owner}/{repo_name}/actions/runs'
     
-    params = {'per_page': '100'}
+    # Small limits need only one small page, unless runs are filtered by workflow here
+    per_page = MAX_PER_PAGE
+    if limit and not workflow_name:
+        per_page = min(limit, MAX_PER_PAGE)
+    params = {'per_page': str(per_page)}
     
     # Add date filter if specified
+    cutoff_date = None
     if days_back is not None:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
         created_filter = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -287,33 +854,34 @@ def list_workflow_runs(
     if status:
         params['status'] = status
     
-    response = _run_gh_api(endpoint, params)
-    if response is None:
-        return None
-    
-    workflow_runs = response.get('workflow_runs', [])
-    
-    # Filter by date if specified (GitHub's created filter sometimes returns more)
-    if days_back is not None:
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-        filtered_runs = [
-            run for run in workflow_runs
-            if datetime.fromisoformat(run['created_at'].replace('Z', '+00:00')) >= cutoff_date
-        ]
-    else:
-        filtered_runs = workflow_runs
-    
-    # Filter by workflow name if specified
-    if workflow_name:
-        filtered_runs = [
-            run for run in filtered_runs
-            if run.get('path', '').endswith(workflow_name) or 
-               run.get('name', '') == workflow_name
-        ]
-    
-    # Apply limit if specified (0 = unlimited)
-    if limit is not None and limit > 0:
-        filtered_runs = filtered_runs[:limit]
+    # Runs come newest first; stop fetching pages once the limit is met
+    # or a page reaches past the cutoff date
+    filtered_runs = []
+    for page in _paginate(endpoint, params, 'workflow_runs', session):
+        if page is None:
+            return None
+        
+        for run in page:
+            # Filter by date if specified (GitHub's created filter sometimes returns more)
+            if cutoff_date is not None and \
+                    datetime.fromisoformat(run['created_at'].replace('Z', '+00:00')) < cutoff_date:
+                continue
+            
+            # Filter by workflow name if specified
+            if workflow_name and not (run.get('path', '').endswith(workflow_name) or
+                                      run.get('name', '') == workflow_name):
+                continue
+            
+            filtered_runs.append(run)
+        
+        # Apply limit if specified (0 = unlimited)
+        if limit is not None and limit > 0 and len(filtered_runs) >= limit:
+            filtered_runs = filtered_runs[:limit]
+            break
+        
+        if cutoff_date is not None and page and \
+                datetime.fromisoformat(page[-1]['created_at'].replace('Z', '+00:00')) < cutoff_date:
+            break
     
     # Filter fields if specified
     if fields:
@@ -326,7 +894,8 @@ def get_workflow_run_details(
     repo_owner: str,
     repo_name: str,
     run_id: int,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    session: Optional[GitHubSession] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Get detailed information about a specific workflow run.
@@ -338,6 +907,7 @@ def get_workflow_run_details(
         fields: Optional list of field names to include in results
                 Supports dot notation (e.g., ['id', 'name', 'actor.login'])
                 If None, returns all fields
+        session: Optional GitHubSession to send requests with
         
     Returns:
         Workflow run details dict, or None on error
@@ -357,7 +927,7 @@ def get_workflow_run_details(
     """
     endpoint = f'/repos/{repo_owner}/{repo_name}/actions/runs/{run_id}'
     
-    response = _run_gh_api(endpoint)
+    response = _run_gh_api(endpoint, session=session)
     if response is None:
         return None
     
@@ -372,7 +942,8 @@ def list_workflow_jobs(
     repo_owner: str,
     repo_name: str,
     run_id: int,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    session: Optional[GitHubSession] = None
 ) -> Optional[List[Dict[str, Any]]]:
     """
     List all jobs for a specific workflow run.
@@ -384,11 +955,13 @@ def list_workflow_jobs(
         fields: Optional list of field names to include in results
                 Supports dot notation (e.g., ['id', 'name', 'runner.name'])
                 If None, returns all fields
+        session: Optional GitHubSession to send requests with
         
     Returns:
         List of job dictionaries, or None on error
         Each dict contains: id, name, status, conclusion, started_at, 
                            completed_at, steps, etc.
+        Runs with more than 100 jobs are read in several pages.
         
     Example:
         >>> jobs = list_workflow_jobs('<owner>', '<repo>', <run-id>)
@@ -403,13 +976,13 @@ def list_workflow_jobs(
     """
     endpoint = f'/repos/{repo_owner}/{repo_name}/actions/runs/{run_id}/jobs'
     
-    params = {'per_page': '100'}
-    
-    response = _run_gh_api(endpoint, params)
-    if response is None:
-        return None
+    params = {'per_page': str(MAX_PER_PAGE)}
     
-    jobs = response.get('jobs', [])
+    jobs = []
+    for page in _paginate(endpoint, params, 'jobs', session):
+        if page is None:
+            return None
+        jobs.extend(page)
     
     # Filter fields if specified
     if fields:
@@ -422,7 +995,8 @@ def get_workflow_job_details(
     repo_owner: str,
     repo_name: str,
     job_id: int,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    session: Optional[GitHubSession] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Get detailed information about a specific workflow job.
@@ -434,6 +1008,7 @@ def get_workflow_job_details(
         fields: Optional list of field names to include in results
                 Supports dot notation (e.g., ['id', 'name', 'steps.name'])
                 If None, returns all fields
+        session: Optional GitHubSession to send requests with
         
     Returns:
         Job details dict including all steps, or None on error
@@ -456,7 +1031,7 @@ def get_workflow_job_details(
     """
     endpoint = f'/repos/{repo_owner}/{repo_name}/actions/jobs/{job_id}'
     
-    response = _run_gh_api(endpoint)
+    response = _run_gh_api(endpoint, session=session)
     if response is None:
         return None
     
@@ -474,7 +1049,9 @@ def list_workflow_run_timing(
     days_back: Optional[int] = None,
     branch: Optional[str] = None,
     status: Optional[str] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    session: Optional[GitHubSession] = None,
+    concurrency: int = DEFAULT_CONCURRENCY
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Get timing information for multiple workflow runs.
@@ -493,6 +1070,9 @@ def list_workflow_run_timing(
         limit: Maximum number of runs to return
                If None and days_back not specified, defaults to 10
                If 0, returns all runs (unlimited)
+        session: Optional GitHubSession to send requests with
+        concurrency: Number of runs whose details and jobs are fetched at
+                     once (default: 4). Results keep the runs' order.
         
     Returns:
         List of dicts, one per run, containing:
@@ -505,10 +1085,15 @@ def list_workflow_run_timing(
         Returns None on error.
         
     Limit Behavior:
-        - No args specified: Returns timing for 10 most recent runs (20 API calls)
-        - --days 7: Returns all runs in last 7 days (potentially 100+ API calls)
-        - --limit 50: Returns timing for 50 most recent runs (100 API calls)
-        - --days 7 --limit 20: Returns up to 20 runs within last 7 days (40 API calls)
+        - No args specified: Returns timing for 10 most recent runs (11 API calls)
+        - --days 7: Returns all runs in last 7 days (potentially 50+ API calls)
+        - --limit 50: Returns timing for 50 most recent runs (51 API calls)
+        - --days 7 --limit 20: Returns up to 20 runs within last 7 days (21 API calls)
+        
+    API Calls:
+        Run timing is taken from the list of runs, so each run needs one
+        call for its jobs. Run details are fetched only for runs whose list
+        entry lacks a field in RUN_TIMING_FIELDS.
         
     Example:
         >>> # Default: 10 most recent runs (safe)
@@ -519,7 +1104,7 @@ def list_workflow_run_timing(
         >>> # All runs in last 7 days (may be many API calls)
         >>> timings = list_workflow_run_timing('<owner>', '<repo>', days_back=7)
         
-        >>> # Exactly 50 runs (100 API calls)
+        >>> # Exactly 50 runs (51 API calls)
         >>> timings = list_workflow_run_timing('<owner>', '<repo>', limit=50)
         
         >>> timings[0]['run_id']
@@ -540,7 +1125,8 @@ def list_workflow_run_timing(
         branch=branch,
         status=status,
         limit=limit,
-        fields=None  # Get all fields
+        fields=None,  # Get all fields
+        session=session
     )
     
     if runs is None:
@@ -550,116 +1136,45 @@ def list_workflow_run_timing(
         print("No runs found matching criteria", file=sys.stderr)
         return []
     
-    # Collect timing for each run
-    result = []
-    
-    for run in runs:
+    def fetch_run_timing(run: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         run_id = run.get('id')
         if not run_id:
-            continue
+            return None
         
-        # Get run details for accurate timing
-        run_details = get_workflow_run_details(repo_owner, repo_name, run_id)
-        if run_details is None:
-            print(f"Warning: Could not get details for run {run_id}", file=sys.stderr)
-            continue
+        # The list entry has the run's timing; fetch details only if it doesn't
+        run_details = run
+        if any(field not in run for field in RUN_TIMING_FIELDS):
+            run_details = get_workflow_run_details(repo_owner, repo_name, run_id, session=session)
+            if run_details is None:
+                print(f"Warning: Could not get details for run {run_id}", file=sys.stderr)
+                return None
         
         # Get jobs for this run
-        jobs = list_workflow_jobs(repo_owner, repo_name, run_id)
+        jobs = list_workflow_jobs(repo_owner, repo_name, run_id, session=session)
         if jobs is None:
             print(f"Warning: Could not get jobs for run {run_id}", file=sys.stderr)
-            continue
-        
-        # Calculate run duration
-        run_started = run_details.get('run_started_at')
-        run_updated = run_details.get('updated_at')
-        
-        run_duration = None
-        if run_started and run_updated:
-            start_time = datetime.fromisoformat(run_started.replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(run_updated.replace('Z', '+00:00'))
-            run_duration = (end_time - start_time).total_seconds()
-        
-        # Calculate job durations
-        job_timings = []
-        total_job_time = 0
+            return None
         
-        for job in jobs:
-            started = job.get('started_at')
-            completed = job.get('completed_at')
-            
-            duration = None
-            if started and completed:
-                start_time = datetime.fromisoformat(started.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(completed.replace('Z', '+00:00'))
-                duration = (end_time - start_time).total_seconds()
-                if duration:
-                    total_job_time += duration
-            
-            job_timings.append({
-                'name': job.get('name'),
-                'status': job.get('status'),
-                'conclusion': job.get('conclusion'),
-                'duration_seconds': duration
-            })
-        
-        # Build result record
-        result.append({
-            'run_id': run_details.get('id'),
-            'run_name': run_details.get('name'),
-            'run_number': run_details.get('run_number'),
-            'run_created_at': run_details.get('created_at'),
-            'run_updated_at': run_details.get('updated_at'),
-            'run_status': run_details.get('status'),
-            'run_conclusion': run_details.get('conclusion'),
-            'run_duration_seconds': run_duration,
-            'actor': run_details.get('actor', {}),
-            'jobs': job_timings,
-            'total_job_time_seconds': total_job_time
-        })
+        return _build_run_timing(run_details, jobs)
+    
+    # Fetch several runs at once; map() keeps the runs' order
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        timings = list(executor.map(fetch_run_timing, runs))
     
-    return result
+    return [timing for timing in timings if timing is not None]
 
 
-def get_workflow_run_timing(
-    repo_owner: str,
-    repo_name: str,
-    run_id: int
-) -> Optional[Dict[str, Any]]:
+def _build_run_timing(run_details: Dict[str, Any], jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Get timing information for a single workflow run and its jobs.
+    Calculate the timing record of a run from its details and jobs.
     
     Args:
-        repo_owner: Repository owner (username or organization)
-        repo_name: Repository name
-        run_id: Workflow run ID
+        run_details: Workflow run, from list_workflow_runs() or get_workflow_run_details()
+        jobs: The run's jobs, as returned by list_workflow_jobs()
         
     Returns:
-        Dict with timing information, or None on error
-        Contains:
-        - run_id, run_name, run_number
-        - run_duration_seconds: Total workflow duration
-        - actor (dict with login)
-        - jobs: List of dicts with job name, duration_seconds, status
-        - total_job_time_seconds: Sum of all job durations
-        
-    Example:
-        >>> timing = get_workflow_run_timing('<owner>', '<repo>', <run-id>)
-        >>> timing['run_duration_seconds']
-        125.5
-        >>> timing['jobs'][0]['name']
-        'Validate Testing Tools'
-        >>> timing['jobs'][0]['duration_seconds']
-        45.2
+        Timing record, see get_workflow_run_timing()
     """
-    run_details = get_workflow_run_details(repo_owner, repo_name, run_id)
-    if run_details is None:
-        return None
-    
-    jobs = list_workflow_jobs(repo_owner, repo_name, run_id)
-    if jobs is None:
-        return None
-    
     # Calculate run duration
     run_started = run_details.get('run_started_at')
     run_updated = run_details.get('updated_at')
@@ -705,3 +1220,47 @@ def get_workflow_run_timing(
         'jobs': job_timings,
         'total_job_time_seconds': total_job_time
     }
+
+
+def get_workflow_run_timing(
+    repo_owner: str,
+    repo_name: str,
+    run_id: int,
+    session: Optional[GitHubSession] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Get timing information for a single workflow run and its jobs.
+    
+    Args:
+        repo_owner: Repository owner (username or organization)
+        repo_name: Repository name
+        run_id: Workflow run ID
+        session: Optional GitHubSession to send requests with
+        
+    Returns:
+        Dict with timing information, or None on error
+        Contains:
+        - run_id, run_name, run_number
+        - run_duration_seconds: Total workflow duration
+        - actor (dict with login)
+        - jobs: List of dicts with job name, duration_seconds, status
+        - total_job_time_seconds: Sum of all job durations
+        
+    Example:
+        >>> timing = get_workflow_run_timing('<owner>', '<repo>', <run-id>)
+        >>> timing['run_duration_seconds']
+        125.5
+        >>> timing['jobs'][0]['name']
+        'Validate Testing Tools'
+        >>> timing['jobs'][0]['duration_seconds']
+        45.2
+    """
+    run_details = get_workflow_run_details(repo_owner, repo_name, run_id, session=session)
+    if run_details is None:
+        return None
+    
+    jobs = list_workflow_jobs(repo_owner, repo_name, run_id, session=session)
+    if jobs is None:
+        return None
+    
+    return _build_run_timing(run_details, jobs)
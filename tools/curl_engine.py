@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+In-process HTTP engine for documented curl commands.
+
+This module provides:
+- Parsing of documented curl command lines into method, URL, headers, and body
+- A thread-safe pool of keep-alive HTTP connections
+- Execution of parsed requests with the same result shape as the curl subprocess
+
+Commands that use curl options or shell syntax this engine does not
+understand are not parsed, so the caller can fall back to running curl.
+
+Usage:
+    from curl_engine import parse_curl_command, execute_request
+
+    request = parse_curl_command('curl -i http://localhost:3000/users')
+    if request is not None:
+        status_code, headers, body = execute_request(request)
+"""
+
+import http.client
+import shlex
+import ssl
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple, List
+from urllib.parse import urlsplit, quote
+
+# Default request timeout, matching the curl subprocess timeout
+DEFAULT_TIMEOUT_SECONDS = 10
+
+# Idle connections kept per host
+MAX_IDLE_CONNECTIONS_PER_HOST = 8
+
+# Flags that only change how curl prints its output
+_IGNORED_FLAGS = {
+    '-i', '--include',
+    '-s', '--silent',
+    '-S', '--show-error',
+    '-v', '--verbose',
+    '-k', '--insecure',
+    '--compressed',
+}
+
+# Flags that take a value argument
+_VALUE_FLAGS = {
+    '-X': 'method', '--request': 'method',
+    '-H': 'header', '--header': 'header',
+    '-d': 'data', '--data': 'data', '--data-ascii': 'data',
+    '--data-raw': 'data_raw', '--data-binary': 'data',
+    '--json': 'json',
+    '--url': 'url',
+}
+
+# Short flags that can be combined, as in "-sSi"
+_COMBINABLE_SHORT_FLAGS = set('isSvkGI')
+
+# Tokens that mean the command is a shell pipeline, not a single curl call
+_SHELL_OPERATORS = {'|', '||', '&', '&&', ';', ';;', '<', '>', '>>', '(', ')'}
+
+
+@dataclass
+class CurlRequest:
+    """
+    An HTTP request described by a curl command line.
+
+    Attributes:
+        method: HTTP method (GET, POST, ...)
+        url: Absolute request URL including the scheme
+        headers: Request headers in command-line order
+        body: Request body bytes, or None if the request has no body
+        insecure: True if certificate checks are disabled (-k)
+    """
+    method: str
+    url: str
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    body: Optional[bytes] = None
+    insecure: bool = False
+
+
+def _split_command(command: str) -> Optional[List[str]]:
+    """
+    Split a shell command line into tokens.
+
+    Args:
+        command: Command text, possibly with backslash line continuations
+
+    Returns:
+        List of tokens, or None if the command uses shell features
+        (variables, substitutions, pipes, redirects) or can't be tokenized
+    """
+    # Shell expansion can't be reproduced in-process
+    if '$' in command or '`' in command:
+        return None
+
+    # Join backslash-newline line continuations the way the shell does
+    command = command.replace('\\\r\n', ' ').replace('\\\n', ' ')
+
+    try:
+        lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+        lexer.whitespace_split = True
+        tokens = list(lexer)
+    except ValueError:
+        return None
+
+    if any(token in _SHELL_OPERATORS for token in tokens):
+        return None
+
+    return tokens
+
+
+def _expand_short_flags(tokens: List[str]) -> List[str]:
+    """
+    Expand combined and attached short flags into separate tokens.
+
+    Examples: "-sSi" becomes "-s", "-S", "-i" and "-XPOST" becomes "-X", "POST".
+
+    Args:
+        tokens: Command-line tokens after the program name
+
+    Returns:
+        List of tokens with short flags separated
+    """
+    expanded = []
+    for token in tokens:
+        if len(token) > 2 and token[0] == '-' and token[1] != '-':
+            flag = token[:2]
+            if flag in _VALUE_FLAGS:
+                # Attached value, as in -XPOST or -H'Accept: */*'
+                expanded.extend([flag, token[2:]])
+                continue
+            if all(ch in _COMBINABLE_SHORT_FLAGS for ch in token[1:]):
+                expanded.extend(f'-{ch}' for ch in token[1:])
+                continue
+        expanded.append(token)
+    return expanded
+
+
+def parse_curl_command(command: str) -> Optional[CurlRequest]:
+    """
+    Parse a documented curl command line into an HTTP request.
+
+    Supports the curl options used in API examples: -X/--request, -H/--header,
+    -d/--data/--data-raw/--data-binary, --json, --url, -G/--get, -I/--head,
+    and output-only flags such as -i, -s, and -v.
+
+    Args:
+        command: The curl command line
+
+    Returns:
+        CurlRequest, or None if the command can't be run in-process and
+        should be passed to the curl subprocess instead
+
+    Example:
+        >>> request = parse_curl_command('curl -X POST http://localhost:3000/users -d "{}"')
+        >>> request.method, request.url
+        ('POST', 'http://localhost:3000/users')
+    """
+    tokens = _split_command(command)
+    if not tokens or tokens[0] != 'curl':
+        return None
+
+    tokens = _expand_short_flags(tokens[1:])
+
+    method: Optional[str] = None
+    urls: List[str] = []
+    headers: List[Tuple[str, str]] = []
+    data_parts: List[str] = []
+    use_get = False
+    use_head = False
+    insecure = False
+    json_body = False
+
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+
+        if token in _IGNORED_FLAGS:
+            if token in ('-k', '--insecure'):
+                insecure = True
+            continue
+
+        if token in ('-G', '--get'):
+            use_get = True
+            continue
+
+        if token in ('-I', '--head'):
+            use_head = True
+            continue
+
+        if token in _VALUE_FLAGS:
+            if index >= len(tokens):
+                return None
+            value = tokens[index]
+            index += 1
+            kind = _VALUE_FLAGS[token]
+
+            if kind == 'method':
+                method = value.upper()
+            elif kind == 'header':
+                if ':' not in value:
+                    # "-H 'Name;'" and header removal forms aren't supported
+                    return None
+                name, header_value = value.split(':', 1)
+                headers.append((name.strip(), header_value.strip()))
+            elif kind == 'data':
+                if value.startswith('@'):
+                    # Reading data from a file is left to curl
+                    return None
+                data_parts.append(value)
+            elif kind == 'data_raw':
+                data_parts.append(value)
+            elif kind == 'json':
+                if value.startswith('@'):
+                    return None
+                data_parts.append(value)
+                json_body = True
+            elif kind == 'url':
+                urls.append(value)
+            continue
+
+        if token.startswith('-'):
+            # Unknown option; let curl handle it
+            return None
+
+        urls.append(token)
+
+    if len(urls) != 1:
+        return None
+
+    url = urls[0]
+    if '://' not in url:
+        # curl assumes http:// when no scheme is given
+        url = f'http://{url}'
+
+    if urlsplit(url).scheme not in ('http', 'https'):
+        return None
+
+    header_names = {name.lower() for name, _ in headers}
+    body: Optional[bytes] = None
+
+    if data_parts:
+        # curl joins multiple -d values with '&'
+        data = '&'.join(data_parts)
+        if use_get:
+            separator = '&' if '?' in url else '?'
+            url = f'{url}{separator}{data}'
+        else:
+            body = data.encode('utf-8')
+            if json_body:
+                if 'content-type' not in header_names:
+                    headers.append(('Content-Type', 'application/json'))
+                if 'accept' not in header_names:
+                    headers.append(('Accept', 'application/json'))
+            elif 'content-type' not in header_names:
+                headers.append(('Content-Type', 'application/x-www-form-urlencoded'))
+
+    if method is None:
+        if use_head:
+            method = 'HEAD'
+        elif body is not None:
+            method = 'POST'
+        else:
+            method = 'GET'
+
+    return CurlRequest(method=method, url=url, headers=headers, body=body, insecure=insecure)
+
+
+class HttpConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP connections.
+
+    Connections are kept per (scheme, host, port) and reused for later
+    requests to the same server, so consecutive examples don't pay for a
+    new TCP connection each time.
+
+    Example:
+        >>> pool = HttpConnectionPool()
+        >>> request = parse_curl_command('curl http://localhost:3000/users')
+        >>> status_code, headers, body = pool.request(request)
+        >>> pool.close()
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_CONNECTIONS_PER_HOST):
+        self._max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str, int, bool], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, key: Tuple[str, str, int, bool], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection for key, or open a new one. Returns (connection, reused)."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+
+        scheme, host, port, insecure = key
+        if scheme == 'https':
+            context = ssl._create_unverified_context() if insecure else ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, key: Tuple[str, str, int, bool], connection: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def request(
+        self,
+        request: CurlRequest,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ) -> Tuple[Optional[int], Optional[str], str]:
+        """
+        Send a request over a pooled connection.
+
+        Args:
+            request: Parsed curl request
+            timeout: Socket timeout in seconds
+
+        Returns:
+            tuple: (status_code, headers, body) or (None, None, error_message)
+            headers is the status line and header lines as curl -i prints them.
+        """
+        parts = urlsplit(request.url)
+        host = parts.hostname or 'localhost'
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, host, port, request.insecure)
+
+        # Keep the request target exactly as written, quoting only unsafe characters
+        target = quote(parts.path or '/', safe="/%:@!$&'()*+,;=-._~")
+        if parts.query:
+            target = f"{target}?{quote(parts.query, safe='/%:@!$&()*+,;=?-._~')}"
+
+        headers = {name: value for name, value in request.headers}
+        header_names = {name.lower() for name in headers}
+        if 'user-agent' not in header_names:
+            headers['User-Agent'] = 'test-api-docs'
+        if 'accept' not in header_names:
+            headers['Accept'] = '*/*'
+
+        # A reused connection may have been closed by the server since it was
+        # last used; retry once on a fresh connection in that case
+        for attempt in range(2):
+            connection, reused = self._acquire(key, timeout)
+            try:
+                connection.request(request.method, target, body=request.body, headers=headers)
+                response = connection.getresponse()
+                raw_body = response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                connection.close()
+                if reused and attempt == 0:
+                    continue
+                return None, None, f"Connection to {host} port {port} failed: {e}"
+            except ConnectionRefusedError:
+                connection.close()
+                return None, None, f"Failed to connect to {host} port {port}: Connection refused"
+            except TimeoutError:
+                connection.close()
+                return None, None, f"Request timed out after {timeout} seconds"
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                return None, None, f"Request to {host} port {port} failed: {e}"
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+
+            version = 'HTTP/1.1' if response.version == 11 else 'HTTP/1.0'
+            header_lines = [f"{version} {response.status} {response.reason}"]
+            header_lines.extend(f"{name}: {value}" for name, value in response.getheaders())
+            return response.status, '\n'.join(header_lines), raw_body.decode('utf-8', errors='replace')
+
+        return None, None, f"Connection to {host} port {port} failed"
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_lists:
+            for connection in idle:
+                connection.close()
+
+
+# Shared pool used when the caller doesn't supply one
+DEFAULT_POOL = HttpConnectionPool()
+
+
+def execute_request(
+    request: CurlRequest,
+    pool: Optional[HttpConnectionPool] = None,
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+) -> Tuple[Optional[int], Optional[str], str]:
+    """
+    Execute a parsed curl request in-process.
+
+    Args:
+        request: Parsed curl request
+        pool: Connection pool to use (default: the shared module pool)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        tuple: (status_code, headers, body) or (None, None, error_message)
+
+    Example:
+        >>> request = parse_curl_command('curl http://localhost:3000/users')
+        >>> status_code, headers, body = execute_request(request)
+    """
+    return (pool or DEFAULT_POOL).request(request, timeout)
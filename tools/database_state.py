@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Reset the test server's database between documentation tests.
+
+This module provides:
+- Resetting the mock_service.py stand-in server with one reset request
+- Reading the current state of the test server through its REST API
+- Replaying only the differences to a document's local_database
+- Confirming the reset by reading the state back before returning
+- Falling back to copying the database file the server watches
+
+The REST replay follows json-server 0.17 behavior: PUT replaces a record,
+POST with an id inserts it at the end of its collection, and DELETE also
+removes dependent records (a user's tasks). Because deletes can cascade
+and records can only be appended, the replay repeats until the server's
+collections match the database exactly, including record order.
+
+Usage:
+    from database_state import DatabaseStateManager, load_database
+
+    database, error = load_database('api/to-do-db-source-test.json')
+    manager = DatabaseStateManager('localhost:3000', '/tmp/to-do-db-test.json')
+    reset, error = manager.reset(database)
+"""
+
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Dict, Tuple, List, Any
+
+from curl_engine import CurlRequest, HttpConnectionPool, execute_request
+from mock_service import RESET_PATH
+
+# Replay rounds before falling back to copying the database file
+MAX_REPLAY_ROUNDS = 4
+
+# How long to wait for the server to reload a copied database file
+FILE_RELOAD_TIMEOUT_SECONDS = 10.0
+
+# Time between checks while waiting for the server to reload the file
+FILE_RELOAD_POLL_SECONDS = 0.02
+
+
+def load_database(db_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Load a local_database JSON file.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        tuple: (database, None) on success, or (None, error_message)
+
+    Example:
+        >>> database, error = load_database('api/to-do-db-source-test.json')
+        >>> sorted(database)
+        ['tasks', 'users']
+    """
+    try:
+        database = json.loads(Path(db_path).read_text(encoding='utf-8'))
+    except OSError as e:
+        return None, f"Could not read database {db_path}: {e}"
+    except json.JSONDecodeError as e:
+        return None, f"Database {db_path} is not valid JSON: {e}"
+
+    if not isinstance(database, dict):
+        return None, f"Database {db_path} must be a JSON object of collections"
+    return database, None
+
+
+def _record_id(record: Any) -> Any:
+    """Return the id of a collection record, or None if it doesn't have one."""
+    if isinstance(record, dict):
+        return record.get('id')
+    return None
+
+
+class DatabaseStateManager:
+    """
+    Reset a test server to a database and confirm the reset.
+
+    A server with a reset endpoint, like mock_service.py, is reset with
+    one request. Otherwise each reset reads the server's collections, sends
+    only the requests needed to turn them into the target database, and
+    reads them back to confirm. If the server can't be reset through its
+    API, the database is copied over the file the server watches and the
+    server is polled until it serves the new data.
+
+    Attributes:
+        server_url: Base URL of the test server
+        target_path: Database file the test server watches, if any
+        last_changes: Number of requests the last reset sent to change data
+        last_method: How the last reset was done ('endpoint', 'rest', or 'file')
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        target_path: Optional[str] = None,
+        pool: Optional[HttpConnectionPool] = None
+    ):
+        if '://' not in server_url:
+            server_url = f"http://{server_url}"
+        self.server_url = server_url.rstrip('/')
+        self.target_path = target_path
+        self.pool = pool or HttpConnectionPool()
+        self.last_changes = 0
+        self.last_method: Optional[str] = None
+        # Whether the server has a reset endpoint, or None until it's tried
+        self.has_reset_endpoint: Optional[bool] = None
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None
+    ) -> Tuple[Optional[int], str]:
+        """Send one request to the server and return (status_code, body)."""
+        headers = []
+        body = None
+        if payload is not None:
+            headers.append(('Content-Type', 'application/json'))
+            body = json.dumps(payload).encode('utf-8')
+        request = CurlRequest(method, f"{self.server_url}{path}", headers, body)
+        status_code, _, response_body = execute_request(request, self.pool)
+        return status_code, response_body
+
+    def read_collection(self, name: str) -> Tuple[Optional[List[Any]], Optional[str]]:
+        """
+        Read a collection from the server.
+
+        Args:
+            name: Collection name, for example 'users'
+
+        Returns:
+            tuple: (records, None) on success, or (None, error_message)
+        """
+        status_code, body = self._request('GET', f"/{name}")
+        if status_code is None:
+            return None, body
+        if status_code != 200:
+            return None, f"GET /{name} returned HTTP {status_code}"
+        try:
+            records = json.loads(body)
+        except json.JSONDecodeError:
+            return None, f"GET /{name} did not return JSON"
+        if not isinstance(records, list):
+            return None, f"GET /{name} did not return a list"
+        return records, None
+
+    def read_state(self, names: List[str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Read the server's collections.
+
+        json-server returns its whole database from /db in one request.
+        Servers without /db are read one collection at a time.
+
+        Args:
+            names: Collections to read if the server has no /db route
+
+        Returns:
+            tuple: (collections, None) on success, or (None, error_message)
+        """
+        status_code, body = self._request('GET', '/db')
+        if status_code == 200:
+            try:
+                state = json.loads(body)
+            except json.JSONDecodeError:
+                state = None
+            if isinstance(state, dict):
+                return state, None
+
+        state = {}
+        for name in names:
+            records, error = self.read_collection(name)
+            if records is None:
+                return None, error
+            state[name] = records
+        return state, None
+
+    def _plan_collection(self, name: str, current: List[Any], target: List[Any]) -> List[Tuple[str, str, Any]]:
+        """
+        List the requests that turn a collection into its target records.
+
+        Records that are out of place are deleted and posted again in
+        order, since the server can only append new records.
+
+        Returns:
+            list: (method, path, payload) tuples
+        """
+        target_ids = [_record_id(record) for record in target]
+        target_id_set = set(target_ids)
+        requests = [('DELETE', f"/{name}/{_record_id(record)}", None)
+                    for record in current if _record_id(record) not in target_id_set]
+        kept = [record for record in current if _record_id(record) in target_id_set]
+
+        # Records after the first one out of order are posted again
+        in_order = 0
+        while (in_order < len(kept) and in_order < len(target)
+               and _record_id(kept[in_order]) == target_ids[in_order]):
+            in_order += 1
+
+        for record in kept[in_order:]:
+            requests.append(('DELETE', f"/{name}/{_record_id(record)}", None))
+        for record, wanted in zip(kept[:in_order], target[:in_order]):
+            if record != wanted:
+                requests.append(('PUT', f"/{name}/{_record_id(wanted)}", wanted))
+        for wanted in target[in_order:]:
+            requests.append(('POST', f"/{name}", wanted))
+        return requests
+
+    def _replay(self, database: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Reset the server through its REST API, confirming each round."""
+        for record_list in database.values():
+            if (not isinstance(record_list, list)
+                    or any(_record_id(record) is None for record in record_list)):
+                return False, "database has collections the REST API can't restore"
+
+        self.last_changes = 0
+        for _ in range(MAX_REPLAY_ROUNDS + 1):
+            state, error = self.read_state(list(database))
+            if state is None:
+                return False, error
+            if set(state) != set(database):
+                return False, "server collections don't match the database"
+
+            plan: List[Tuple[str, str, Any]] = []
+            for name, target in database.items():
+                if not isinstance(state[name], list):
+                    return False, f"server collection {name} is not a list"
+                plan.extend(self._plan_collection(name, state[name], target))
+
+            if not plan:
+                return True, None
+
+            for method, path, payload in plan:
+                status_code, body = self._request(method, path, payload)
+                if status_code is None:
+                    return False, body
+                # A 404 means a cascading delete already removed the record;
+                # the next round restores it
+                if status_code >= 400 and status_code != 404:
+                    return False, f"{method} {path} returned HTTP {status_code}"
+                self.last_changes += 1
+
+        return False, f"database did not match after {MAX_REPLAY_ROUNDS} rounds of changes"
+
+    def _copy_file(self, database: Dict[str, Any], db_path: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """Copy the database over the watched file and wait for the server to serve it."""
+        try:
+            if db_path:
+                shutil.copyfile(db_path, self.target_path)
+            else:
+                Path(self.target_path).write_text(json.dumps(database, indent=2), encoding='utf-8')
+        except OSError as e:
+            return False, f"Could not reset database {self.target_path}: {e}"
+
+        deadline = time.monotonic() + FILE_RELOAD_TIMEOUT_SECONDS
+        while True:
+            state, error = self.read_state(list(database))
+            if state == database:
+                return True, None
+            if state is not None:
+                error = "server does not serve the new database yet"
+            if time.monotonic() >= deadline:
+                return False, f"Test server did not load {self.target_path}: {error}"
+            time.sleep(FILE_RELOAD_POLL_SECONDS)
+
+    def reset(
+        self,
+        database: Dict[str, Any],
+        db_path: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Reset the server to a database and confirm it serves that data.
+
+        Args:
+            database: Collections to restore, as loaded by load_database()
+            db_path: File the database was loaded from, copied as-is if
+                     the server has to reload its watched file
+
+        Returns:
+            tuple: (True, None) once the server serves the database,
+                   or (False, error_message)
+
+        Example:
+            >>> manager = DatabaseStateManager('localhost:3000', '/tmp/to-do-db-test.json')
+            >>> reset, error = manager.reset(database)
+            >>> print(manager.last_method, manager.last_changes)
+            rest 2
+        """
+        if self.has_reset_endpoint is not False:
+            status_code, _ = self._request('POST', RESET_PATH, database)
+            if status_code == 200:
+                self.has_reset_endpoint = True
+                self.last_method = 'endpoint'
+                self.last_changes = 1
+                return True, None
+            if status_code is not None:
+                self.has_reset_endpoint = False
+
+        reset, error = self._replay(database)
+        if reset:
+            self.last_method = 'rest'
+            return True, None
+
+        if not self.target_path:
+            return False, f"Could not reset database through {self.server_url}: {error}"
+
+        self.last_method = 'file'
+        self.last_changes = 0
+        return self._copy_file(database, db_path)
+
+    def close(self) -> None:
+        """Close the manager's pooled connections."""
+        self.pool.close()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Run a documentation tool through the doc tools daemon.
+
+The daemon keeps the tools loaded, so a call costs a few milliseconds
+instead of starting Python and importing the tool each time. The daemon
+is started on the first call and stops by itself after 15 minutes
+without calls. The tool's output is shown as it's printed, and it and the
+exit code are the same as running its script directly. If the daemon can't be used, the tool's script is
+run instead. So is a tool that reads stdin (an argument of -), because
+the daemon can't read the client's stdin.
+
+Usage:
+    doc-tools.py TOOL [ARGS ...]
+    doc-tools.py --status | --stop
+
+Arguments:
+    TOOL: One of the tools in doc_tools_daemon.TOOLS, like get-database-path
+    ARGS: Arguments for the tool
+    --status: Show whether the daemon is running
+    --stop: Stop the daemon
+    --no-daemon: Run the tool's script without the daemon
+
+Examples:
+    doc-tools.py get-database-path docs/api/users-get-all-users.md
+    doc-tools.py list-linter-exceptions --action warning docs/api/*.md
+    doc-tools.py --stop
+
+Exit Codes:
+    The tool's exit code, or 1 if the tool can't be run
+"""
+
+import sys
+import json
+import os
+import socket
+import subprocess
+import argparse
+import time
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Callable
+
+# Import from shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from doc_tools_daemon import TOOLS, TOOLS_DIR, default_socket_path
+
+# Seconds to wait for a new daemon to load the tools
+STARTUP_TIMEOUT = 10.0
+
+
+def request_daemon(
+    socket_path: str,
+    request: Dict[str, Any],
+    on_output: Optional[Callable[[str, str], None]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to the daemon and wait for its response.
+
+    Args:
+        socket_path: Path of the daemon's socket
+        request: Request, see doc_tools_daemon
+        on_output: Called with (stream, text) for each piece of the tool's
+                   output as it arrives, or None to add the output to the
+                   response as a list of [stream, text] pairs
+
+    Returns:
+        dict: The response, or None if the daemon isn't running or failed
+    """
+    output: List[List[str]] = []
+    response = None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode('utf-8'))
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile('rb') as frames:
+                for line in frames:
+                    frame = json.loads(line.decode('utf-8'))
+                    if 'stream' not in frame:
+                        response = frame
+                    elif on_output is not None:
+                        on_output(frame['stream'], frame['text'])
+                    elif output and output[-1][0] == frame['stream']:
+                        output[-1][1] += frame['text']
+                    else:
+                        output.append([frame['stream'], frame['text']])
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+    if response is not None and on_output is None and 'exit_code' in response:
+        response['output'] = output
+    return response
+
+
+def start_daemon(socket_path: str) -> bool:
+    """
+    Start the daemon in the background and wait until it answers.
+
+    Args:
+        socket_path: Path for the daemon's socket
+
+    Returns:
+        bool: True if the daemon is answering requests
+    """
+    subprocess.Popen(
+        [sys.executable, str(TOOLS_DIR / 'doc_tools_daemon.py'), '--socket', socket_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if request_daemon(socket_path, {'command': 'ping'}) is not None:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def run_script(tool: str, args: List[str]) -> int:
+    """Run a tool's script in a new Python process and return its exit code."""
+    return subprocess.call([sys.executable, str(TOOLS_DIR / f"{tool}.py")] + args)
+
+
+def reads_stdin(args: List[str]) -> bool:
+    """
+    Check whether a tool's arguments ask it to read stdin.
+
+    Args:
+        args: Arguments for the tool
+
+    Returns:
+        bool: True if an argument is -, like --files-from - or --files-from=-
+    """
+    return any(arg == '-' or arg.endswith('=-') for arg in args)
+
+
+def run_tool(tool: str, args: List[str], socket_path: str) -> int:
+    """
+    Run a tool through the daemon, starting it if needed.
+
+    Args:
+        tool: Tool name
+        args: Arguments for the tool
+        socket_path: Path of the daemon's socket
+
+    Returns:
+        int: The tool's exit code
+    """
+    request = {'tool': tool, 'args': args, 'cwd': os.getcwd(), 'env': dict(os.environ)}
+    shown = []
+
+    def show(stream: str, text: str) -> None:
+        target = sys.stderr if stream == 'stderr' else sys.stdout
+        target.write(text)
+        target.flush()
+        shown.append(stream)
+
+    # Two tries: a stale daemon stops after its first answer
+    for _ in range(2):
+        response = request_daemon(socket_path, request, show)
+        if response is None and not shown:
+            if not start_daemon(socket_path):
+                break
+            response = request_daemon(socket_path, request, show)
+        if shown and (response is None or 'exit_code' not in response):
+            # Running the tool again would repeat the output it printed
+            print(f"Error: The doc tools daemon stopped while running {tool}", file=sys.stderr)
+            return 1
+        if response is None or response.get('restart'):
+            continue
+        if 'error' in response:
+            print(f"Error: {response['error']}", file=sys.stderr)
+            return 1
+        return response['exit_code']
+
+    # The daemon can't be used; run the script instead
+    return run_script(tool, args)
+
+
+def main() -> None:
+    """Main entry point for the doc-tools client."""
+    parser = argparse.ArgumentParser(
+        description='Run a documentation tool through the doc tools daemon.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Tools: {', '.join(TOOLS)}
+
+Examples:
+  %(prog)s get-database-path docs/api/users-get-all-users.md
+  %(prog)s list-linter-exceptions --action warning docs/api/*.md
+  %(prog)s --status                        # Is the daemon running?
+  %(prog)s --stop                          # Stop the daemon
+        """
+    )
+
+    parser.add_argument(
+        'tool',
+        nargs='?',
+        choices=TOOLS,
+        metavar='TOOL',
+        help='Tool to run'
+    )
+
+    parser.add_argument(
+        'args',
+        nargs=argparse.REMAINDER,
+        help='Arguments for the tool'
+    )
+
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='Show whether the daemon is running'
+    )
+
+    parser.add_argument(
+        '--stop',
+        action='store_true',
+        help='Stop the daemon'
+    )
+
+    parser.add_argument(
+        '--no-daemon',
+        action='store_true',
+        help="Run the tool's script without the daemon"
+    )
+
+    args = parser.parse_args()
+    socket_path = default_socket_path()
+
+    if args.status or args.stop:
+        response = request_daemon(socket_path, {'command': 'stop' if args.stop else 'ping'})
+        if response is None:
+            print("Doc tools daemon is not running")
+        elif args.stop:
+            print("Doc tools daemon stopped")
+        else:
+            print(f"Doc tools daemon is running (pid {response['pid']}) on {socket_path}")
+        sys.exit(0)
+
+    if args.tool is None:
+        parser.error('a tool is required')
+
+    if args.no_daemon or not hasattr(socket, 'AF_UNIX') or reads_stdin(args.args):
+        sys.exit(run_script(args.tool, args.args))
+    sys.exit(run_tool(args.tool, args.args, socket_path))
+
+
+if __name__ == '__main__':
+    main()
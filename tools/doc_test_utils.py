@@ -3,20 +3,143 @@
 Shared utilities for documentation testing tools.
 
 This module provides common functions for:
-- Parsing YAML front matter from markdown files
+- Parsing YAML front matter from markdown files, with parsed front matter
+  cached in memory and optionally on disk (FRONT_MATTER_CACHE_DIR)
 - Reading markdown files with error handling
 - Extracting test configuration from front matter
 - Unified logging with GitHub Actions annotation support
 """
 
+import functools
+import glob
+import hashlib
+import io
+import json
+import os
 import re
+import sys
+import tempfile
+import threading
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, List, Any, Iterator
 
 # Import help URLs from centralized config
 from help_urls import HELP_URLS
 
+# Per-thread log output buffers, set by capture_log()
+_log_output = threading.local()
+
+# Front matter is the text between --- delimiters at the start of a file.
+# Spec: "---" must be at start of line (no leading whitespace)
+# followed by optional whitespace and required newline.
+# The closing "---" must be on a line of its own, so lines like "----" are content
+FRONT_MATTER_PATTERN = re.compile(r'^---[ \t]*\n(.*?)\n---[ \t]*(?:\n|\Z)', re.DOTALL)
+
+# Line that closes front matter, as FRONT_MATTER_PATTERN matches it
+FRONT_MATTER_CLOSING_PATTERN = re.compile(r'---[ \t]*\n?\Z')
+
+# Comment that marks a file as not needing front matter (first lines only)
+FRONT_MATTER_NOT_REQUIRED = '<!-- front matter not required -->'
+FRONT_MATTER_NOT_REQUIRED_LINES = 5
+
+# libyaml's loader when PyYAML was built with it; it builds the same values
+YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Number of parsed front matter texts kept in memory
+FRONT_MATTER_CACHE_SIZE = 1024
+
+# Directory to share parsed front matter between processes, if set
+FRONT_MATTER_CACHE_DIR = os.environ.get('FRONT_MATTER_CACHE_DIR') or None
+
+# Change to expire every parsed front matter stored on disk
+FRONT_MATTER_CACHE_VERSION = 1
+
+
+def set_front_matter_cache_dir(cache_dir: Optional[str]) -> None:
+    """
+    Set or turn off the on-disk cache of parsed front matter.
+    
+    Args:
+        cache_dir: Directory to store parsed front matter in, or None to
+                   only cache in memory. Defaults to the
+                   FRONT_MATTER_CACHE_DIR environment variable.
+    """
+    global FRONT_MATTER_CACHE_DIR
+    FRONT_MATTER_CACHE_DIR = cache_dir
+
+
+def clear_front_matter_cache() -> None:
+    """Forget the parsed front matter cached in memory."""
+    _front_matter_json.cache_clear()
+
+
+def _front_matter_cache_path(text: str) -> Optional[Path]:
+    """Path of a front matter text's file in the on-disk cache, or None if it's off."""
+    if FRONT_MATTER_CACHE_DIR is None:
+        return None
+    key = f"{FRONT_MATTER_CACHE_VERSION}\0{yaml.__version__}\0{text}"
+    return Path(FRONT_MATTER_CACHE_DIR) / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+
+@functools.lru_cache(maxsize=FRONT_MATTER_CACHE_SIZE)
+def _front_matter_json(text: str) -> Optional[str]:
+    """
+    Parse front matter text and return its value as JSON.
+    
+    Results are kept as JSON so every caller gets its own copy. Returns
+    None if the value can't be stored as JSON, for example if it has dates.
+    Raises yaml.YAMLError if the text isn't valid YAML.
+    """
+    path = _front_matter_cache_path(text)
+    if path is not None:
+        try:
+            return path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            pass
+    
+    metadata = yaml.load(text, Loader=YAML_SAFE_LOADER)
+    try:
+        cached = json.dumps(metadata)
+    except (TypeError, ValueError):
+        return None
+    if json.loads(cached) != metadata:
+        # For example, non-string keys
+        return None
+    
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+                temp_file.write(cached)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+    return cached
+
+
+def _load_front_matter_yaml(text: str) -> Any:
+    """
+    Parse front matter text, using the caches when possible.
+    
+    Errors come from the pure-Python loader, whose messages show the
+    offending line, so they read the same with or without libyaml.
+    """
+    try:
+        cached = _front_matter_json(text)
+    except yaml.YAMLError:
+        return yaml.load(text, Loader=yaml.SafeLoader)
+    if cached is not None:
+        try:
+            return json.loads(cached)
+        except ValueError:
+            # A damaged file in the on-disk cache
+            pass
+    return yaml.load(text, Loader=YAML_SAFE_LOADER)
+
+
 def parse_front_matter_with_errors(content: str) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[int]]:
     """
     Extract and parse YAML front matter from markdown content with detailed error reporting.
@@ -42,10 +165,7 @@ def parse_front_matter_with_errors(content: str) -> Tuple[Optional[Dict[str, Any
         'No front matter found...'
     """
     # Check for front matter delimiters
-    # Spec: "---" must be at start of line (no leading whitespace)
-    # followed by optional whitespace and required newline
-    # Front matter is the text between the two delimiters
-    fm_match = re.match(r'^---[ \t]*\n(.*?)\n---[ \t]*\n?', content, re.DOTALL)
+    fm_match = FRONT_MATTER_PATTERN.match(content)
     
     if not fm_match:
         # Provide helpful guidance based on what we found
@@ -76,7 +196,7 @@ def parse_front_matter_with_errors(content: str) -> Tuple[Optional[Dict[str, Any
     
     # Try to parse YAML
     try:
-        metadata = yaml.safe_load(fm_match.group(1))
+        metadata = _load_front_matter_yaml(fm_match.group(1))
         return metadata, None, None
     except yaml.YAMLError as e:
         # Extract line number from YAML error if available
@@ -129,6 +249,112 @@ def parse_front_matter(content: str) -> Optional[Dict[str, Any]]:
     return metadata
 
 
+def front_matter_not_required(content: str) -> bool:
+    """
+    Check whether markdown content opts out of front matter in its first lines.
+    
+    Args:
+        content: Full markdown file content as string
+        
+    Returns:
+        True if the front matter not required comment is in the first
+        FRONT_MATTER_NOT_REQUIRED_LINES lines
+        
+    Example:
+        >>> front_matter_not_required("<!-- front matter not required -->\n# Notes")
+        True
+    """
+    first_lines = content.split('\n', FRONT_MATTER_NOT_REQUIRED_LINES)[:FRONT_MATTER_NOT_REQUIRED_LINES]
+    return any(FRONT_MATTER_NOT_REQUIRED in line.lower() for line in first_lines)
+
+
+def expand_markdown_paths(paths: List[str]) -> List[str]:
+    """
+    Expand files, directories, and glob patterns into markdown file paths.
+    
+    Directories are searched recursively for .md files, and patterns can
+    use ** to match any number of directories.
+    
+    Args:
+        paths: File paths, directory paths, or glob patterns
+        
+    Returns:
+        Sorted list of unique file paths. Paths that don't exist and don't
+        match anything are kept, so they're reported as unreadable.
+        
+    Example:
+        >>> expand_markdown_paths(['docs', 'assignments/**/*.md'])[:2]
+        ['assignments/code-example.md', 'assignments/test-files/code-examples/tasks_ref.md']
+    """
+    expanded = set()
+    for path in paths:
+        if Path(path).is_dir():
+            expanded.update(str(match) for match in Path(path).rglob('*.md'))
+        elif glob.has_magic(path):
+            expanded.update(glob.glob(path, recursive=True))
+        else:
+            expanded.add(path)
+    return sorted(expanded)
+
+
+def read_front_matter_text(filepath: Path) -> Optional[str]:
+    """
+    Read only the beginning of a markdown file that holds its front matter.
+    
+    Lines are read until the closing --- delimiter, or until it's clear
+    that the file doesn't start with front matter, and the rest of the file
+    isn't read. parse_front_matter_with_errors() returns the same metadata,
+    error messages, and line numbers for this text as for the whole file.
+    
+    Args:
+        filepath: Path to the markdown file
+        
+    Returns:
+        The beginning of the file as a string, or None if error occurred
+        
+    Example:
+        >>> from pathlib import Path
+        >>> header = read_front_matter_text(Path('docs/api/users-get-all-users.md'))
+        >>> metadata, error, line = parse_front_matter_with_errors(header)
+        >>> metadata['test']['local_database']
+        '/api/to-do-db-source-test.json'
+    
+    Note:
+        Errors are logged like read_markdown_file() does.
+    """
+    lines = []
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+            lines.append(first_line)
+            
+            if re.match(r'---[ \t]*\n', first_line):
+                # The closing delimiter is a later --- line, after at least
+                # one line of front matter
+                for line in f:
+                    lines.append(line)
+                    if len(lines) > 2 and FRONT_MATTER_CLOSING_PATTERN.match(line):
+                        break
+            else:
+                # Without an opening delimiter, the errors only depend on
+                # the leading whitespace and the first text after it
+                line = first_line
+                while line and not line.strip():
+                    line = f.readline()
+                    lines.append(line)
+    except FileNotFoundError:
+        print(f"Error: File not found: {filepath}")
+        return None
+    except UnicodeDecodeError as e:
+        print(f"Error: Unable to decode file {filepath}: {e}")
+        return None
+    except Exception as e:
+        print(f"Error reading file {filepath}: {e}")
+        return None
+    
+    return ''.join(lines)
+
+
 def read_markdown_file(filepath: Path) -> Optional[str]:
     """
     Read a markdown file with proper error handling.
@@ -278,7 +504,8 @@ def log(message: str,
     # Console output (always)
     label = labels.get(level, '')
     console_msg = f"{label}: {message}" if label else message
-    print(console_msg)
+    output = getattr(_log_output, 'buffer', None) or sys.stdout
+    print(console_msg, file=output)
     
     # GitHub Actions annotation output (conditional)
     if not use_actions:
@@ -314,4 +541,30 @@ def log(message: str,
         parts[0] += " " + ",".join(properties)
     
     parts.append(f"::{message}")
-    print("".join(parts))
+    print("".join(parts), file=output)
+
+
+@contextmanager
+def capture_log() -> Iterator[io.StringIO]:
+    """
+    Collect the log() output of the current thread instead of printing it.
+    
+    Lets tools that test several files at the same time print each file's
+    output in one piece, in file order. Output from other threads isn't
+    affected.
+    
+    Yields:
+        io.StringIO: Buffer with the captured output
+        
+    Example:
+        >>> with capture_log() as output:
+        ...     log("Testing file", "info")
+        >>> print(output.getvalue(), end='')
+        INFO: Testing file
+    """
+    previous = getattr(_log_output, 'buffer', None)
+    _log_output.buffer = io.StringIO()
+    try:
+        yield _log_output.buffer
+    finally:
+        _log_output.buffer = previous
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Long-lived process that runs the documentation tools without restarting Python.
+
+Starting Python and importing a tool and its dependencies (PyYAML,
+jsonschema, the compiled patterns and schema) takes about 100 ms, which
+adds up when a workflow runs a tool once per file. This daemon loads every
+tool in TOOLS once and runs them for clients that connect to its Unix
+socket, so a call only costs the tool's own work.
+
+Each request runs a tool's main() with the client's arguments, working
+directory, and environment. What the tool prints is sent to the client
+as it's printed, followed by its exit code. Requests are run one at a
+time, because tools print to the process's standard output and read its
+environment. Settings that modules read from the environment when
+they're imported (FRONT_MATTER_CACHE_DIR, WIKI_BASE) are applied from the
+client's environment for each request. Process pools that tools start
+use the fork start method, so workers can run functions of the tool
+modules the daemon loaded.
+
+The daemon stops when it has been idle for IDLE_TIMEOUT seconds, when it
+is asked to, or when a tool's source file changes, so edited tools are
+never run from stale code. doc-tools.py is the client and starts the
+daemon when it isn't running.
+
+Usage:
+    doc_tools_daemon.py [--socket PATH] [--idle-timeout SECONDS]
+
+Arguments:
+    --socket: Path of the Unix socket to listen on
+              Default: default_socket_path()
+    --idle-timeout: Seconds without requests before the daemon stops
+              Default: 900
+
+Protocol:
+    A client sends one JSON request and shuts down its side of the
+    connection, then reads newline-delimited JSON frames until the daemon
+    closes it. Output frames come as the tool prints, and the last frame
+    is the response.
+
+    Request: {"tool": "get-database-path", "args": ["docs/api/user.md"],
+              "cwd": "/path/to/repo", "env": {...}}
+             or {"command": "ping"} / {"command": "stop"}
+    Output frame: {"stream": "stdout", "text": "text"}
+    Response: {"exit_code": 0} or {"error": "message"}
+"""
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Callable
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# Tools the daemon can run, by script name without .py
+TOOLS = (
+    'get-database-path',
+    'get-test-configs',
+    'list-linter-exceptions',
+    'markdown-survey',
+    'test-api-docs',
+    'test-filenames',
+    'test-front-matter',
+    'validate-front-matter',
+)
+
+DEFAULT_IDLE_TIMEOUT = 900
+
+# Seconds a new daemon waits for a stopping daemon to let go of the socket
+LOCK_TIMEOUT = 5.0
+
+# Largest request accepted, in bytes
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+# Output held before it's sent to the client without waiting for a newline, in characters
+MAX_FRAME_SIZE = 64 * 1024
+
+
+def default_socket_path() -> str:
+    """
+    Socket path of the daemon for this user and tools directory.
+
+    Returns:
+        str: Path in the temporary directory, unique per user and checkout
+
+    Example:
+        >>> default_socket_path()
+        '/tmp/doc-tools-1000-3f2a9c1b7d4e.sock'
+    """
+    checkout = hashlib.sha256(str(TOOLS_DIR).encode('utf-8')).hexdigest()[:12]
+    return str(Path(tempfile.gettempdir()) / f"doc-tools-{os.getuid()}-{checkout}.sock")
+
+
+def source_snapshot() -> Dict[str, int]:
+    """Modification times of the tools' Python files, to notice edits."""
+    snapshot = {}
+    for path in TOOLS_DIR.glob('*.py'):
+        try:
+            snapshot[path.name] = path.stat().st_mtime_ns
+        except OSError:
+            pass
+    return snapshot
+
+
+def load_tool(name: str) -> Any:
+    """
+    Import a tool script as a module.
+
+    Args:
+        name: Tool name from TOOLS
+
+    Returns:
+        module: The tool's module, with its main() function
+    """
+    script = TOOLS_DIR / f"{name}.py"
+    module_name = 'doc_tool_' + name.replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Receives each piece of a tool's output: (stream name, text)
+OutputSink = Callable[[str, str], None]
+
+
+class _OutputStream(io.TextIOBase):
+    """Text stream that passes what's written to it to an output sink."""
+
+    def __init__(self, name: str, send: OutputSink):
+        self.name = name
+        self.send = send
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self.send(self.name, text)
+        return len(text)
+
+
+def _record_output(output: List[List[str]]) -> OutputSink:
+    """Output sink that records output in order, joining writes to the same stream."""
+    def record(stream: str, text: str) -> None:
+        if output and output[-1][0] == stream:
+            output[-1][1] += text
+        else:
+            output.append([stream, text])
+    return record
+
+
+class _FrameWriter:
+    """
+    Sends a tool's output to a client as newline-delimited JSON frames.
+
+    Output is sent a line at a time, so long runs show progress and their
+    output isn't held in memory. If the client goes away, the rest of the
+    output is dropped and the tool finishes.
+    """
+
+    def __init__(self, connection: socket.socket):
+        self.connection = connection
+        self.stream: Optional[str] = None
+        self.pending: List[str] = []
+        self.pending_size = 0
+        self.connected = True
+
+    def _send(self, frame: Dict[str, Any]) -> None:
+        if not self.connected:
+            return
+        try:
+            self.connection.sendall(json.dumps(frame).encode('utf-8') + b'\n')
+        except OSError:
+            # The client went away
+            self.connected = False
+
+    def flush(self) -> None:
+        """Send the output held so far."""
+        if self.pending:
+            self._send({'stream': self.stream, 'text': ''.join(self.pending)})
+            self.pending = []
+            self.pending_size = 0
+
+    def output(self, stream: str, text: str) -> None:
+        """Output sink for run_tool(); sends complete lines and keeps the rest."""
+        if stream != self.stream:
+            self.flush()
+            self.stream = stream
+        self.pending.append(text)
+        self.pending_size += len(text)
+        if '\n' in text or self.pending_size >= MAX_FRAME_SIZE:
+            self.flush()
+
+    def finish(self, response: Dict[str, Any]) -> None:
+        """Send the rest of the output and the response."""
+        self.flush()
+        self._send(response)
+
+
+def apply_environment_settings() -> None:
+    """
+    Apply the settings that modules read from the environment when imported.
+
+    The daemon imports the tools once, so these settings would otherwise
+    keep the values of the environment the daemon started in.
+    """
+    import doc_test_utils
+    import help_urls
+    doc_test_utils.set_front_matter_cache_dir(os.environ.get('FRONT_MATTER_CACHE_DIR') or None)
+    help_urls.set_wiki_base_url(os.environ.get('WIKI_BASE', help_urls.DEFAULT_WIKI_BASE_URL))
+
+
+@contextlib.contextmanager
+def _client_context(cwd: str, env: Dict[str, str]):
+    """Run with a client's working directory, environment, and settings, then restore ours."""
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_start_method = multiprocessing.get_start_method(allow_none=True)
+    try:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        apply_environment_settings()
+        # Workers of other start methods import modules by name, and the
+        # tools' modules can only be imported by path
+        if 'fork' in multiprocessing.get_all_start_methods():
+            multiprocessing.set_start_method('fork', force=True)
+        yield
+    finally:
+        multiprocessing.set_start_method(saved_start_method, force=True)
+        os.environ.clear()
+        os.environ.update(saved_env)
+        apply_environment_settings()
+        os.chdir(saved_cwd)
+
+
+def run_tool(
+    module: Any,
+    name: str,
+    args: List[str],
+    cwd: str,
+    env: Dict[str, str],
+    send: Optional[OutputSink] = None
+) -> Dict[str, Any]:
+    """
+    Run a loaded tool's main() like a command would.
+
+    Args:
+        module: Module from load_tool()
+        name: Tool name, used as the program name in messages
+        args: Command-line arguments
+        cwd: Working directory to run in
+        env: Environment variables to run with
+        send: Called with (stream, text) as the tool prints, or None to
+              return the output
+
+    Returns:
+        dict: exit_code, and without send, output: a list of [stream, text]
+        pairs
+    """
+    output: List[List[str]] = []
+    collect = send is None
+    if collect:
+        send = _record_output(output)
+    exit_code = 0
+    saved_argv = sys.argv
+    sys.argv = [str(TOOLS_DIR / f"{name}.py")] + list(args)
+    try:
+        with _client_context(cwd, env), \
+                contextlib.redirect_stdout(_OutputStream('stdout', send)), \
+                contextlib.redirect_stderr(_OutputStream('stderr', send)):
+            try:
+                module.main()
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except KeyboardInterrupt:
+                exit_code = 130
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    except OSError as e:
+        send('stderr', f"Error: Unable to run {name} in {cwd}: {e}\n")
+        exit_code = 1
+    finally:
+        sys.argv = saved_argv
+    if collect:
+        return {'exit_code': exit_code, 'output': output}
+    return {'exit_code': exit_code}
+
+
+class DocToolsDaemon:
+    """
+    Serves tool requests on a Unix socket.
+
+    Attributes:
+        socket_path: Path of the listening socket
+        idle_timeout: Seconds without requests before serve() returns
+        modules: Loaded tool modules, by tool name
+    """
+
+    def __init__(self, socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.modules: Dict[str, Any] = {}
+        self.snapshot = source_snapshot()
+        self.stopping = False
+        self.listener: Optional[socket.socket] = None
+
+    def load(self) -> None:
+        """Load every tool and the front matter schema before taking requests."""
+        for name in TOOLS:
+            self.modules[name] = load_tool(name)
+        try:
+            from schema_validator import get_compiled_schema, DEFAULT_SCHEMA_PATH
+            get_compiled_schema(str(TOOLS_DIR.parent / DEFAULT_SCHEMA_PATH))
+        except Exception:
+            # Tools load the schema themselves if it can't be loaded here
+            pass
+
+    def handle(self, request: Dict[str, Any], send: Optional[OutputSink] = None) -> Dict[str, Any]:
+        """
+        Answer one request.
+
+        Args:
+            request: Decoded request, see the module docstring
+            send: Output sink for the tool's output, see run_tool()
+
+        Returns:
+            dict: Response to send to the client
+        """
+        command = request.get('command')
+        if command == 'ping':
+            return {'pid': os.getpid(), 'tools': list(TOOLS)}
+        if command == 'stop':
+            self.stopping = True
+            return {'stopped': True}
+
+        name = request.get('tool')
+        if name not in self.modules:
+            return {'error': f"Unknown tool: {name}. Tools: {', '.join(TOOLS)}"}
+        if source_snapshot() != self.snapshot:
+            # Let the client start a daemon with the edited tools
+            self.stopping = True
+            return {'error': 'stale', 'restart': True}
+
+        return run_tool(self.modules[name], name, request.get('args', []),
+                        request.get('cwd') or os.getcwd(), request.get('env') or dict(os.environ), send)
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        """Read a request from a client, answer it, and close the connection."""
+        with connection:
+            chunks = []
+            size = 0
+            while True:
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_REQUEST_SIZE:
+                    return
+                chunks.append(chunk)
+            writer = _FrameWriter(connection)
+            try:
+                request = json.loads(b''.join(chunks).decode('utf-8'))
+                if isinstance(request, dict):
+                    response = self.handle(request, writer.output)
+                else:
+                    response = {'error': 'Invalid request'}
+            except (ValueError, UnicodeDecodeError):
+                response = {'error': 'Invalid request'}
+            if self.stopping:
+                # Stop listening first, so the client's next request starts a new daemon
+                self.close()
+            writer.finish(response)
+
+    def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+    def serve(self, listener: socket.socket) -> None:
+        """
+        Answer requests until idle, stopped, or stale.
+
+        Args:
+            listener: Bound and listening Unix socket
+        """
+        self.listener = listener
+        listener.settimeout(min(self.idle_timeout, 60))
+        last_request = time.monotonic()
+        while not self.stopping:
+            try:
+                connection, _ = listener.accept()
+            except socket.timeout:
+                if time.monotonic() - last_request >= self.idle_timeout:
+                    return
+                continue
+            connection.settimeout(None)
+            self._serve_connection(connection)
+            last_request = time.monotonic()
+
+
+def _bind(socket_path: str) -> Tuple[Optional[socket.socket], Optional[Any]]:
+    """
+    Take the daemon's lock and bind its socket.
+
+    Returns:
+        Tuple of (listener, lock_file), or (None, None) if another daemon
+        still owns the socket after LOCK_TIMEOUT seconds
+    """
+    lock_file = open(socket_path + '.lock', 'w')
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                lock_file.close()
+                return None, None
+            time.sleep(0.05)
+
+    # A socket file left by a daemon that didn't stop cleanly
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+    return listener, lock_file
+
+
+def main() -> None:
+    """Main entry point for the doc tools daemon."""
+    parser = argparse.ArgumentParser(
+        description='Run the documentation tools for clients of a Unix socket.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                             # Listen on the default socket
+  %(prog)s --idle-timeout 60           # Stop after a minute without requests
+
+Clients normally start the daemon with doc-tools.py.
+        """
+    )
+
+    parser.add_argument(
+        '--socket',
+        default=None,
+        metavar='PATH',
+        help='Path of the Unix socket to listen on (default: per user and checkout)'
+    )
+
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        metavar='SECONDS',
+        help=f'Seconds without requests before stopping (default: {DEFAULT_IDLE_TIMEOUT})'
+    )
+
+    args = parser.parse_args()
+    socket_path = args.socket or default_socket_path()
+
+    listener, lock_file = _bind(socket_path)
+    if listener is None:
+        print(f"A doc tools daemon is already using {socket_path}", file=sys.stderr)
+        sys.exit(0)
+
+    daemon = DocToolsDaemon(socket_path, args.idle_timeout)
+    try:
+        daemon.load()
+        daemon.serve(listener)
+    finally:
+        daemon.listener = listener
+        daemon.close()
+        lock_file.close()
+
+
+if __name__ == '__main__':
+    main()
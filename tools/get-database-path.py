@@ -26,7 +26,7 @@ from pathlib import Path
 from typing import Optional
 
 # Import shared utilities
-from doc_test_utils import read_markdown_file, parse_front_matter, get_test_config
+from doc_test_utils import read_front_matter_text, parse_front_matter, get_test_config
 
 
 def get_database_path(filepath: Path) -> Optional[str]:
@@ -44,8 +44,8 @@ def get_database_path(filepath: Path) -> Optional[str]:
         >>> path
         'api/to-do-db-source.json'
     """
-    # Read file
-    content = read_markdown_file(filepath)
+    # Read front matter
+    content = read_front_matter_text(filepath)
     if content is None:
         return None
     
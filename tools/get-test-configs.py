@@ -33,7 +33,7 @@ from typing import List, Dict, Tuple, Any
 
 # Import shared utilities
 from doc_test_utils import (
-    read_markdown_file,
+    read_front_matter_text,
     parse_front_matter,
     get_server_database_key
 )
@@ -61,8 +61,8 @@ def group_files_by_config(filepaths: List[Path]) -> Dict[Tuple, List[str]]:
     skipped_files = []
     
     for filepath in filepaths:
-        # Read and parse file
-        content = read_markdown_file(filepath)
+        # Read and parse front matter
+        content = read_front_matter_text(filepath)
         if content is None:
             skipped_files.append((str(filepath), "Unable to read file"))
             continue
@@ -18,27 +18,30 @@ Usage:
 
 import os
 
+# Default wiki URL, for local development
+DEFAULT_WIKI_BASE_URL = "https://github.com/UWC2-APIDOC/to-do-service-auto/wiki"
+
 # Base wiki URL - use environment variable if available, otherwise use default
-WIKI_BASE_URL = os.environ.get(
-    'WIKI_BASE',
-    "https://github.com/UWC2-APIDOC/to-do-service-auto/wiki"
-)
+WIKI_BASE_URL = os.environ.get('WIKI_BASE', DEFAULT_WIKI_BASE_URL)
 
-# Help page URLs
-HELP_URLS = {
+# Wiki page of each help topic
+HELP_PAGES = {
     # File and directory requirements
-    'file_locations': f"{WIKI_BASE_URL}/File-Locations",
+    'file_locations': "File-Locations",
     
     # Git and commit guidelines
-    'squashing_commits': f"{WIKI_BASE_URL}/Squashing-Commits",
-    'merge_commits': f"{WIKI_BASE_URL}/Avoiding-Merge-Commits",
-    'branch_update': f"{WIKI_BASE_URL}/Updating-Your-Branch",
+    'squashing_commits': "Squashing-Commits",
+    'merge_commits': "Avoiding-Merge-Commits",
+    'branch_update': "Updating-Your-Branch",
     
     # Documentation format requirements
-    'example_format': f"{WIKI_BASE_URL}/Example-Format",
-    'front_matter': f"{WIKI_BASE_URL}/Front-Matter-Format",
+    'example_format': "Example-Format",
+    'front_matter': "Front-Matter-Format",
 }
 
+# Help page URLs
+HELP_URLS = {topic: f"{WIKI_BASE_URL}/{page}" for topic, page in HELP_PAGES.items()}
+
 # For backward compatibility - direct access to individual URLs
 FILE_LOCATIONS_URL = HELP_URLS['file_locations']
 SQUASHING_COMMITS_URL = HELP_URLS['squashing_commits']
@@ -46,4 +49,25 @@ MERGE_COMMITS_URL = HELP_URLS['merge_commits']
 BRANCH_UPDATE_URL = HELP_URLS['branch_update']
 EXAMPLE_FORMAT_URL = HELP_URLS['example_format']
 FRONT_MATTER_URL = HELP_URLS['front_matter']
-# End of help_urls.py
\ No newline at end of file
+
+
+def set_wiki_base_url(base_url: str) -> None:
+    """
+    Point the help URLs at another wiki.
+    
+    HELP_URLS is updated in place, so modules that imported it see the
+    new URLs. Long-running processes use this to apply a new WIKI_BASE.
+    
+    Args:
+        base_url: Base URL for the wiki, like DEFAULT_WIKI_BASE_URL
+    """
+    global WIKI_BASE_URL, FILE_LOCATIONS_URL, SQUASHING_COMMITS_URL, MERGE_COMMITS_URL
+    global BRANCH_UPDATE_URL, EXAMPLE_FORMAT_URL, FRONT_MATTER_URL
+    WIKI_BASE_URL = base_url
+    HELP_URLS.update({topic: f"{base_url}/{page}" for topic, page in HELP_PAGES.items()})
+    FILE_LOCATIONS_URL = HELP_URLS['file_locations']
+    SQUASHING_COMMITS_URL = HELP_URLS['squashing_commits']
+    MERGE_COMMITS_URL = HELP_URLS['merge_commits']
+    BRANCH_UPDATE_URL = HELP_URLS['branch_update']
+    EXAMPLE_FORMAT_URL = HELP_URLS['example_format']
+    FRONT_MATTER_URL = HELP_URLS['front_matter']
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Compare JSON values and describe their differences.
+
+This module provides:
+- A type-strict equality check that stops at the first difference
+- Difference messages with paths like users[2].name
+- An optional limit on the number of differences to find
+- An optional order-insensitive mode that matches list items by id
+
+Subtrees that are equal are skipped without building their paths, and
+paths are only formatted when a difference is found, so comparing a large
+response that matches its documentation costs about as much as one ==.
+
+Values compare equal only if they have the same JSON types, so 1 and 1.0,
+or 1 and true, are different even though Python treats them as equal.
+
+Usage:
+    from json_diff import diff_json, json_equal
+
+    if not json_equal(actual, expected):
+        for difference in diff_json(actual, expected, limit=10):
+            print(difference)
+"""
+
+from typing import Optional, List, Any, Tuple
+
+# A path is built as (parent_path, key) pairs and formatted only when needed
+_Path = Optional[Tuple[Any, Any]]
+
+
+class _Item:
+    """Path key of a list item."""
+    __slots__ = ('label',)
+
+    def __init__(self, label: str):
+        self.label = label
+
+
+class _LimitReached(Exception):
+    """Raised to stop comparing once enough differences are found."""
+
+
+def _format_path(path: _Path) -> str:
+    """Format a path, for example users[2].name."""
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key.label}]" if isinstance(key, _Item) else f".{key}")
+    text = ''.join(reversed(parts))
+    return text[1:] if text.startswith('.') else text
+
+
+def json_equal(actual: Any, expected: Any) -> bool:
+    """
+    Check whether two JSON values are equal, including their types.
+
+    Args:
+        actual: The actual JSON value
+        expected: The expected JSON value
+
+    Returns:
+        bool: True if the values are equal and have the same types
+
+    Example:
+        >>> json_equal({"id": 1, "done": True}, {"id": 1, "done": True})
+        True
+        >>> json_equal({"id": 1}, {"id": 1.0})
+        False
+    """
+    if type(actual) is not type(expected):
+        return False
+    if isinstance(expected, dict):
+        if len(actual) != len(expected):
+            return False
+        for key, value in expected.items():
+            if key not in actual:
+                return False
+            other = actual[key]
+            # Same-type scalars, and identical subtrees, need no recursion
+            if other is value:
+                continue
+            if type(other) is type(value) and not isinstance(value, (dict, list)):
+                if other != value:
+                    return False
+            elif not json_equal(other, value):
+                return False
+        return True
+    if isinstance(expected, list):
+        if len(actual) != len(expected):
+            return False
+        for other, value in zip(actual, expected):
+            if other is value:
+                continue
+            if type(other) is type(value) and not isinstance(value, (dict, list)):
+                if other != value:
+                    return False
+            elif not json_equal(other, value):
+                return False
+        return True
+    return actual == expected
+
+
+def _keyed_items(items: List[Any], key: str) -> Optional[dict]:
+    """Map each item's key to its index, or None if the items can't be keyed."""
+    indexes = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or key not in item:
+            return None
+        item_key = item[key]
+        if isinstance(item_key, (dict, list)):
+            return None
+        # Keep 1 and "1" apart, like the comparison does
+        item_key = (type(item_key).__name__, item_key)
+        if item_key in indexes:
+            return None
+        indexes[item_key] = index
+    return indexes
+
+
+class _Differ:
+    """Collect the differences between two JSON values."""
+
+    def __init__(self, limit: Optional[int], list_key: Optional[str]):
+        self.limit = limit
+        self.list_key = list_key
+        self.differences: List[str] = []
+
+    def add(self, message: str) -> None:
+        self.differences.append(message)
+        if self.limit is not None and len(self.differences) >= self.limit:
+            raise _LimitReached()
+
+    def compare(self, actual: Any, expected: Any, path: _Path) -> None:
+        if json_equal(actual, expected):
+            return
+
+        if type(actual) is not type(expected):
+            self.add(f"Type mismatch at {_format_path(path) or 'root'}: "
+                     f"expected {type(expected).__name__}, got {type(actual).__name__}")
+        elif isinstance(expected, dict):
+            self.compare_dicts(actual, expected, path)
+        elif isinstance(expected, list):
+            self.compare_lists(actual, expected, path)
+        else:
+            self.add(f"Value mismatch at {_format_path(path) or 'root'}: expected {expected}, got {actual}")
+
+    def compare_dicts(self, actual: dict, expected: dict, path: _Path) -> None:
+        prefix = _format_path(path)
+        for key in expected:
+            if key not in actual:
+                self.add(f"Missing key at {prefix}.{key}" if prefix else f"Missing key: {key}")
+        for key in actual:
+            if key not in expected:
+                self.add(f"Extra key at {prefix}.{key}" if prefix else f"Extra key: {key}")
+        for key, value in expected.items():
+            if key in actual:
+                self.compare(actual[key], value, (path, key))
+
+    def compare_lists(self, actual: list, expected: list, path: _Path) -> None:
+        if self.list_key is not None and self.compare_keyed_lists(actual, expected, path):
+            return
+
+        if len(actual) != len(expected):
+            self.add(f"List length mismatch at {_format_path(path) or 'root'}: "
+                     f"expected {len(expected)} items, got {len(actual)}")
+        for index, (other, value) in enumerate(zip(actual, expected)):
+            self.compare(other, value, (path, _Item(str(index))))
+
+    def compare_keyed_lists(self, actual: list, expected: list, path: _Path) -> bool:
+        """Compare lists of records by key; return False if they can't be keyed."""
+        actual_indexes = _keyed_items(actual, self.list_key)
+        expected_indexes = _keyed_items(expected, self.list_key) if actual_indexes is not None else None
+        if expected_indexes is None:
+            return False
+
+        prefix = _format_path(path) or 'root'
+        for item_key in expected_indexes:
+            if item_key not in actual_indexes:
+                self.add(f"Missing item at {prefix}: {self.list_key} {item_key[1]}")
+        for item_key in actual_indexes:
+            if item_key not in expected_indexes:
+                self.add(f"Extra item at {prefix}: {self.list_key} {item_key[1]}")
+        for item_key, index in expected_indexes.items():
+            if item_key in actual_indexes:
+                label = f"{self.list_key}={item_key[1]}"
+                self.compare(actual[actual_indexes[item_key]], expected[index], (path, _Item(label)))
+        return True
+
+
+def diff_json(
+    actual: Any,
+    expected: Any,
+    limit: Optional[int] = None,
+    list_key: Optional[str] = None
+) -> List[str]:
+    """
+    Describe the differences between two JSON values.
+
+    Args:
+        actual: The actual JSON value
+        expected: The expected JSON value
+        limit: Stop after finding this many differences, or None to find all
+        list_key: Match the items of lists of records by this key, like 'id',
+                  instead of by position. Lists whose items don't all have
+                  a unique value for the key are compared by position.
+
+    Returns:
+        list: Difference messages, empty if the values are equal
+
+    Example:
+        >>> diff_json({"name": "Alice", "age": 30}, {"name": "Alice", "age": 25})
+        ['Value mismatch at age: expected 25, got 30']
+        >>> diff_json([{"id": 2}, {"id": 1}], [{"id": 1}, {"id": 2}], list_key='id')
+        []
+    """
+    differ = _Differ(limit, list_key)
+    try:
+        differ.compare(actual, expected, None)
+    except _LimitReached:
+        pass
+    return differ.differences
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Persisted index of the Vale and markdownlint exception tags in markdown files.
+
+This module provides:
+- A JSON index of each file's exceptions, keyed by path and content hash
+- Incremental updates that only rescan files whose content changed
+- Queries for the files that disable a rule
+- The exceptions a git diff adds
+
+A file is reused without being read when its size and modification time
+match the index, and without being rescanned when its SHA-256 matches.
+The index records how its files were scanned, so changing the scan mode
+rebuilds it.
+
+Usage:
+    from linter_exception_index import ExceptionIndex
+
+    index = ExceptionIndex('.cache/linter-exceptions.json', list_vale_exceptions)
+    index.load()
+    exceptions, errors = index.update(['docs/api/users.md'])
+    disabled = index.files_disabling('MD013')
+    index.save()
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Dict, Tuple, List, Any, Callable
+
+# Change to rebuild every index, for example when the entry format changes
+INDEX_VERSION = 1
+
+DEFAULT_INDEX_PATH = '.cache/linter-exceptions.json'
+
+LINTERS = ('vale', 'markdownlint')
+
+# Rules reported for tags that disable every rule of a linter
+GLOBAL_RULES = {
+    'vale': 'vale-off (global)',
+    'markdownlint': 'markdownlint-disable (global)',
+}
+
+# Exceptions of one file: {'vale': [...], 'markdownlint': [...]}
+Exceptions = Dict[str, List[Dict[str, Any]]]
+
+
+def rule_linter(rule: str) -> str:
+    """
+    Name the linter a rule belongs to.
+
+    Args:
+        rule: Rule name, like MD013 or Microsoft.Passive
+
+    Returns:
+        str: 'markdownlint' for MD### rules, otherwise 'vale'
+    """
+    if len(rule) == 5 and rule.startswith('MD') and rule[2:].isdigit():
+        return 'markdownlint'
+    return 'vale'
+
+
+class ExceptionIndex:
+    """
+    Exceptions of markdown files, stored in a JSON file.
+
+    Attributes:
+        path: Index file path
+        scan: Function that lists the exceptions of a file's content
+        scan_mode: Name of how scan finds exceptions, stored in the index
+        files: Index entries by file path
+        scanned: Number of files scanned by update()
+        reused: Number of files update() took from the index
+    """
+
+    def __init__(self, path: str, scan: Callable[[str], Exceptions], scan_mode: str = 'lines'):
+        self.path = path
+        self.scan = scan
+        self.scan_mode = scan_mode
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.scanned = 0
+        self.reused = 0
+
+    def load(self) -> None:
+        """Load the index file; a missing, damaged, or outdated index starts empty."""
+        self.files = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return
+        if (isinstance(data, dict) and data.get('version') == INDEX_VERSION
+                and data.get('scan_mode') == self.scan_mode and isinstance(data.get('files'), dict)):
+            self.files = data['files']
+
+    def save(self) -> bool:
+        """
+        Write the index file.
+
+        The index is written to a temporary file and renamed into place,
+        so readers never see a partial index.
+
+        Returns:
+            bool: True if the index was written
+        """
+        index_path = Path(self.path)
+        data = {'version': INDEX_VERSION, 'scan_mode': self.scan_mode, 'files': self.files}
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=index_path.parent, suffix='.tmp')
+            with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+                json.dump(data, temp_file, indent=1, sort_keys=True)
+            os.replace(temp_path, index_path)
+        except OSError:
+            return False
+        return True
+
+    def update_file(self, file_path: str) -> Tuple[Optional[Exceptions], Optional[str]]:
+        """
+        Get a file's exceptions, rescanning it only if its content changed.
+
+        Args:
+            file_path: Path to the markdown file
+
+        Returns:
+            Tuple of (exceptions, error_message); exceptions is None if the
+            file can't be read, and it's removed from the index
+        """
+        key = os.path.normpath(file_path)
+        entry = self.files.get(key)
+        try:
+            stat = os.stat(file_path)
+            if entry is not None and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                self.reused += 1
+                return entry['exceptions'], None
+
+            with open(file_path, 'rb') as markdown_file:
+                data = markdown_file.read()
+            sha256 = hashlib.sha256(data).hexdigest()
+            if entry is not None and entry['sha256'] == sha256:
+                self.reused += 1
+                exceptions = entry['exceptions']
+            else:
+                self.scanned += 1
+                # Newlines are translated like read_markdown_file() does
+                text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                exceptions = self.scan(text)
+        except FileNotFoundError:
+            self.files.pop(key, None)
+            return None, f"File not found: {file_path}"
+        except UnicodeDecodeError as e:
+            self.files.pop(key, None)
+            return None, f"Unable to decode file {file_path}: {e}"
+        except OSError as e:
+            self.files.pop(key, None)
+            return None, f"Error reading file {file_path}: {e}"
+
+        self.files[key] = {
+            'sha256': sha256,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'exceptions': exceptions,
+        }
+        return exceptions, None
+
+    def update(self, file_paths: List[str]) -> Tuple[Dict[str, Exceptions], Dict[str, str]]:
+        """
+        Bring the index up to date for some files.
+
+        Entries of files that no longer exist are removed as well.
+
+        Args:
+            file_paths: Paths to the markdown files
+
+        Returns:
+            Tuple of (exceptions by path, error messages by path)
+        """
+        results = {}
+        errors = {}
+        for file_path in file_paths:
+            exceptions, error = self.update_file(file_path)
+            if exceptions is None:
+                errors[file_path] = error
+            else:
+                results[file_path] = exceptions
+
+        for key in [key for key in self.files if not os.path.exists(key)]:
+            del self.files[key]
+        return results, errors
+
+    def files_disabling(self, rule: str, file_paths: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the exceptions that disable a rule, including global disables.
+
+        Args:
+            rule: Rule name, like MD013 or Microsoft.Passive
+            file_paths: Only look in these files, or None for the whole index
+
+        Returns:
+            List of exceptions with 'file' and 'linter' added, by file and line
+
+        Example:
+            >>> [e['file'] for e in index.files_disabling('MD013')]
+            ['docs/api/users.md']
+        """
+        linter = rule_linter(rule)
+        keys = sorted(self.files) if file_paths is None else sorted(
+            {os.path.normpath(path) for path in file_paths} & set(self.files))
+        found = []
+        for key in keys:
+            for exception in self.files[key]['exceptions'][linter]:
+                if exception['rule'] in (rule, GLOBAL_RULES[linter]):
+                    found.append(dict(exception, file=key, linter=linter))
+        return found
+
+    def new_exceptions(
+        self,
+        base_ref: str,
+        file_paths: List[str]
+    ) -> Tuple[Optional[Dict[str, Exceptions]], Optional[str]]:
+        """
+        Find the exceptions that changes since a git revision add.
+
+        Only files that differ from base_ref, including uncommitted
+        changes and untracked files, are scanned. An exception is new if its file has more
+        tags with the same linter, rule, and line text than the file had
+        at base_ref, so moved tags aren't reported. Renamed files are
+        compared with their old content.
+
+        Args:
+            base_ref: Git revision to compare with, like origin/main
+            file_paths: Files to look at
+
+        Returns:
+            Tuple of (new exceptions by path, error_message); only files
+            with new exceptions are included
+        """
+        changed, error = _changed_files(base_ref)
+        if changed is None:
+            return None, error
+
+        new = {}
+        for file_path in file_paths:
+            key = os.path.normpath(file_path)
+            if key not in changed:
+                continue
+            exceptions, _ = self.update_file(file_path)
+            if exceptions is None:
+                continue
+
+            old_path = changed[key]
+            old_exceptions = {linter: [] for linter in LINTERS}
+            if old_path is not None:
+                result = subprocess.run(['git', 'show', f"{base_ref}:./{old_path}"],
+                                        capture_output=True)
+                if result.returncode == 0:
+                    old_exceptions = self.scan(result.stdout.decode('utf-8', errors='replace'))
+
+            added = {}
+            for linter in LINTERS:
+                remaining = Counter((e['rule'], e['full_match']) for e in old_exceptions[linter])
+                added[linter] = []
+                for exception in exceptions[linter]:
+                    tag = (exception['rule'], exception['full_match'])
+                    if remaining[tag] > 0:
+                        remaining[tag] -= 1
+                    else:
+                        added[linter].append(exception)
+            if added['vale'] or added['markdownlint']:
+                new[file_path] = added
+        return new, None
+
+
+def _changed_files(base_ref: str) -> Tuple[Optional[Dict[str, Optional[str]]], Optional[str]]:
+    """
+    List the files that differ from a git revision.
+
+    Returns:
+        Tuple of ({path: path at base_ref, or None if added}, error_message);
+        paths are relative to the working directory
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--name-status', '--relative', '-M', '-z', base_ref, '--'],
+            capture_output=True,
+            text=True
+        )
+    except OSError as e:
+        return None, f"Unable to run git: {e}"
+    if result.returncode != 0:
+        return None, f"Unable to compare with {base_ref}: {result.stderr.strip()}"
+
+    changed = {}
+    fields = result.stdout.split('\0')
+    index = 0
+    while index < len(fields) - 1:
+        status = fields[index]
+        if status.startswith(('R', 'C')):
+            old_path, new_path = fields[index + 1], fields[index + 2]
+            changed[os.path.normpath(new_path)] = old_path
+            index += 3
+            continue
+        path = fields[index + 1]
+        if not status.startswith('D'):
+            changed[os.path.normpath(path)] = None if status.startswith('A') else path
+        index += 2
+
+    result = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard', '-z'],
+                            capture_output=True, text=True)
+    if result.returncode == 0:
+        for path in result.stdout.split('\0'):
+            if path:
+                changed[os.path.normpath(path)] = None
+    return changed, None
@@ -3,7 +3,15 @@
 Scan Markdown files for Vale and markdownlint exception tags.
 
 Usage:
-    list-linter-exceptions.py <file1> [file2 ...] [--action LEVEL]
+    list-linter-exceptions.py <file1> [file2 ...] [--action LEVEL] [--multiline]
+                              [--index [FILE]]
+    list-linter-exceptions.py [path ...] --rule RULE [--index FILE]
+    list-linter-exceptions.py [path ...] --new-since REF [--index FILE]
+
+With --index, exceptions are kept in an index file, and only files whose
+content changed since the last run are scanned again. The --rule and
+--new-since queries always use the index. Their paths can be files,
+directories, or glob patterns, and default to docs and assignments.
 
 Examples:
     # Single file
@@ -18,6 +26,15 @@ Examples:
     # GitHub Actions mode (level required)
     list-linter-exceptions.py docs/*.md --action warning
     list-linter-exceptions.py docs/*.md --action error
+    
+    # Also find tags in HTML comments that span several lines
+    list-linter-exceptions.py docs/*.md --multiline
+    
+    # Files that disable a rule
+    list-linter-exceptions.py --rule MD013
+    
+    # Exceptions added since the base branch, as annotations
+    list-linter-exceptions.py docs --new-since origin/main --action warning
 
 Note: Does not test front matter sections.
 """
@@ -28,10 +45,43 @@ import argparse
 from pathlib import Path
 
 # Import shared utilities
-from doc_test_utils import read_markdown_file, log
+from doc_test_utils import read_markdown_file, log, expand_markdown_paths
+from linter_exception_index import ExceptionIndex, DEFAULT_INDEX_PATH
+
+DEFAULT_PATHS = ['docs', 'assignments']
+
+
+# Comment opener every exception tag starts with
+COMMENT_OPENER = '<!--'
+
+# Every exception tag, in one pattern:
+# - Vale specific rule: <!-- vale RuleName = NO -->
+# - Vale global disable: <!-- vale off -->
+# - Markdownlint specific rule: <!-- markdownlint-disable MD### -->
+# - Markdownlint global disable: <!-- markdownlint-disable -->
+EXCEPTION_PATTERN = re.compile(
+    r'<!--\s*(?:'
+    r'vale\s+(?:(?P<vale_rule>[A-Za-z0-9.]+)\s*=\s*NO|(?P<vale_off>off))'
+    r'|markdownlint-disable(?:\s+(?P<markdownlint_rule>MD\d{3}))?'
+    r')\s*-->'
+)
 
+# Kinds of exception tags, in the order they're listed for a line
+VALE_SPECIFIC, VALE_GLOBAL, MARKDOWNLINT_SPECIFIC, MARKDOWNLINT_GLOBAL = range(4)
 
-def list_vale_exceptions(content):
+
+def _exception_kind(match):
+    """Return the (kind, linter, rule) of an EXCEPTION_PATTERN match."""
+    if match.group('vale_rule') is not None:
+        return VALE_SPECIFIC, 'vale', match.group('vale_rule')
+    if match.group('vale_off') is not None:
+        return VALE_GLOBAL, 'vale', 'vale-off (global)'
+    if match.group('markdownlint_rule') is not None:
+        return MARKDOWNLINT_SPECIFIC, 'markdownlint', match.group('markdownlint_rule')
+    return MARKDOWNLINT_GLOBAL, 'markdownlint', 'markdownlint-disable (global)'
+
+
+def list_vale_exceptions(content, multiline=False):
     """
     Scan for Vale and markdownlint exception tags.
     
@@ -41,8 +91,14 @@ def list_vale_exceptions(content):
     - Markdownlint specific rules: <!-- markdownlint-disable MD### -->
     - Markdownlint global disable: <!-- markdownlint-disable -->
     
+    Only lines with a comment opener are matched against the patterns.
+    The first tag of each kind on a line is listed, in the order above.
+    
     Args:
         content: Markdown file content as string
+        multiline: Also find tags whose HTML comment spans several lines.
+                   These are listed at the line the comment starts on,
+                   with their whitespace collapsed in full_match.
     
     Returns:
         dict: {
@@ -55,57 +111,51 @@ def list_vale_exceptions(content):
         'markdownlint': []
     }
     
-    # Patterns
-    # Vale: <!-- vale RuleName = NO --> (specific rule)
-    vale_specific_pattern = r'<!--\s*vale\s+([A-Za-z0-9.]+)\s*=\s*NO\s*-->'
-    
-    # Vale: <!-- vale off --> (global disable)
-    vale_global_pattern = r'<!--\s*vale\s+off\s*-->'
-    
-    # Markdownlint: <!-- markdownlint-disable MD### --> (specific rule)
-    markdown_specific_pattern = r'<!--\s*markdownlint-disable\s+(MD\d{3})\s*-->'
-    
-    # Markdownlint: <!-- markdownlint-disable --> (global disable)
-    markdown_global_pattern = r'<!--\s*markdownlint-disable\s*-->'
+    if COMMENT_OPENER not in content:
+        return exceptions
     
-    lines = content.split('\n')
-    
-    for line_num, line in enumerate(lines, start=1):
-        # Check for Vale specific rule exceptions
-        vale_specific_match = re.search(vale_specific_pattern, line)
-        if vale_specific_match:
-            exceptions['vale'].append({
-                'line': line_num,
-                'rule': vale_specific_match.group(1),
-                'full_match': line.strip()
-            })
-        
-        # Check for Vale global disable
-        vale_global_match = re.search(vale_global_pattern, line)
-        if vale_global_match:
-            exceptions['vale'].append({
-                'line': line_num,
-                'rule': 'vale-off (global)',
-                'full_match': line.strip()
-            })
-        
-        # Check for markdownlint specific rule exceptions
-        md_specific_match = re.search(markdown_specific_pattern, line)
-        if md_specific_match:
-            exceptions['markdownlint'].append({
-                'line': line_num,
-                'rule': md_specific_match.group(1),
-                'full_match': line.strip()
-            })
-        
-        # Check for markdownlint global disable
-        md_global_match = re.search(markdown_global_pattern, line)
-        if md_global_match:
-            exceptions['markdownlint'].append({
-                'line': line_num,
-                'rule': 'markdownlint-disable (global)',
-                'full_match': line.strip()
-            })
+    # Find the comments to match: each line with an opener, or the whole content
+    if multiline:
+        scans = [(0, content)]
+    else:
+        scans = []
+        start = content.find(COMMENT_OPENER)
+        while start != -1:
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            scans.append((line_start, content[line_start:line_end]))
+            start = content.find(COMMENT_OPENER, line_end)
+    
+    # First tag of each kind on each line, by line number
+    found = {}
+    line_num = 1
+    counted_to = 0
+    for offset, text in scans:
+        for match in EXCEPTION_PATTERN.finditer(text):
+            start = offset + match.start()
+            line_num += content.count('\n', counted_to, start)
+            counted_to = start
+            kind, linter, rule = _exception_kind(match)
+            
+            kinds = found.setdefault(line_num, {})
+            if kind in kinds:
+                continue
+            
+            tag = match.group(0)
+            if '\n' in tag:
+                full_match = ' '.join(tag.split())
+            else:
+                line_start = content.rfind('\n', 0, start) + 1
+                line_end = content.find('\n', start)
+                full_match = content[line_start:line_end if line_end != -1 else len(content)].strip()
+            kinds[kind] = (linter, {'line': line_num, 'rule': rule, 'full_match': full_match})
+    
+    for line_num in sorted(found):
+        for kind in sorted(found[line_num]):
+            linter, exception = found[line_num][kind]
+            exceptions[linter].append(exception)
     
     return exceptions
 
@@ -200,6 +250,56 @@ def output_action(filepath, exceptions, action_level):
             action_level)
 
 
+def query_rule(index, rule, paths, use_actions, action_level):
+    """Report the exceptions that disable a rule; return the exit code."""
+    file_paths = expand_markdown_paths(paths)
+    _, errors = index.update(file_paths)
+    for file_path, error in errors.items():
+        log(error, "error", file_path, None, use_actions, action_level)
+    
+    found = index.files_disabling(rule, file_paths)
+    for exc in found:
+        if use_actions:
+            log(f"{exc['rule']} disables {rule}",
+                "notice",
+                exc['file'],
+                exc['line'],
+                True,
+                action_level)
+        else:
+            log(f"  {exc['file']}:{exc['line']}: {exc['rule']}", "info")
+    
+    files = len({exc['file'] for exc in found})
+    log(f"{len(found)} exception(s) in {files} file(s) disable {rule}", "info")
+    return 1 if errors else 0
+
+
+def query_new(index, base_ref, paths, use_actions, action_level):
+    """Report the exceptions added since a git revision; return the exit code."""
+    new, error = index.new_exceptions(base_ref, expand_markdown_paths(paths))
+    if new is None:
+        log(error, "error")
+        return 1
+    
+    total = 0
+    for file_path, exceptions in new.items():
+        for linter, label in (('vale', 'Vale'), ('markdownlint', 'Markdownlint')):
+            for exc in exceptions[linter]:
+                total += 1
+                log(f"New {label} exception: {exc['rule']}",
+                    "warning",
+                    file_path,
+                    exc['line'],
+                    use_actions,
+                    action_level)
+    
+    if total:
+        log(f"Found {total} new exception(s) in {len(new)} file(s) since {base_ref}", "info")
+    else:
+        log(f"No new exceptions since {base_ref}", "success")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Scan Markdown files for Vale and markdownlint exception tags.',
@@ -211,12 +311,16 @@ Examples:
   %(prog)s docs/*.md                         # Glob expansion (shell)
   %(prog)s docs/*.md --action warning        # GitHub Actions mode
   %(prog)s docs/*.md --action error          # Only error annotations
+  %(prog)s docs/*.md --multiline             # Include multi-line comments
+  %(prog)s docs/*.md --index                 # Only rescan changed files
+  %(prog)s --rule MD013                      # Files that disable MD013
+  %(prog)s docs --new-since origin/main      # Exceptions added since main
         """
     )
     
     parser.add_argument(
         'files',
-        nargs='+',
+        nargs='*',
         type=str,
         help='Path(s) to the Markdown file(s) to scan'
     )
@@ -231,16 +335,66 @@ Examples:
         help='Output GitHub Actions annotations at specified level (all, warning, error)'
     )
     
+    parser.add_argument(
+        '--multiline', '-m',
+        action='store_true',
+        help='Also find exception tags in HTML comments that span several lines'
+    )
+    
+    parser.add_argument(
+        '--index',
+        nargs='?',
+        const=DEFAULT_INDEX_PATH,
+        default=None,
+        metavar='FILE',
+        help=f'Keep exceptions in an index file and only rescan changed files (default: {DEFAULT_INDEX_PATH})'
+    )
+    
+    parser.add_argument(
+        '--rule',
+        default=None,
+        help='List the exceptions that disable RULE, like MD013 or Microsoft.Passive'
+    )
+    
+    parser.add_argument(
+        '--new-since',
+        default=None,
+        metavar='REF',
+        help='List the exceptions added since git revision REF'
+    )
+    
     args = parser.parse_args()
     
+    if args.rule and args.new_since:
+        parser.error('--rule and --new-since can\'t be used together')
+    if not args.files and not (args.rule or args.new_since):
+        parser.error('the following arguments are required: files')
+    
+    use_actions = args.action is not None
+    action_level = args.action or 'warning'
+    
+    index = None
+    if args.index or args.rule or args.new_since:
+        index = ExceptionIndex(args.index or DEFAULT_INDEX_PATH,
+                               lambda content: list_vale_exceptions(content, args.multiline),
+                               'multiline' if args.multiline else 'lines')
+        index.load()
+    
+    if args.rule or args.new_since:
+        paths = args.files or DEFAULT_PATHS
+        if args.rule:
+            exit_code = query_rule(index, args.rule, paths, use_actions, action_level)
+        else:
+            exit_code = query_new(index, args.new_since, paths, use_actions, action_level)
+        if not index.save():
+            log(f"Could not write index {index.path}", "warning")
+        sys.exit(exit_code)
+    
     # Track overall status
     all_exceptions = {'vale': [], 'markdownlint': []}
     failed_files = []
     total_files = len(args.files)
     
-    use_actions = args.action is not None
-    action_level = args.action or 'warning'
-    
     # Progress message
     if total_files > 1:
         log(f"Scanning {total_files} file(s) for linter exceptions...", "info")
@@ -253,9 +407,16 @@ Examples:
         if total_files > 1:
             log(f"[{idx}/{total_files}] Processing {filepath.name}", "info")
         
-        # Read file using shared utility
-        content = read_markdown_file(filepath)
-        if content is None:
+        # Read and scan the file, or take its exceptions from the index
+        if index is not None:
+            exceptions, error = index.update_file(filename)
+            if error:
+                print(f"Error: {error}")
+        else:
+            content = read_markdown_file(filepath)
+            exceptions = None if content is None else list_vale_exceptions(content, args.multiline)
+        
+        if exceptions is None:
             failed_files.append(str(filepath))
             log(f"Failed to read {filepath}",
                 "error",
@@ -265,9 +426,6 @@ Examples:
                 action_level)
             continue
         
-        # Scan for exceptions
-        exceptions = list_vale_exceptions(content)
-        
         # Output results for this file
         if args.action:
             output_action(filepath, exceptions, action_level)
@@ -294,6 +452,9 @@ Examples:
                 True,
                 action_level)
     
+    if index is not None and not index.save():
+        log(f"Could not write index {index.path}", "warning")
+    
     # Exit with error if any files failed
     if failed_files:
         log(f"Failed to process {len(failed_files)} file(s)", "error")
@@ -3,7 +3,8 @@
 Count unique markdown notation patterns in files.
 
 Usage:
-    markdown-survey.py <file1> [file2 ...] [--action LEVEL]
+    markdown-survey.py <file1> [file2 ...] [--action LEVEL] [--jobs N]
+                       [--output FORMAT]
 
 This tool analyzes markdown files to count:
 - Words (excluding code, HTML, and markdown notation)
@@ -23,16 +24,45 @@ Examples:
     # GitHub Actions mode (level required)
     markdown-survey.py docs/*.md --action warning
     markdown-survey.py docs/*.md --action all
+    
+    # Whole tree on 4 processes, as JSON
+    markdown-survey.py docs/**/*.md --jobs 4 --output json
 """
 
 import sys
+import io
 import re
+import json
 import argparse
+import contextlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Dict, Any
 
 from doc_test_utils import read_markdown_file, log
 
 
+# Text removed before counting words, in order
+FENCED_CODE_PATTERN = re.compile(r'```.*?```', re.DOTALL)
+INLINE_CODE_PATTERN = re.compile(r'`[^`]+`')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+
+# Markdown notation characters, replaced with spaces before counting words
+NOTATION_CHARACTER_PATTERN = re.compile(r'[#*_~`\[\]()>|+-]')
+
+# Notations that need more than a character check, matched against one line
+ITALIC_ASTERISK_PATTERN = re.compile(r'(?<!\*)\*(?!\*)')
+ITALIC_UNDERSCORE_PATTERN = re.compile(r'(?<!_)_(?!_)')
+IMAGE_NOTATION_PATTERN = re.compile(r'!\[.*?\]\(.*?\)')
+LINK_NOTATION_PATTERN = re.compile(r'(?<!!)\[.*?\]\(.*?\)')
+ORDERED_LIST_PATTERN = re.compile(r'\s*\d+\.\s')
+
+HEADING_NOTATIONS = ['heading_1', 'heading_2', 'heading_3', 'heading_4', 'heading_5', 'heading_6']
+
+
 def count_words(content: str) -> int:
     """
     Count words in markdown content, excluding code blocks and HTML.
@@ -44,6 +74,9 @@ def count_words(content: str) -> int:
     4. Remove markdown notation characters
     5. Split on whitespace and count non-empty tokens
     
+    Each removal is skipped if the content doesn't have the characters
+    it starts with.
+    
     Args:
         content: Full markdown file content as string
         
@@ -55,28 +88,33 @@ def count_words(content: str) -> int:
         >>> count_words(content)
         5
     """
+    text = content
+    
     # Remove fenced code blocks
-    text = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+    if '```' in text:
+        text = FENCED_CODE_PATTERN.sub('', text)
     
     # Remove inline code
-    text = re.sub(r'`[^`]+`', '', text)
+    if '`' in text:
+        text = INLINE_CODE_PATTERN.sub('', text)
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    if '<' in text:
+        text = HTML_TAG_PATTERN.sub('', text)
     
     # Remove image syntax entirely (must be before link removal)
-    text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', text)
+    if '![' in text:
+        text = IMAGE_PATTERN.sub('', text)
     
     # Remove URLs from links but keep link text
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    if '](' in text:
+        text = LINK_PATTERN.sub(r'\1', text)
     
     # Remove markdown notation characters
-    text = re.sub(r'[#*_~`\[\]()>|+-]', ' ', text)
+    text = NOTATION_CHARACTER_PATTERN.sub(' ', text)
     
-    # Split and count non-empty words
-    words = [w for w in text.split() if w.strip()]
-    
-    return len(words)
+    # Split and count words; split() never returns empty words
+    return len(text.split())
 
 
 def list_markdown_notations(content: str) -> list:
@@ -88,6 +126,17 @@ def list_markdown_notations(content: str) -> list:
     - Lists have proper spacing
     - Horizontal rules are on their own lines
     
+    Each line is checked once for every notation, in this order:
+    heading_1 to heading_6 (# followed by whitespace), bold_asterisk (**),
+    bold_underscore (__), italic_asterisk (a lone *), italic_underscore
+    (a lone _), code_block (```), inline_code (`), image (![...](...)),
+    link ([...](...) not after !), blockquote (> followed by whitespace),
+    unordered_list (-, *, or + after optional indent, then whitespace),
+    ordered_list (digits and a period after optional indent, then
+    whitespace), horizontal_rule (a line of only 3 or more *, -, or _),
+    strikethrough (~~), and table_pipe (|). Most checks are substring
+    tests; the rest use a compiled pattern only when a line could match.
+    
     Args:
         content: Full markdown file content as string
         
@@ -102,56 +151,163 @@ def list_markdown_notations(content: str) -> list:
         >>> 'bold_asterisk' in notations
         True
     """
-    patterns = {
-        # Headings (1-6 levels) - must have space after
-        r'^#\s': 'heading_1',
-        r'^##\s': 'heading_2',
-        r'^###\s': 'heading_3',
-        r'^####\s': 'heading_4',
-        r'^#####\s': 'heading_5',
-        r'^######\s': 'heading_6',
+    found_notations = []
+    add = found_notations.append
+    
+    for line in content.split('\n'):
+        if not line:
+            continue
+        first = line[0]
         
-        # Bold
-        r'\*\*': 'bold_asterisk',
-        r'__': 'bold_underscore',
+        # Headings (1-6 levels) - must have whitespace after
+        if first == '#':
+            level = len(line) - len(line.lstrip('#'))
+            if level <= 6 and level < len(line) and line[level].isspace():
+                add(HEADING_NOTATIONS[level - 1])
         
-        # Italic
-        r'(?<!\*)\*(?!\*)': 'italic_asterisk',
-        r'(?<!_)_(?!_)': 'italic_underscore',
+        # Bold and italic
+        if '**' in line:
+            add('bold_asterisk')
+        if '__' in line:
+            add('bold_underscore')
+        if '*' in line and ITALIC_ASTERISK_PATTERN.search(line):
+            add('italic_asterisk')
+        if '_' in line and ITALIC_UNDERSCORE_PATTERN.search(line):
+            add('italic_underscore')
         
         # Code
-        r'```': 'code_block',
-        r'`': 'inline_code',
+        if '`' in line:
+            if '```' in line:
+                add('code_block')
+            add('inline_code')
         
         # Links and images
-        r'!\[.*?\]\(.*?\)': 'image',
-        r'(?<!!)\[.*?\]\(.*?\)': 'link',
+        if '](' in line:
+            if '![' in line and IMAGE_NOTATION_PATTERN.search(line):
+                add('image')
+            if LINK_NOTATION_PATTERN.search(line):
+                add('link')
         
-        # Blockquote - must have space after >
-        r'^>\s': 'blockquote',
+        # Blockquote - must have whitespace after >
+        if first == '>' and len(line) > 1 and line[1].isspace():
+            add('blockquote')
         
-        # Lists - markdownlint requires space after marker
-        r'^\s*[-*+]\s': 'unordered_list',
-        r'^\s*\d+\.\s': 'ordered_list',
+        # Lists - markdownlint requires whitespace after marker
+        stripped = line.lstrip() if first.isspace() else line
+        if stripped:
+            marker = stripped[0]
+            if marker in '-*+' and len(stripped) > 1 and stripped[1].isspace():
+                add('unordered_list')
+            if marker.isdecimal() and ORDERED_LIST_PATTERN.match(line):
+                add('ordered_list')
         
         # Horizontal rule - must be on own line
-        r'^(\*{3,}|-{3,}|_{3,})$': 'horizontal_rule',
+        if first in '*-_' and len(line) >= 3 and line == first * len(line):
+            add('horizontal_rule')
         
-        # Strikethrough
-        r'~~': 'strikethrough',
+        # Strikethrough and tables
+        if '~~' in line:
+            add('strikethrough')
+        if '|' in line:
+            add('table_pipe')
+    
+    return found_notations
+
+
+def survey_file(filename: str) -> Dict[str, Any]:
+    """
+    Count the words and notations of one file.
+    
+    Runs in worker processes, so it returns counts instead of logging.
+    
+    Args:
+        filename: Path to the markdown file
+        
+    Returns:
+        dict: file, and either words and notations (a Counter of
+              notation names), or error with the read error message
         
-        # Tables
-        r'\|': 'table_pipe',
+    Example:
+        >>> result = survey_file('README.md')
+        >>> result['words'] > 0 and 'heading_1' in result['notations']
+        True
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        content = read_markdown_file(Path(filename))
+    if content is None:
+        return {'file': filename, 'error': output.getvalue()}
+    
+    return {
+        'file': filename,
+        'words': count_words(content),
+        'notations': Counter(list_markdown_notations(content)),
     }
+
+
+def survey_files(filenames: List[str], jobs: int = 1) -> List[Dict[str, Any]]:
+    """
+    Survey files, on a process pool if jobs is more than 1.
     
-    found_notations = []
+    Args:
+        filenames: Paths to the markdown files
+        jobs: Number of processes to use
+        
+    Returns:
+        List of survey_file() results, in the order of filenames
+    """
+    workers = min(jobs, len(filenames))
+    if workers <= 1:
+        return [survey_file(filename) for filename in filenames]
     
-    for line in content.split('\n'):
-        for pattern, notation_name in patterns.items():
-            if re.search(pattern, line, re.MULTILINE):
-                found_notations.append(notation_name)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(filenames) // (workers * 4))
+        return list(executor.map(survey_file, filenames, chunksize=chunksize))
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add up the counts of surveyed files.
     
-    return found_notations
+    Args:
+        results: Results from survey_files()
+        
+    Returns:
+        dict: Numbers of files, failed files, words, and markdown_symbols,
+              and notations, the total of each notation
+    """
+    notations: Counter = Counter()
+    words = 0
+    failed = 0
+    for result in results:
+        if 'error' in result:
+            failed += 1
+            continue
+        words += result['words']
+        notations.update(result['notations'])
+    return {
+        'files': len(results) - failed,
+        'failed': failed,
+        'words': words,
+        'markdown_symbols': sum(notations.values()),
+        'notations': dict(sorted(notations.items())),
+    }
+
+
+def survey_json(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the JSON output of a survey."""
+    files = []
+    for result in results:
+        if 'error' in result:
+            files.append({'file': result['file'], 'error': result['error'].strip()})
+        else:
+            files.append({
+                'file': result['file'],
+                'words': result['words'],
+                'markdown_symbols': sum(result['notations'].values()),
+                'notations': dict(sorted(result['notations'].items())),
+            })
+    return {'files': files, 'summary': summarize(results)}
 
 
 def main():
@@ -166,6 +322,7 @@ Examples:
   %(prog)s docs/*.md                         # Glob expansion (shell)
   %(prog)s docs/*.md --action warning        # GitHub Actions mode
   %(prog)s docs/*.md --action all            # All annotations
+  %(prog)s docs/*.md --jobs 4 --output json  # 4 processes, JSON output
         """
     )
     
@@ -186,17 +343,33 @@ Examples:
         help='Output GitHub Actions annotations at specified level (all, warning, error)'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of processes to survey files with (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--output',
+        default='text',
+        choices=['text', 'json'],
+        help='Output format: text (default) or json'
+    )
+    
     args = parser.parse_args()
     
-    # Track overall status and aggregates
-    failed_files = []
-    total_files = len(args.files)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
+    results = survey_files(args.files, args.jobs)
     
-    # Aggregates across all files
-    total_words = 0
-    total_notations = 0
-    all_unique_notations = set()
+    if args.output == 'json':
+        print(json.dumps(survey_json(results), indent=2))
+        sys.exit(1 if any('error' in result for result in results) else 0)
     
+    total_files = len(args.files)
     use_actions = args.action is not None
     action_level = args.action or 'warning'
     
@@ -204,18 +377,16 @@ Examples:
     if total_files > 1:
         log(f"Analyzing {total_files} markdown file(s)...", "info")
     
-    # Process each file
-    for idx, filename in enumerate(args.files, 1):
-        filepath = Path(filename)
+    # Report each file
+    for idx, result in enumerate(results, 1):
+        filepath = Path(result['file'])
         
         # Progress indicator for multiple files
         if total_files > 1:
             log(f"[{idx}/{total_files}] Processing {filepath.name}", "info")
         
-        # Read file using shared utility
-        content = read_markdown_file(filepath)
-        if content is None:
-            failed_files.append(str(filepath))
+        if 'error' in result:
+            print(result['error'], end='')
             log(f"Failed to read {filepath}",
                 "error",
                 str(filepath),
@@ -224,41 +395,36 @@ Examples:
                 action_level)
             continue
         
-        # Count words and notations for this file
-        word_count = count_words(content)
-        markdown_notations = list_markdown_notations(content)
-        markdown_notation_count = len(markdown_notations)
-        unique_notations = set(markdown_notations)
-        unique_notation_count = len(unique_notations)
-        unique_notation_list = ', '.join(sorted(unique_notations))
+        notations = result['notations']
+        markdown_notation_count = sum(notations.values())
+        unique_notation_list = ', '.join(sorted(notations))
         
         # Format output message for this file
-        message = (f"{filepath.name}: {word_count} words, "
+        message = (f"{filepath.name}: {result['words']} words, "
                    f"{markdown_notation_count} markdown_symbols, "
-                   f"{unique_notation_count} unique_codes: {unique_notation_list}")
+                   f"{len(notations)} unique_codes: {unique_notation_list}")
         
         # Output results for this file
         if use_actions:
             log(message, "notice", str(filepath), None, True, action_level)
         else:
             log(message, "info")
-        
-        # Aggregate for summary
-        total_words += word_count
-        total_notations += markdown_notation_count
-        all_unique_notations.update(unique_notations)
+    
+    summary = summarize(results)
     
     # Final summary for multiple files
     if total_files > 1:
-        files_processed = total_files - len(failed_files)
-        all_unique_count = len(all_unique_notations)
-        all_unique_list = ', '.join(sorted(all_unique_notations))
+        files_processed = summary['files']
+        total_words = summary['words']
+        total_notations = summary['markdown_symbols']
+        all_unique_count = len(summary['notations'])
+        all_unique_list = ', '.join(summary['notations'])
         
-        summary = (f"Summary: {files_processed} files, {total_words} total words, "
-                   f"{total_notations} total markdown_symbols, "
-                   f"{all_unique_count} unique_codes across all files: {all_unique_list}")
+        summary_message = (f"Summary: {files_processed} files, {total_words} total words, "
+                           f"{total_notations} total markdown_symbols, "
+                           f"{all_unique_count} unique_codes across all files: {all_unique_list}")
         
-        log(summary, "info")
+        log(summary_message, "info")
         
         if use_actions and action_level == 'all':
             log(f"Analyzed {files_processed} files: {total_words} words, {total_notations} symbols",
@@ -269,8 +435,8 @@ Examples:
                 action_level)
     
     # Exit with error if any files failed
-    if failed_files:
-        log(f"Failed to process {len(failed_files)} file(s)", "error")
+    if summary['failed']:
+        log(f"Failed to process {summary['failed']} file(s)", "error")
         sys.exit(1)
     
     sys.exit(0)
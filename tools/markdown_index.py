@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Single-pass index of headings and fenced code blocks in a markdown file.
+
+This module provides:
+- Tokenizing markdown content once into headings and fenced code blocks
+- Line numbers for every heading and code block
+- Constant-time lookup of example request and response sections by name
+
+Example names are matched the way test-api-docs.py always has: the heading
+must be a level 3 or 4 heading that starts with the example name, followed by
+"request" or "response". Matching ignores case and backticks around words,
+so "GET example" finds "### `GET` example request".
+
+Usage:
+    from markdown_index import MarkdownIndex
+
+    index = MarkdownIndex(content)
+    block = index.find_code_block('GET example', 'request')
+    if block:
+        print(f"Request on line {block.line}: {block.text}")
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple, List
+
+# Heading levels that can hold example sections
+EXAMPLE_HEADING_LEVELS = (3, 4)
+
+# Code block languages that hold each kind of example section
+EXAMPLE_LANGUAGES = {
+    'request': ('bash', 'sh'),
+    'response': ('json',),
+}
+
+
+@dataclass
+class Heading:
+    """
+    A markdown heading.
+
+    Attributes:
+        level: Number of leading # characters
+        text: Heading text after the # characters
+        line: 1-based line number of the heading
+    """
+    level: int
+    text: str
+    line: int
+
+
+@dataclass
+class CodeBlock:
+    """
+    A fenced code block.
+
+    Attributes:
+        info: Info string after the opening fence (for example 'bash')
+        text: Content between the fences
+        line: 1-based line number of the opening fence
+    """
+    info: str
+    text: str
+    line: int
+
+
+def normalize_example_name(name: str) -> str:
+    """
+    Normalize an example name or heading prefix for lookup.
+
+    Backticks around words are removed, whitespace is collapsed, and the
+    text is lowercased.
+
+    Args:
+        name: Example name or heading text
+
+    Returns:
+        str: Normalized name
+
+    Example:
+        >>> normalize_example_name('`GET`  Example')
+        'get example'
+    """
+    return ' '.join(word.strip('`') for word in name.split()).lower()
+
+
+class MarkdownIndex:
+    """
+    Headings and fenced code blocks of a markdown document, tokenized once.
+
+    Example:
+        >>> index = MarkdownIndex("### GET example request\\n```bash\\ncurl localhost\\n```\\n")
+        >>> index.find_code_block('GET example', 'request').text
+        'curl localhost'
+    """
+
+    def __init__(self, content: str):
+        self.headings: List[Heading] = []
+        self.code_blocks: List[CodeBlock] = []
+        # Index of the first code block after each heading
+        self._first_block_after: List[int] = []
+        # (normalized example name, 'request' or 'response') -> heading index
+        self._examples: Dict[Tuple[str, str], int] = {}
+        self._tokenize(content)
+
+    def _tokenize(self, content: str) -> None:
+        """Split content into headings and code blocks in one pass."""
+        fence_info: Optional[str] = None
+        fence_length = 0
+        fence_line = 0
+        fence_lines: List[str] = []
+
+        for line_number, line in enumerate(content.split('\n'), start=1):
+            stripped = line.strip()
+
+            if fence_info is not None:
+                # A fence closes with at least as many backticks as it opened with
+                if stripped.startswith('`' * fence_length) and not stripped.strip('`'):
+                    self.code_blocks.append(CodeBlock(fence_info, '\n'.join(fence_lines), fence_line))
+                    fence_info = None
+                else:
+                    fence_lines.append(line)
+                continue
+
+            if stripped.startswith('```'):
+                fence_length = len(stripped) - len(stripped.lstrip('`'))
+                fence_info = stripped[fence_length:].strip()
+                fence_line = line_number
+                fence_lines = []
+                continue
+
+            if line.startswith('#'):
+                level = len(line) - len(line.lstrip('#'))
+                text = line[level:]
+                self.headings.append(Heading(level, text.strip(), line_number))
+                self._first_block_after.append(len(self.code_blocks))
+                if level in EXAMPLE_HEADING_LEVELS and text[:1].isspace():
+                    self._register_example(text, len(self.headings) - 1)
+
+        # An unclosed fence runs to the end of the document
+        if fence_info is not None:
+            self.code_blocks.append(CodeBlock(fence_info, '\n'.join(fence_lines), fence_line))
+
+    def _register_example(self, text: str, heading_index: int) -> None:
+        """Record the example names a heading can be found by."""
+        words = [word.strip('`').lower() for word in text.split()]
+        for position in range(1, len(words)):
+            for kind in EXAMPLE_LANGUAGES:
+                if words[position].startswith(kind):
+                    # The first heading for a name wins, as in a top-down search
+                    self._examples.setdefault((' '.join(words[:position]), kind), heading_index)
+
+    def find_heading(self, example_name: str, kind: str) -> Optional[Heading]:
+        """
+        Find the heading of an example's request or response section.
+
+        Args:
+            example_name: Example name from the testable list
+            kind: 'request' or 'response'
+
+        Returns:
+            Heading, or None if the document has no such section
+        """
+        heading_index = self._examples.get((normalize_example_name(example_name), kind))
+        if heading_index is None:
+            return None
+        return self.headings[heading_index]
+
+    def find_code_block(self, example_name: str, kind: str) -> Optional[CodeBlock]:
+        """
+        Find the code block of an example's request or response section.
+
+        The code block is the first one in the section, before the next
+        heading, whose language matches the kind of section: bash or sh
+        for requests and json for responses.
+
+        Args:
+            example_name: Example name from the testable list
+            kind: 'request' or 'response'
+
+        Returns:
+            CodeBlock, or None if the section or its code block is missing
+
+        Example:
+            >>> index = MarkdownIndex(content)
+            >>> block = index.find_code_block('GET example', 'response')
+            >>> block.line
+            42
+        """
+        heading_index = self._examples.get((normalize_example_name(example_name), kind))
+        if heading_index is None:
+            return None
+
+        first = self._first_block_after[heading_index]
+        if heading_index + 1 < len(self.headings):
+            end = self._first_block_after[heading_index + 1]
+        else:
+            end = len(self.code_blocks)
+
+        languages = EXAMPLE_LANGUAGES[kind]
+        for block in self.code_blocks[first:end]:
+            if block.info.startswith(languages):
+                return block
+        return None
@@ -0,0 +1,800 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for json-server 0.17 serving the To-Do service database.
+
+Serves the collections of a database file the way json-server@0.17.4 does,
+so documentation examples can be tested without Node or json-server:
+
+    GET    /users, /tasks                 List records (filters, sort, paging)
+    GET    /users/{id}, /tasks/{id}       Get one record
+    POST   /users, /tasks                 Create a record
+    PUT    /users/{id}, /tasks/{id}       Replace a record
+    PATCH  /users/{id}, /tasks/{id}       Update a record
+    DELETE /users/{id}, /tasks/{id}       Delete a record and its dependents
+    GET    /users/{id}/tasks              Nested list (tasks with that userId)
+    POST   /users/{id}/tasks              Nested create (sets userId)
+    GET    /db                            The whole database
+
+Any collection in the database file is served the same way. List queries
+support json-server's field filters (name=value, name_gte, name_lte,
+name_ne, name_like), full-text q, _sort/_order, _page/_limit, _start/_end,
+_embed, and _expand, with X-Total-Count and Link headers.
+
+Collections are kept in memory with an index by id and an index on every
+foreign key field (fields ending in "Id", like userId), so record lookups,
+foreign key filters, and cascading deletes don't scan whole collections.
+Changes are not written back to the database file.
+
+For test runs, POST /__reset replaces the whole database with the JSON
+object in the request body, or reloads the database file if the body is
+empty, in a single request.
+
+Usage:
+    mock_service.py DATABASE_FILE [--port PORT] [--host HOST]
+
+Examples:
+    mock_service.py api/to-do-db-source.json
+    mock_service.py api/to-do-db-source-test.json --port 3001
+"""
+
+import argparse
+import copy
+import json
+import re
+import secrets
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, Tuple, List, Set, Any
+from urllib.parse import urlsplit, parse_qs, unquote
+
+DEFAULT_HOST = 'localhost'
+DEFAULT_PORT = 3000
+
+# Path of the test-only route that replaces the whole database
+RESET_PATH = '/__reset'
+
+# json-server's default page size when _page is given without _limit
+DEFAULT_PAGE_SIZE = 10
+
+# Query parameters that control the list instead of filtering it
+_LIST_PARAMETERS = {'q', '_start', '_end', '_page', '_sort', '_order', '_limit',
+                    '_embed', '_expand', 'callback', '_'}
+
+_FILTER_SUFFIX = re.compile(r'(_lte|_gte|_ne|_like)$')
+
+# Prefix for the keys of records that have no id and can't be addressed
+_NO_ID_PREFIX = '\0'
+
+_HOME_PAGE = '<!DOCTYPE html><html><body><h1>To-Do service mock</h1></body></html>'
+
+
+def js_string(value: Any) -> str:
+    """
+    Convert a JSON value to a string the way JavaScript's toString() does.
+
+    json-server compares ids and query filters as strings, so 1, 1.0, and
+    "1" all match the query value "1".
+
+    Example:
+        >>> js_string(True), js_string(2.0), js_string([1, 'a'])
+        ('true', '2', '1,a')
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, list):
+        return ','.join('' if item is None else js_string(item) for item in value)
+    if isinstance(value, dict):
+        return '[object Object]'
+    return str(value)
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for JSON numbers (not booleans)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _get_path(record: Any, path: str) -> Any:
+    """Get a value by dotted path, like lodash _.get(record, 'a.b')."""
+    value = record
+    for part in path.split('.'):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+def _deep_query(value: Any, text: str) -> bool:
+    """Full-text match for q=, like json-server's deepQuery."""
+    if not value:
+        return False
+    if isinstance(value, list):
+        return any(_deep_query(item, text) for item in value)
+    if isinstance(value, dict):
+        return any(_deep_query(item, text) for item in value.values())
+    return text.lower() in js_string(value).lower()
+
+
+def _range_match(query: str, value: Any, lower_bound: bool) -> bool:
+    """Compare like JavaScript's <= between a query string and a field value."""
+    if _is_number(value):
+        try:
+            query_value: Any = float(query)
+        except ValueError:
+            return False
+    else:
+        query_value, value = query, js_string(value)
+    return query_value <= value if lower_bound else query_value >= value
+
+
+def _sort_key(record: Any, path: str) -> Tuple[int, int, Any]:
+    """Sort key for _sort: numbers, then strings, then other values, then missing."""
+    value = _get_path(record, path)
+    if value is None:
+        return (1, 0, 0)
+    if _is_number(value):
+        return (0, 0, value)
+    if isinstance(value, str):
+        return (0, 1, value)
+    return (0, 2, json.dumps(value, sort_keys=True))
+
+
+def _foreign_key(collection_name: str) -> str:
+    """Foreign key that refers to a collection, for example users -> userId."""
+    singular = collection_name[:-1] if collection_name.endswith('s') else collection_name
+    return f"{singular}Id"
+
+
+class MockCollection:
+    """
+    Records of one collection, indexed by id and by foreign key fields.
+
+    Records are kept in a dict keyed by the id's string form, which keeps
+    them in collection order. Each foreign key index maps a field value's
+    string form to the keys of the records with that value. Records moved
+    into a bucket by an update are put back in collection order when the
+    bucket is next read. The largest numeric id is kept for create_id().
+    """
+
+    def __init__(self, name: str, records: List[Any]):
+        self.name = name
+        self.records: Dict[str, Any] = {}
+        self.indexes: Dict[str, Dict[str, Dict[str, None]]] = {}
+        # Position of each record in the collection, to order index buckets
+        self.positions: Dict[str, int] = {}
+        self._next_position = 0
+        # Buckets, as (field, value), with keys out of collection order
+        self._unordered: Set[Tuple[str, str]] = set()
+        self._numeric_ids = 0
+        self._other_ids = 0
+        # Largest numeric id, or None if it must be found again
+        self._max_id: Any = None
+        for record in records:
+            key = self._key(record)
+            if key in self.records:
+                # A repeated id replaces the earlier record in its place
+                position = self.positions[key]
+                self._forget(key, self.records[key])
+                self._add(key, record, position)
+            else:
+                self._add(key, record)
+
+    def _key(self, record: Any) -> str:
+        """Key a record is stored under."""
+        if isinstance(record, dict) and record.get('id') is not None:
+            return js_string(record['id'])
+        return f"{_NO_ID_PREFIX}{self._next_position}"
+
+    def _add(self, key: str, record: Any, position: Optional[int] = None) -> None:
+        """Store a record at the end of the collection, or at a position it had, and index it."""
+        self.records[key] = record
+        if position is None:
+            position = self._next_position
+            self._next_position += 1
+        self.positions[key] = position
+        self._index(key, record)
+        if key.startswith(_NO_ID_PREFIX):
+            return
+        if _is_number(record['id']):
+            self._numeric_ids += 1
+            if self._numeric_ids == 1 or (self._max_id is not None and record['id'] > self._max_id):
+                self._max_id = record['id']
+        else:
+            self._other_ids += 1
+
+    def _forget(self, key: str, record: Any) -> None:
+        """Drop a stored record from the indexes and id counts."""
+        self.positions.pop(key, None)
+        self._unindex(key, record)
+        if key.startswith(_NO_ID_PREFIX):
+            return
+        if _is_number(record['id']):
+            self._numeric_ids -= 1
+            if record['id'] == self._max_id:
+                self._max_id = None
+        else:
+            self._other_ids -= 1
+
+    def _index(self, key: str, record: Any) -> None:
+        """Add a record to the foreign key indexes."""
+        if not isinstance(record, dict):
+            return
+        for field, value in record.items():
+            if field.endswith('Id') and value is not None:
+                self._add_to_bucket(field, js_string(value), key)
+
+    def _unindex(self, key: str, record: Any) -> None:
+        """Remove a record from the foreign key indexes."""
+        if not isinstance(record, dict):
+            return
+        for field, value in record.items():
+            if field.endswith('Id') and value is not None:
+                self.indexes.get(field, {}).get(js_string(value), {}).pop(key, None)
+
+    def _add_to_bucket(self, field: str, value: str, key: str) -> None:
+        """Add a record's key to an index bucket, noting if it's out of order."""
+        bucket = self.indexes.setdefault(field, {}).setdefault(value, {})
+        if bucket and self.positions[next(reversed(bucket))] > self.positions[key]:
+            self._unordered.add((field, value))
+        bucket[key] = None
+
+    def _reindex(self, key: str, old: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Update the index entries of the foreign keys a changed record changed."""
+        for field in set(old) | set(new):
+            if not field.endswith('Id'):
+                continue
+            old_value, new_value = old.get(field), new.get(field)
+            if old_value is not None and new_value is not None and js_string(old_value) == js_string(new_value):
+                continue
+            if old_value is not None:
+                self.indexes[field][js_string(old_value)].pop(key, None)
+            if new_value is not None:
+                self._add_to_bucket(field, js_string(new_value), key)
+
+    def get(self, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Get a record by id, compared as strings like json-server."""
+        return self.records.get(js_string(record_id))
+
+    def find(self, field: str, value: str) -> Optional[List[Any]]:
+        """
+        Records whose foreign key field has a value, in collection order.
+
+        Returns None if the field isn't indexed.
+        """
+        if not field.endswith('Id'):
+            return None
+        bucket = self.indexes.get(field, {}).get(value, {})
+        if (field, value) in self._unordered:
+            self._unordered.discard((field, value))
+            bucket = dict.fromkeys(sorted(bucket, key=self.positions.__getitem__))
+            self.indexes[field][value] = bucket
+        return [self.records[key] for key in bucket]
+
+    def create_id(self) -> Any:
+        """Next id: one more than the largest numeric id, like json-server."""
+        if self._other_ids:
+            return secrets.token_urlsafe(5)[:7]
+        if not self._numeric_ids:
+            return 1
+        if self._max_id is None:
+            # The largest id was removed
+            self._max_id = max(record['id'] for key, record in self.records.items()
+                               if not key.startswith(_NO_ID_PREFIX))
+        return self._max_id + 1
+
+    def insert(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append a record, giving it an id if it has none. None if the id is taken."""
+        if record.get('id') is None:
+            record['id'] = self.create_id()
+        key = js_string(record['id'])
+        if key in self.records:
+            return None
+        self._add(key, record)
+        return record
+
+    def replace(self, record_id: Any, attributes: Dict[str, Any], merge: bool) -> Optional[Dict[str, Any]]:
+        """Replace (PUT) or update (PATCH) a record, keeping its id."""
+        key = js_string(record_id)
+        old = self.records.get(key)
+        if old is None:
+            return None
+        new = dict(old) if merge else {}
+        new.update(attributes)
+        new['id'] = old['id']
+        self.records[key] = new
+        self._reindex(key, old, new)
+        return new
+
+    def remove(self, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Remove a record by id and return it."""
+        key = js_string(record_id)
+        record = self.records.pop(key, None)
+        if record is not None:
+            self._forget(key, record)
+        return record
+
+
+class MockDatabase:
+    """
+    json-server 0.17 request handling over in-memory collections.
+
+    Top-level lists in the database are collections; other top-level values
+    are served as single resources (GET, PUT, PATCH).
+
+    Example:
+        >>> db = MockDatabase({'users': [{'id': 1, 'firstName': 'Ann'}], 'tasks': []})
+        >>> status, headers, payload = db.handle_request('GET', '/users/1')
+        >>> status, payload
+        (200, {'id': 1, 'firstName': 'Ann'})
+    """
+
+    def __init__(self, data: Dict[str, Any], source_path: Optional[str] = None):
+        self.source_path = source_path
+        self.lock = threading.Lock()
+        self.collections: Dict[str, MockCollection] = {}
+        self.singulars: Dict[str, Any] = {}
+        self.load(data)
+
+    @classmethod
+    def from_file(cls, db_path: str) -> 'MockDatabase':
+        """Load a database file. Raises OSError or ValueError if it can't be read."""
+        data = json.loads(Path(db_path).read_text(encoding='utf-8'))
+        if not isinstance(data, dict):
+            raise ValueError(f"Database {db_path} must be a JSON object of collections")
+        return cls(data, db_path)
+
+    def load(self, data: Dict[str, Any]) -> None:
+        """Replace the whole database."""
+        data = copy.deepcopy(data)
+        self.collections = {name: MockCollection(name, value)
+                            for name, value in data.items() if isinstance(value, list)}
+        self.singulars = {name: value for name, value in data.items() if not isinstance(value, list)}
+        self._order = list(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The whole database, in file order."""
+        result = {}
+        for name in self._order:
+            if name in self.collections:
+                result[name] = list(self.collections[name].records.values())
+            else:
+                result[name] = self.singulars[name]
+        return result
+
+    def _remove_dependents(self, name: str, record_id: Any) -> None:
+        """Delete records whose foreign key refers to a deleted record, recursively."""
+        field = _foreign_key(name)
+        for collection in self.collections.values():
+            dependents = collection.find(field, js_string(record_id)) or []
+            for dependent in dependents:
+                removed = collection.remove(dependent.get('id'))
+                if removed is not None:
+                    self._remove_dependents(collection.name, removed['id'])
+
+    def _list(
+        self,
+        collection: MockCollection,
+        query: Dict[str, List[str]],
+        full_url: str
+    ) -> Tuple[List[Tuple[str, str]], List[Any]]:
+        """GET a collection with json-server's query parameters."""
+        headers: List[Tuple[str, str]] = []
+        filters = [(key, values) for key, values in query.items() if key not in _LIST_PARAMETERS]
+
+        # Start from a foreign key index when a filter allows it
+        records = None
+        for key, values in filters:
+            if len(values) == 1:
+                records = collection.find(key, values[0])
+                if records is not None:
+                    break
+        if records is None:
+            records = list(collection.records.values())
+
+        text = query.get('q', [''])[-1]
+        if text:
+            records = [r for r in records
+                       if isinstance(r, dict) and any(_deep_query(v, text) for v in r.values())]
+
+        for key, values in filters:
+            suffix_match = _FILTER_SUFFIX.search(key)
+            suffix = suffix_match.group(1) if suffix_match else ''
+            path = key[:len(key) - len(suffix)]
+            records = [r for r in records if self._matches(_get_path(r, path), values, suffix)]
+
+        sort = query.get('_sort', [''])[-1]
+        if sort:
+            orders = [o.lower() for o in query.get('_order', [''])[-1].split(',')]
+            fields = sort.split(',')
+            # Stable sorts from the last field to the first
+            for position in range(len(fields) - 1, -1, -1):
+                descending = position < len(orders) and orders[position] == 'desc'
+                records = sorted(records, key=lambda r: _sort_key(r, fields[position]),
+                                 reverse=descending)
+
+        page = query.get('_page', [''])[-1]
+        start = query.get('_start', [''])[-1]
+        end = query.get('_end', [''])[-1]
+        limit = query.get('_limit', [''])[-1]
+
+        if end or limit or page:
+            headers.append(('X-Total-Count', str(len(records))))
+            headers.append(('Access-Control-Expose-Headers', 'X-Total-Count, Link' if page else 'X-Total-Count'))
+
+        if page:
+            records, links = self._page(records, _parse_int(page, 1), _parse_int(limit, 0) or DEFAULT_PAGE_SIZE,
+                                        full_url)
+            if links:
+                headers.append(('Link', links))
+        elif end:
+            records = records[max(_parse_int(start, 0), 0):_parse_int(end, 0)]
+        elif limit:
+            first = max(_parse_int(start, 0), 0)
+            records = records[first:first + _parse_int(limit, 0)]
+
+        embed = query.get('_embed', [])
+        expand = query.get('_expand', [])
+        if embed or expand:
+            records = [self._embed_expand(collection.name, r, embed, expand) for r in records]
+        return headers, records
+
+    @staticmethod
+    def _matches(value: Any, queries: List[str], suffix: str) -> bool:
+        """Apply one filter parameter to a field value, like json-server."""
+        if value is None:
+            return False
+        if suffix == '_ne':
+            return all(query != js_string(value) for query in queries)
+        for query in queries:
+            if suffix in ('_gte', '_lte'):
+                matched = _range_match(query, value, suffix == '_gte')
+            elif suffix == '_like':
+                try:
+                    matched = re.search(query, js_string(value), re.IGNORECASE) is not None
+                except re.error:
+                    matched = False
+            else:
+                matched = query == js_string(value)
+            if matched:
+                return True
+        return False
+
+    @staticmethod
+    def _page(
+        records: List[Any],
+        page: int,
+        per_page: int,
+        full_url: str
+    ) -> Tuple[List[Any], str]:
+        """Slice out one page and build the Link header, like json-server."""
+        page = max(page, 1)
+        items = records[(page - 1) * per_page:page * per_page]
+        if not items:
+            return items, ''
+
+        links: List[Tuple[str, int]] = []
+        if len(items) != len(records):
+            last = -(-len(records) // per_page)
+            links.append(('first', 1))
+            if page > 1:
+                links.append(('prev', page - 1))
+            if page * per_page < len(records):
+                links.append(('next', page + 1))
+            links.append(('last', last))
+        link_header = ', '.join(
+            f'<{full_url.replace(f"page={page}", f"page={number}", 1)}>; rel="{rel}"'
+            for rel, number in links
+        )
+        return items, link_header
+
+    def _embed_expand(self, name: str, record: Any, embed: List[str], expand: List[str]) -> Any:
+        """Copy a record with _embed children and _expand parents added."""
+        if not isinstance(record, dict):
+            return record
+        result = copy.deepcopy(record)
+        for child in embed:
+            children = self.collections.get(child)
+            if children is not None:
+                matches = children.find(_foreign_key(name), js_string(record.get('id'))) or []
+                result[child] = [copy.deepcopy(c) for c in matches
+                                 if c.get(_foreign_key(name)) == record.get('id')]
+        for parent in expand:
+            parents = self.collections.get(f"{parent}s")
+            if parents is not None and f"{parent}Id" in record:
+                found = parents.get(record[f"{parent}Id"])
+                if found is not None:
+                    result[parent] = copy.deepcopy(found)
+        return result
+
+    def handle_request(
+        self,
+        method: str,
+        target: str,
+        body: Optional[Any] = None,
+        host: str = f"{DEFAULT_HOST}:{DEFAULT_PORT}"
+    ) -> Tuple[int, List[Tuple[str, str]], Any]:
+        """
+        Handle one request.
+
+        Args:
+            method: HTTP method
+            target: Request path and query string
+            body: Parsed request body, or None
+            host: Host header, used to build Link URLs
+
+        Returns:
+            tuple: (status_code, headers, payload), where payload is a JSON
+                   value, or a string for non-JSON responses
+        """
+        url = urlsplit(target)
+        query = parse_qs(url.query, keep_blank_values=True)
+        parts = [unquote(part) for part in url.path.split('/') if part]
+
+        with self.lock:
+            if method == 'POST' and url.path == RESET_PATH:
+                return self._reset(body)
+            if not parts and method == 'GET':
+                return 200, [], _HOME_PAGE
+            if parts == ['db'] and method == 'GET':
+                return 200, [], self.to_dict()
+
+            # Nested routes: /users/1/tasks -> /tasks?userId=1
+            if len(parts) == 3 and parts[0] in self.collections and parts[2] in self.collections:
+                field = _foreign_key(parts[0])
+                if method == 'GET':
+                    query[field] = [parts[1]]
+                    return self._route(method, [parts[2]], query, body, host, target)
+                if method == 'POST' and isinstance(body, dict):
+                    parent = self.collections[parts[0]].get(parts[1])
+                    body = dict(body)
+                    body[field] = parent['id'] if parent is not None else parts[1]
+                    return self._route(method, [parts[2]], query, body, host, target)
+
+            return self._route(method, parts, query, body, host, target)
+
+    def _route(
+        self,
+        method: str,
+        parts: List[str],
+        query: Dict[str, List[str]],
+        body: Optional[Any],
+        host: str,
+        target: str
+    ) -> Tuple[int, List[Tuple[str, str]], Any]:
+        """Dispatch a request to a collection or single resource."""
+        not_found = (404, [], f"Cannot {method} {target}")
+
+        if len(parts) == 1 and parts[0] in self.singulars:
+            name = parts[0]
+            if method == 'GET':
+                return 200, [], self.singulars[name]
+            if method in ('PUT', 'PATCH') and isinstance(body, dict):
+                current = self.singulars[name]
+                if method == 'PATCH' and isinstance(current, dict):
+                    body = {**current, **body}
+                self.singulars[name] = body
+                return 200, [], body
+            return not_found
+
+        if not parts or parts[0] not in self.collections or len(parts) > 2:
+            return not_found
+        collection = self.collections[parts[0]]
+
+        if len(parts) == 1:
+            if method == 'GET':
+                headers, records = self._list(collection, query, f"http://{host}{target}")
+                return 200, headers, records
+            if method == 'POST':
+                if not isinstance(body, dict):
+                    return 400, [], {}
+                record = collection.insert(copy.deepcopy(body))
+                if record is None:
+                    return 500, [], {'error': 'Insert failed, duplicate id'}
+                return 201, [], record
+            return not_found
+
+        record_id = parts[1]
+        if method == 'GET':
+            record = collection.get(record_id)
+            if record is None:
+                return 404, [], {}
+            expand = query.get('_expand', [])
+            embed = query.get('_embed', [])
+            if embed or expand:
+                record = self._embed_expand(collection.name, record, embed, expand)
+            return 200, [], record
+        if method in ('PUT', 'PATCH'):
+            if not isinstance(body, dict):
+                return 400, [], {}
+            record = collection.replace(record_id, copy.deepcopy(body), merge=(method == 'PATCH'))
+            if record is None:
+                return 404, [], {}
+            return 200, [], record
+        if method == 'DELETE':
+            record = collection.remove(record_id)
+            if record is None:
+                return 404, [], {}
+            self._remove_dependents(collection.name, record['id'])
+            return 200, [], {}
+        return not_found
+
+    def _reset(self, body: Optional[Any]) -> Tuple[int, List[Tuple[str, str]], Any]:
+        """Replace the database with the request body, or reload the source file."""
+        if isinstance(body, dict):
+            self.load(body)
+        elif body is None and self.source_path:
+            try:
+                self.load(json.loads(Path(self.source_path).read_text(encoding='utf-8')))
+            except (OSError, ValueError) as e:
+                return 500, [], {'error': str(e)}
+        else:
+            return 400, [], {'error': 'Reset needs a JSON object of collections'}
+        return 200, [], {}
+
+
+def _parse_int(value: str, default: int) -> int:
+    """Parse an integer query parameter like JavaScript's parseInt()."""
+    match = re.match(r'\s*([+-]?\d+)', value)
+    return int(match.group(1)) if match else default
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler that passes requests to a MockDatabase."""
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this, the body waits
+    # for the client's delayed ACK on every kept-alive request
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        body = None
+        if raw_body:
+            content_type = self.headers.get('Content-Type', '')
+            try:
+                if 'application/x-www-form-urlencoded' in content_type:
+                    body = {key: values[-1] for key, values in parse_qs(raw_body.decode('utf-8')).items()}
+                else:
+                    body = json.loads(raw_body)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                self._send(400, [], 'Bad Request')
+                return
+
+        host = self.headers.get('Host') or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+        status, headers, payload = self.server.database.handle_request(self.command, self.path, body, host)
+        self._send(status, headers, payload)
+
+    def _send(self, status: int, headers: List[Tuple[str, str]], payload: Any) -> None:
+        if isinstance(payload, str):
+            content_type = 'text/html; charset=utf-8'
+            body = payload.encode('utf-8')
+        else:
+            content_type = 'application/json; charset=utf-8'
+            body = json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Pragma', 'no-cache')
+        self.send_header('Expires', '-1')
+        self.send_header('X-Content-Type-Options', 'nosniff')
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer(ThreadingHTTPServer):
+    """Threaded HTTP server for a MockDatabase."""
+    daemon_threads = True
+
+    def __init__(self, database: MockDatabase, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.database = database
+        super().__init__((host, port), MockRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_server(
+    database: MockDatabase,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT
+) -> MockServer:
+    """
+    Start a mock server in a background thread.
+
+    Args:
+        database: Database to serve
+        host: Host to listen on
+        port: Port to listen on (0 picks a free port)
+
+    Returns:
+        MockServer: The running server; call shutdown() and server_close() to stop it
+
+    Example:
+        >>> server = start_server(MockDatabase.from_file('api/to-do-db-source-test.json'), port=0)
+        >>> print(server.url)
+        http://localhost:54321
+    """
+    server = MockServer(database, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description='Serve a To-Do service database like json-server 0.17, without Node.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s api/to-do-db-source.json               # Serve on localhost:3000
+  %(prog)s api/to-do-db-source-test.json --port 3001
+        """
+    )
+
+    parser.add_argument(
+        'database',
+        help='Database JSON file to serve'
+    )
+
+    parser.add_argument(
+        '--host',
+        default=DEFAULT_HOST,
+        help=f'Host to listen on (default: {DEFAULT_HOST})'
+    )
+
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_PORT,
+        help=f'Port to listen on (default: {DEFAULT_PORT})'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        database = MockDatabase.from_file(args.database)
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not load database: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        server = MockServer(database, args.host, args.port)
+    except OSError as e:
+        print(f"Error: Could not listen on {args.host}:{args.port}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Serving {args.database} on {server.url}")
+    for name in database.collections:
+        print(f"  {server.url}/{name}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
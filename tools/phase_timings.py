@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Record how long each phase of testing documentation files takes.
+
+This module provides:
+- Per-file and per-example durations of named phases
+- Totals per phase across a run
+- A JSON report that can be compared across CI runs
+- A readable summary of where the time went
+
+The phases test-api-docs.py records are listed in PHASES. A file's
+phases cover work done for the whole file, like reading it and validating
+its front matter; an example's phases cover work done for that example.
+
+Code run without a TimingReport uses NO_TIMINGS, which records nothing,
+so the code being timed doesn't need to check whether timing is on.
+
+Usage:
+    from phase_timings import TimingReport
+
+    report = TimingReport()
+    file_timings = report.start_file('docs/api/users.md')
+    with file_timings.phase('read'):
+        content = read_markdown_file(Path('docs/api/users.md'))
+    example_timings = file_timings.example('GET example')
+    with example_timings.phase('execute'):
+        ...
+    file_timings.finish()
+    report.write_json('timings.json')
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Any, Iterator
+
+# Phases of testing a file, in the order they happen
+PHASES = ['read', 'front_matter', 'schema', 'extract', 'execute', 'parse', 'compare']
+
+# Version of the JSON report format
+REPORT_VERSION = 1
+
+
+class PhaseTimings:
+    """
+    Phase durations of a file or an example.
+
+    Attributes:
+        name: File path or example name
+        phases: Seconds spent in each phase
+        examples: Timings of the file's examples, in the order they were added
+        seconds: Wall time from start to finish(), or None until finished
+        enabled: False if nothing is recorded
+    """
+
+    def __init__(self, name: str, enabled: bool = True):
+        self.name = name
+        self.enabled = enabled
+        self.phases: Dict[str, float] = {}
+        self.examples: List['PhaseTimings'] = []
+        self.seconds: Optional[float] = None
+        self._started = time.perf_counter()
+
+    def example(self, name: str) -> 'PhaseTimings':
+        """
+        Start recording the timings of one of the file's examples.
+
+        Args:
+            name: Example name
+
+        Returns:
+            PhaseTimings: The example's timings
+        """
+        if not self.enabled:
+            return self
+        timings = PhaseTimings(name)
+        self.examples.append(timings)
+        return timings
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase, for example time measured in another thread."""
+        if self.enabled:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the code in the with block as part of a phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - started)
+
+    def finish(self) -> None:
+        """Stop the wall clock of a file."""
+        if self.enabled:
+            self.seconds = time.perf_counter() - self._started
+
+    def total(self, phase: str) -> float:
+        """Seconds spent in a phase by the file and all of its examples."""
+        return self.phases.get(phase, 0.0) + sum(example.phases.get(phase, 0.0) for example in self.examples)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON report form."""
+        result: Dict[str, Any] = {
+            'name': self.name,
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.phases.items()},
+        }
+        if self.seconds is not None:
+            result['seconds'] = round(self.seconds, 6)
+        if self.examples:
+            result['examples'] = [example.to_dict() for example in self.examples]
+        return result
+
+
+# Timings that record nothing, for code run without a TimingReport
+NO_TIMINGS = PhaseTimings('', enabled=False)
+
+
+class TimingReport:
+    """
+    Phase timings of every file tested in a run.
+
+    Files can be started from several threads at once; each file's
+    timings are only recorded by the thread testing it.
+
+    Attributes:
+        files: Timings of each file, in the order they were started
+    """
+
+    def __init__(self):
+        self.files: List[PhaseTimings] = []
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def start_file(self, file_path: str) -> PhaseTimings:
+        """
+        Start recording the timings of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            PhaseTimings: The file's timings
+        """
+        timings = PhaseTimings(file_path)
+        with self._lock:
+            self.files.append(timings)
+        return timings
+
+    def totals(self) -> Dict[str, float]:
+        """Seconds spent in each phase across all files, in PHASES order."""
+        names = PHASES + sorted({phase for timings in self.files for phase in timings.phases
+                                 if phase not in PHASES})
+        return {phase: sum(timings.total(phase) for timings in self.files) for phase in names}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the JSON report.
+
+        Returns:
+            dict: Report with the run's wall time, phase totals, and the
+                  timings of each file and example
+        """
+        return {
+            'version': REPORT_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'seconds': round(time.perf_counter() - self._started, 6),
+            'phases': {phase: round(seconds, 6) for phase, seconds in self.totals().items()},
+            'files': [timings.to_dict() for timings in self.files],
+        }
+
+    def write_json(self, path: str) -> Optional[str]:
+        """
+        Write the JSON report to a file.
+
+        Args:
+            path: Report file path, or - for standard output
+
+        Returns:
+            str: Error message, or None if the report was written
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if path == '-':
+            print(text)
+            return None
+        try:
+            with open(path, 'w', encoding='utf-8') as report_file:
+                report_file.write(text + '\n')
+        except OSError as e:
+            return f"Could not write timings to {path}: {e}"
+        return None
+
+    def summary_lines(self, slowest: int = 5) -> List[str]:
+        """
+        Describe where the run's time went.
+
+        Args:
+            slowest: Number of slowest files and examples to list
+
+        Returns:
+            list: Lines of the summary
+        """
+        totals = self.totals()
+        measured = sum(totals.values()) or 1.0
+        lines = ["Time by phase:"]
+        for phase, seconds in totals.items():
+            lines.append(f"  {phase:<13} {seconds:9.3f}s {seconds / measured:6.1%}")
+
+        files = sorted((timings for timings in self.files if timings.seconds is not None),
+                       key=lambda timings: timings.seconds, reverse=True)[:slowest]
+        if files:
+            lines.append("Slowest files:")
+            lines.extend(f"  {timings.seconds:9.3f}s  {timings.name}" for timings in files)
+
+        examples = sorted(((sum(example.phases.values()), timings.name, example.name)
+                           for timings in self.files for example in timings.examples),
+                          reverse=True)[:slowest]
+        if examples:
+            lines.append("Slowest examples:")
+            lines.extend(f"  {seconds:9.3f}s  {file_path}: {name}" for seconds, file_path, name in examples)
+        return lines
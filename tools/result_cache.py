@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of passed documentation examples.
+
+This module provides:
+- Content-hash keys for API examples
+- Looking up and storing example results in a cache directory
+- Hit and miss counts for reporting
+
+A key covers everything an example's verdict depends on: its request and
+expected response blocks, the file's test configuration, the bytes of its
+local_database, the server application and its version, the version of
+the testing code, and the keys of the examples before it in the same file,
+since those can change the server's data.
+
+Each result is stored in its own small JSON file, so several test runs or
+threads can share a cache directory.
+
+Usage:
+    from result_cache import ResultCache, file_digest
+
+    cache = ResultCache('.cache/test-api-docs')
+    key = ResultCache.example_key(request, response, test_config,
+                                  file_digest('api/to-do-db-source-test.json'),
+                                  'json-server@0.17.4')
+    if cache.get(key) is None:
+        ...run the example...
+        cache.put(key, {'file': 'docs/api/users.md', 'example': 'GET example'})
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Change to expire every cached result, for example when the key format changes
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = '.cache/test-api-docs'
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 digest of a file's bytes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        str: Hex digest, or 'missing' if the file can't be read
+
+    Example:
+        >>> len(file_digest('api/to-do-db-source-test.json'))
+        64
+        >>> file_digest('no/such/file.json')
+        'missing'
+    """
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return 'missing'
+
+
+class ResultCache:
+    """
+    Passed examples stored by key in a cache directory.
+
+    Attributes:
+        cache_dir: Directory the results are stored in
+        hits: Number of get() calls that found a result
+        misses: Number of get() calls that didn't
+        reused: Number of results reported from the cache instead of running
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def example_key(
+        request_block: str,
+        response_block: str,
+        test_config: Dict[str, Any],
+        database_digest: str,
+        server_version: str,
+        previous_key: Optional[str] = None,
+        tool_version: str = ''
+    ) -> str:
+        """
+        Build the cache key of an example.
+
+        Args:
+            request_block: The example's request code block, before substitution
+            response_block: The example's expected response code block
+            test_config: The file's test configuration; the testable list is
+                         left out, so adding an example doesn't expire the others
+            database_digest: file_digest() of the file's local_database
+            server_version: Server application and version, like 'json-server@0.17.4'
+            previous_key: Key of the example before this one in the file
+            tool_version: Version or digest of the testing code
+
+        Returns:
+            str: Hex digest key
+        """
+        config = {name: value for name, value in test_config.items() if name != 'testable'}
+        material = json.dumps({
+            'version': CACHE_VERSION,
+            'tool': tool_version,
+            'previous': previous_key,
+            'request': request_block,
+            'response': response_block,
+            'config': config,
+            'database': database_digest,
+            'server': server_version,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """File a result is stored in."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a result.
+
+        Args:
+            key: Key from example_key()
+
+        Returns:
+            dict: The stored result, or None if there isn't one
+        """
+        try:
+            result = json.loads(self._path(key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            result = None
+
+        with self._lock:
+            if isinstance(result, dict):
+                self.hits += 1
+                return result
+            self.misses += 1
+        return None
+
+    def add_reused(self, count: int) -> None:
+        """Count results that were reported from the cache instead of running."""
+        with self._lock:
+            self.reused += count
+
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        Store a result.
+
+        The result is written to a temporary file and renamed into place,
+        so readers never see a partial result.
+
+        Args:
+            key: Key from example_key()
+            result: JSON-serializable details of the result
+
+        Returns:
+            bool: True if the result was stored
+        """
+        path = self._path(key)
+        result = dict(result, cached_at=datetime.now(timezone.utc).isoformat(timespec='seconds'))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+                json.dump(result, temp_file)
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
@@ -6,6 +6,11 @@ This module provides schema validation functionality for validating YAML front m
 in markdown files against JSON schemas. It includes schema caching and intelligent
 error categorization (required vs optional field errors).
 
+Validators are compiled once per schema file and reused until the file
+changes, so validating many front matter blocks only costs the checks of
+each block. validate_files() validates whole trees of markdown files,
+reading and parsing them on a process pool.
+
 Usage:
     from schema_validator import validate_front_matter_schema
     
@@ -19,10 +24,22 @@ Usage:
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Tuple, List, Any
+from typing import Optional, Dict, Tuple, List, Any, FrozenSet
+
+import yaml
 
-from doc_test_utils import log, HELP_URLS
+from doc_test_utils import (
+    log,
+    parse_front_matter_with_errors,
+    front_matter_not_required,
+    FRONT_MATTER_PATTERN,
+    YAML_SAFE_LOADER,
+    HELP_URLS,
+    expand_markdown_paths
+)
 
 # Try to import jsonschema
 try:
@@ -38,15 +55,26 @@ DEFAULT_SCHEMA_PATH = '.github/schemas/front-matter-schema.json'
 # Schema cache - stores loaded schemas to avoid repeated file I/O
 _SCHEMA_CACHE: Dict[str, Dict[str, Any]] = {}
 
+# Validator registry - compiled schemas by schema path, with the schema
+# file's modification time so a changed schema is compiled again
+_VALIDATOR_CACHE: Dict[str, Tuple[int, 'CompiledSchema']] = {}
+
+# Fewest files worth starting a process pool for in validate_files()
+MIN_FILES_PER_PROCESS_POOL = 32
+
+# Validators whose errors are about the format of a field's value
+FORMAT_VALIDATORS = frozenset(['type', 'format', 'pattern', 'minimum', 'maximum', 'minLength', 'maxLength'])
+
 
 def clear_schema_cache() -> None:
     """
-    Clear the schema cache.
+    Clear the schema cache and the validator registry.
     
     Useful for testing or when schemas are modified at runtime.
     """
     global _SCHEMA_CACHE
     _SCHEMA_CACHE.clear()
+    _VALIDATOR_CACHE.clear()
 
 
 def load_schema(schema_path: str) -> Optional[Dict[str, Any]]:
@@ -90,6 +118,103 @@ def load_schema(schema_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+class CompiledSchema:
+    """
+    A schema with its compiled validator and field categories.
+    
+    Attributes:
+        schema: The JSON schema
+        validator: Draft7Validator for the schema
+        required_fields: Top-level fields the schema requires
+        field_categories: 'required' or 'optional' for each top-level
+                          field the schema names
+    """
+    
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.validator = Draft7Validator(schema)
+        self.required_fields: FrozenSet[str] = frozenset(schema.get('required', []))
+        self.field_categories: Dict[str, str] = {
+            field: 'required' if field in self.required_fields else 'optional'
+            for field in list(schema.get('properties', {})) + list(self.required_fields)
+        }
+    
+    def categorize(self, error: Any) -> Tuple[bool, str]:
+        """Categorize a validation error; see categorize_validation_error()."""
+        return _categorize(error, self.field_categories)
+
+
+def get_compiled_schema(schema_path: str) -> Optional[CompiledSchema]:
+    """
+    Get the compiled validator of a schema file from the registry.
+    
+    The schema is loaded and compiled on first use, and again whenever the
+    file's modification time changes.
+    
+    Args:
+        schema_path: Path to JSON schema file
+        
+    Returns:
+        CompiledSchema, or None if the schema can't be loaded or
+        jsonschema isn't installed
+        
+    Example:
+        >>> compiled = get_compiled_schema('.github/schemas/front-matter-schema.json')
+        >>> errors = list(compiled.validator.iter_errors({'layout': 'default'}))
+        >>> compiled.field_categories['layout']
+        'required'
+    """
+    if not JSONSCHEMA_AVAILABLE:
+        return None
+    
+    try:
+        mtime = os.stat(schema_path).st_mtime_ns
+    except OSError:
+        return None
+    
+    # Relative paths are keyed by the file they name, for processes that change directories
+    key = os.path.abspath(schema_path)
+    cached = _VALIDATOR_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    # The file changed or hasn't been loaded; don't use the schema cache
+    _SCHEMA_CACHE.pop(schema_path, None)
+    schema = load_schema(schema_path)
+    if schema is None:
+        return None
+    
+    compiled = CompiledSchema(schema)
+    _VALIDATOR_CACHE[key] = (mtime, compiled)
+    return compiled
+
+
+def _categorize(error: Any, field_categories: Dict[str, str]) -> Tuple[bool, str]:
+    """Categorize a validation error using a map of top-level field categories."""
+    # Check if error is about a required property
+    if error.validator == 'required':
+        missing_field = error.message.split("'")[1] if "'" in error.message else "unknown"
+        return True, f"Required field missing: {missing_field}"
+    
+    path = error.absolute_path
+    
+    # Check if error is about an enum value
+    if error.validator == 'enum' and len(path) > 0:
+        field_name = '.'.join(str(p) for p in path)
+        category = field_categories.get(path[0], 'optional')
+        return category == 'required', f"Invalid value for {category} field '{field_name}': {error.message}"
+    
+    # Check if error is about type or format
+    if error.validator in FORMAT_VALIDATORS:
+        field_name = '.'.join(str(p) for p in path)
+        category = field_categories.get(path[0], 'optional') if len(path) > 0 else 'optional'
+        return category == 'required', f"Invalid format for {category} field '{field_name}': {error.message}"
+    
+    # Other errors default to warnings for optional fields
+    field_name = '.'.join(str(p) for p in path) if path else "unknown"
+    return False, f"Validation issue in '{field_name}': {error.message}"
+
+
 def categorize_validation_error(error: Any, schema: Dict[str, Any]) -> Tuple[bool, str]:
     """
     Categorize a jsonschema validation error as critical (required field) or warning (optional field).
@@ -113,42 +238,13 @@ def categorize_validation_error(error: Any, schema: Dict[str, Any]) -> Tuple[boo
     Note:
         Required field errors are critical and should fail validation.
         Optional field errors are warnings that don't fail validation.
+        Validating many documents with get_compiled_schema() categorizes
+        errors without looking up the required fields for each one.
     """
-    is_required = False
-    
-    # Check if error is about a required property
-    if error.validator == 'required':
-        is_required = True
-        missing_field = error.message.split("'")[1] if "'" in error.message else "unknown"
-        message = f"Required field missing: {missing_field}"
-        return is_required, message
-    
-    # Check if error is about an enum value
-    if error.validator == 'enum' and len(error.absolute_path) > 0:
-        field_name = '.'.join(str(p) for p in error.absolute_path)
-        # Check if this field is in the required list
-        if error.absolute_path[0] in schema.get('required', []):
-            is_required = True
-            message = f"Invalid value for required field '{field_name}': {error.message}"
-        else:
-            message = f"Invalid value for optional field '{field_name}': {error.message}"
-        return is_required, message
-    
-    # Check if error is about type or format
-    if error.validator in ['type', 'format', 'pattern', 'minimum', 'maximum', 'minLength', 'maxLength']:
-        field_name = '.'.join(str(p) for p in error.absolute_path)
-        # Check if this field is in the required list
-        if len(error.absolute_path) > 0 and error.absolute_path[0] in schema.get('required', []):
-            is_required = True
-            message = f"Invalid format for required field '{field_name}': {error.message}"
-        else:
-            message = f"Invalid format for optional field '{field_name}': {error.message}"
-        return is_required, message
-    
-    # Other errors default to warnings for optional fields
-    field_name = '.'.join(str(p) for p in error.absolute_path) if error.absolute_path else "unknown"
-    message = f"Validation issue in '{field_name}': {error.message}"
-    return is_required, message
+    required = schema.get('required', [])
+    path = error.absolute_path
+    field_categories = {path[0]: 'required'} if len(path) > 0 and path[0] in required else {}
+    return _categorize(error, field_categories)
 
 
 def validate_front_matter_schema(
@@ -191,7 +287,7 @@ def validate_front_matter_schema(
         
     Note:
         If jsonschema library is not installed, validation is skipped with a warning.
-        Schema files are cached after first load for performance.
+        Compiled validators are cached by schema path and modification time.
     """
     # Check if jsonschema is available
     if not JSONSCHEMA_AVAILABLE:
@@ -199,10 +295,10 @@ def validate_front_matter_schema(
             "warning", file_path, None, use_actions, action_level)
         return True, False, [], []
     
-    # Load schema (with caching)
-    schema = load_schema(schema_path)
+    # Get the compiled schema (with caching)
+    compiled = get_compiled_schema(schema_path)
     
-    if schema is None:
+    if compiled is None:
         # Check which error occurred
         try:
             with open(schema_path, 'r') as f:
@@ -219,19 +315,17 @@ def validate_front_matter_schema(
             log(f"Error loading schema: {str(e)}", 
                 "warning", file_path, None, use_actions, action_level)
             return True, False, [], []
+        # The schema changed while it was being loaded
+        log(f"Error loading schema: {schema_path}", 
+            "warning", file_path, None, use_actions, action_level)
+        return True, False, [], []
     
-    # At this point, schema is guaranteed to be a Dict (not None)
-    # Type checkers need help understanding this
-    assert schema is not None
-    
-    # Create validator
-    validator = Draft7Validator(schema)
     errors: List[str] = []
     warnings: List[str] = []
     
     # Collect all validation errors
-    for error in validator.iter_errors(metadata):
-        is_required, message = categorize_validation_error(error, schema)
+    for error in compiled.validator.iter_errors(metadata):
+        is_required, message = compiled.categorize(error)
         
         if is_required:
             errors.append(message)
@@ -291,3 +385,153 @@ def validate_with_default_schema(
         use_actions=use_actions,
         action_level=action_level
     )
+
+
+def _read_front_matter(file_path: str) -> Dict[str, Any]:
+    """
+    Read and parse the front matter of a file, for validate_files().
+    
+    Runs in pool worker processes, so it returns plain data.
+    
+    Returns:
+        dict: file, metadata, front_matter (the YAML text), error,
+              error_line, and not_required
+    """
+    result: Dict[str, Any] = {
+        'file': file_path,
+        'metadata': None,
+        'front_matter': None,
+        'error': None,
+        'error_line': None,
+        'not_required': False,
+    }
+    try:
+        content = Path(file_path).read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        result['error'] = f"Could not read file: {e}"
+        return result
+    
+    if front_matter_not_required(content):
+        result['not_required'] = True
+        return result
+    
+    metadata, error, error_line = parse_front_matter_with_errors(content)
+    if error is None and not isinstance(metadata, dict):
+        error, error_line = "Front matter must be a YAML mapping of fields", 2
+    result.update(error=error, error_line=error_line)
+    if error is None:
+        result['metadata'] = metadata
+        result['front_matter'] = FRONT_MATTER_PATTERN.match(content).group(1)
+    return result
+
+
+def _field_line(root: Any, path: List[Any]) -> Optional[int]:
+    """
+    Find the file line of a field in composed front matter.
+    
+    Args:
+        root: yaml.compose() node of the text between the --- delimiters
+        path: Field path from a validation error, like ['test', 'server_url']
+        
+    Returns:
+        1-based line number in the file; the line of the nearest parent
+        that can be found, or the opening --- line for the whole front matter
+    """
+    node = root
+    line = 1
+    for part in path:
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.value == str(part):
+                    line, node = key_node.start_mark.line + 2, value_node
+                    break
+            else:
+                return line
+        elif isinstance(node, yaml.SequenceNode) and isinstance(part, int) and part < len(node.value):
+            node = node.value[part]
+            line = node.start_mark.line + 2
+        else:
+            return line
+    return line
+
+
+def _validate_parsed(parsed: Dict[str, Any], compiled: Optional[CompiledSchema]) -> Dict[str, Any]:
+    """Validate a _read_front_matter() result and build its validate_files() result."""
+    result: Dict[str, Any] = {
+        'file': parsed['file'],
+        'valid': True,
+        'skipped': parsed['not_required'],
+        'errors': [],
+        'warnings': [],
+    }
+    if parsed['not_required']:
+        return result
+    
+    if parsed['error'] is not None:
+        result['valid'] = False
+        result['errors'].append({'message': parsed['error'], 'line': parsed['error_line']})
+        return result
+    
+    if compiled is None:
+        return result
+    
+    root = None
+    for error in compiled.validator.iter_errors(parsed['metadata']):
+        is_required, message = compiled.categorize(error)
+        # Front matter is composed again only to find the lines of problems
+        if root is None:
+            root = yaml.compose(parsed['front_matter'], Loader=YAML_SAFE_LOADER)
+        line = _field_line(root, list(error.absolute_path))
+        result['errors' if is_required else 'warnings'].append({'message': message, 'line': line})
+    result['valid'] = not result['errors']
+    return result
+
+
+def validate_files(
+    paths: List[str],
+    schema_path: str = DEFAULT_SCHEMA_PATH,
+    jobs: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate the front matter of many markdown files.
+    
+    Files are read and their front matter parsed on a process pool, then
+    validated in this process with the schema's compiled validator. Files
+    that opt out with the front matter not required comment are skipped.
+    Nothing is logged, so callers decide how to report the results.
+    
+    Args:
+        paths: Files, directories, or glob patterns; see expand_markdown_paths()
+        schema_path: Path to JSON schema file
+        jobs: Number of processes to parse with, or None for one per CPU.
+              Small batches and jobs=1 are parsed in this process.
+        
+    Returns:
+        List of results in path order, one per file, with:
+        - file: The file path
+        - valid: False if the front matter is missing, can't be parsed,
+          or has errors in required fields
+        - skipped: True if the file doesn't need front matter
+        - errors: List of {'message', 'line'} dicts for critical problems
+        - warnings: List of {'message', 'line'} dicts for optional fields
+        Lines are 1-based file line numbers, or None if unknown. If the
+        schema can't be loaded or jsonschema isn't installed, only front
+        matter parsing is checked.
+        
+    Example:
+        >>> results = validate_files(['docs', 'assignments'])
+        >>> invalid = [r['file'] for r in results if not r['valid']]
+    """
+    file_paths = expand_markdown_paths(paths)
+    compiled = get_compiled_schema(schema_path)
+    
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(file_paths) >= MIN_FILES_PER_PROCESS_POOL:
+        workers = min(workers, len(file_paths) // (MIN_FILES_PER_PROCESS_POOL // 2))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            parsed = list(executor.map(_read_front_matter, file_paths, chunksize=chunksize))
+    else:
+        parsed = [_read_front_matter(file_path) for file_path in file_paths]
+    
+    return [_validate_parsed(result, compiled) for result in parsed]
@@ -3,36 +3,120 @@
 Test API documentation code examples against a running json-server instance.
 
 Usage:
-    test-api-docs.py <markdown_file> [--action [LEVEL]] [--schema SCHEMA_FILE]
+    test-api-docs.py <markdown_file> [markdown_file ...] [--action [LEVEL]]
+                     [--schema SCHEMA_FILE] [--http-engine ENGINE] [--jobs N]
+                     [--reset-database DATABASE_FILE] [--workers N]
+                     [--no-cache] [--cache-dir DIR] [--profile]
+                     [--timings-json FILE]
     
 Arguments:
-    markdown_file: Path to the markdown documentation file to test
+    markdown_file: Path to the markdown documentation file(s) to test.
+              Files are grouped by their test configuration and tested in
+              one run with one summary and exit code.
     --action: Optional flag to output GitHub Actions annotations
               Optional LEVEL: all, warning (default), error
     --schema: Path to JSON schema file for front matter validation
               Default: .github/schemas/front-matter-schema.json
+    --http-engine: How to run the curl examples
+              builtin (default): parse the curl command and send it over a pooled
+                                 keep-alive connection; commands with options the
+                                 parser doesn't support still run with curl
+              curl: run every example with the curl command
+    --jobs: Number of read-only (GET) examples to run at the same time
+              Default: 1. Examples that change data always run in order, and
+              results are always reported in front matter order.
+    --reset-database: Database file the test server watches. Before each file
+              is tested, the server is reset to its local_database by sending
+              only the changed records, or by copying the database over this
+              file if the server can't be reset through its API.
+    --workers: Number of in-process mock servers (mock_service.py) to start
+              instead of using a running json-server. Up to N files are tested
+              at a time, each on its own server loaded with the file's
+              local_database, with {server_url} set to that server. Output is
+              printed one file at a time, in order. Default: 0, which tests
+              files one at a time on the running json-server.
+    --no-cache: Run every example. By default, an example that passed before
+              isn't run again until its request or response block, the file's
+              test configuration, its local_database, the server, or the
+              testing code changes, or an example before it in the file runs.
+              Failed examples are never cached, so they always run.
+    --cache-dir: Directory for cached results
+              Default: .cache/test-api-docs
+    --profile: Print the time spent in each phase (read, front_matter, schema,
+              extract, execute, parse, compare) and the slowest files and examples
+    --timings-json: Write the phase times of the run, each file, and each
+              example to a JSON file, for comparing runs
+    
+Responses must match the documented response exactly, including the order
+of list items. Files whose collection endpoints don't guarantee an order
+can set unordered_lists: true in their test front matter to match the
+records in lists by id instead.
     
 Examples:
     test-api-docs.py docs/api/users-get-all-users.md --schema .schemas/front-matter-schema.json
     test-api-docs.py docs/api/users-get-all-users.md --action --schema .schemas/front-matter-schema.json
     test-api-docs.py docs/api/users-get-all-users.md --action all --schema .schemas/front-matter-schema.json
     test-api-docs.py docs/api/users-get-all-users.md --action error --schema .schemas/front-matter-schema.json
+    test-api-docs.py docs/api/*.md --action warning --reset-database /tmp/to-do-db-test.json
+    test-api-docs.py docs/api/*.md --workers 4
+    test-api-docs.py docs/api/*.md --workers 4 --no-cache
+    test-api-docs.py docs/api/*.md --workers 4 --profile --timings-json timings.json
 """
 
 import re
+import shutil
 import subprocess
 import json
 import sys
+import time
 import argparse
+import importlib.util
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Tuple, List, Any
+from typing import Optional, Dict, Tuple, List, Any, Union
 
-from doc_test_utils import read_markdown_file, parse_front_matter_with_errors, log, HELP_URLS
+from curl_engine import parse_curl_command, execute_request
+from database_state import DatabaseStateManager, load_database
+from json_diff import diff_json, json_equal
+from phase_timings import PhaseTimings, TimingReport, NO_TIMINGS
+from doc_test_utils import read_markdown_file, parse_front_matter_with_errors, log, capture_log, HELP_URLS
+from doc_test_utils import FRONT_MATTER_NOT_REQUIRED, FRONT_MATTER_NOT_REQUIRED_LINES
+from markdown_index import MarkdownIndex
+from mock_service import MockDatabase, start_server
+from result_cache import ResultCache, DEFAULT_CACHE_DIR, file_digest
 from schema_validator import validate_front_matter_schema, DEFAULT_SCHEMA_PATH
 
+# get-test-configs.py has a hyphenated name, so load it by path
+_get_test_configs_spec = importlib.util.spec_from_file_location(
+    'get_test_configs', Path(__file__).parent / 'get-test-configs.py'
+)
+get_test_configs = importlib.util.module_from_spec(_get_test_configs_spec)
+_get_test_configs_spec.loader.exec_module(get_test_configs)
+
 # Configuration constants
 CURL_TIMEOUT_SECONDS = 10
 MAX_DIFFERENCES_SHOWN = 10
+HTTP_ENGINES = ['builtin', 'curl']
+
+# Key that matches list items when the front matter sets test.unordered_lists
+UNORDERED_LIST_KEY = 'id'
+
+# HTTP methods that don't change the server's data and can run concurrently
+READ_ONLY_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+# Database reset without a server URL: time for json-server to notice the new file
+DATABASE_RELOAD_SECONDS = 0.5
+
+# Host the --workers mock servers listen on
+MOCK_SERVER_HOST = '127.0.0.1'
+
+# Source files that decide whether an example passes; editing one expires cached results
+VERDICT_SOURCES = ('test-api-docs.py', 'curl_engine.py', 'markdown_index.py', 'json_diff.py')
+
+# Digest of the testing code for result cache keys, computed on first use
+_TOOL_VERSION: Optional[str] = None
 
 
 def parse_testable_entry(entry: str) -> Tuple[Optional[str], Optional[List[int]]]:
@@ -77,42 +161,23 @@ def parse_testable_entry(entry: str) -> Tuple[Optional[str], Optional[List[int]]
         return None, None
 
 
-def _make_flexible_pattern(example_name: str) -> str:
-    """
-    Create a flexible regex pattern that matches the example name with optional backticks.
-    
-    This allows patterns like "GET example" to match:
-    - "GET example"
-    - "`GET` example" 
-    - "GET `example`"
-    - "`GET` `example`"
-    
-    Args:
-        example_name: The example name to create a pattern for
-        
-    Returns:
-        str: Regex pattern with flexible backtick matching
-        
-    Example:
-        >>> pattern = _make_flexible_pattern("GET example")
-        >>> import re
-        >>> bool(re.search(pattern, "### `GET` example request"))
-        True
-    """
-    escaped_name = re.escape(example_name)
-    # Split on spaces and wrap each word to allow optional backticks
-    words = escaped_name.split(r'\ ')
-    flexible_words = [rf'`?{word}`?' for word in words]
-    flexible_pattern = r'\s+'.join(flexible_words)
-    return flexible_pattern
+def _as_index(content: Union[str, MarkdownIndex]) -> MarkdownIndex:
+    """Return content as a MarkdownIndex, tokenizing it if it's a string."""
+    if isinstance(content, MarkdownIndex):
+        return content
+    return MarkdownIndex(content)
 
 
-def extract_curl_command(content: str, server_url: str, example_name: str) -> Optional[str]:
+def extract_curl_command(
+    content: Union[str, MarkdownIndex],
+    server_url: str,
+    example_name: str
+) -> Optional[str]:
     """
     Extract curl command from the specified example section.
     
     Args:
-        content: Full markdown file content
+        content: Full markdown file content, or a MarkdownIndex of it
         server_url: Base server URL to replace in the curl command if substitution string found
         example_name: Name of the example to find
         
@@ -130,62 +195,32 @@ def extract_curl_command(content: str, server_url: str, example_name: str) -> Op
         >>> print(cmd)
         curl -i http://localhost:3000/api/users
     """
-    # Create flexible pattern that allows optional backticks around words
-    flexible_pattern = _make_flexible_pattern(example_name)
+    block = _as_index(content).find_code_block(example_name, 'request')
+    if block is None:
+        return None
     
-    # Look for heading with "request" (h3 or h4)
-    heading_pattern = rf'^###\#?\s+{flexible_pattern}\s+request'
+    curl_cmd_string = block.text.strip()
+    if not curl_cmd_string:
+        return None
     
-    lines = content.split('\n')
-    in_example = False
-    in_code_block = False
-    curl_cmd_elements = []
-    curl_cmd_string = ""
-    
-    for i, line in enumerate(lines):
-        # Check if we found the heading
-        if re.search(heading_pattern, line, re.IGNORECASE):
-            in_example = True
-            continue
-        
-        # If we're in the example section
-        if in_example:
-            # Look for bash code block
-            if line.strip().startswith('```bash') or line.strip().startswith('```sh'):
-                in_code_block = True
-                continue
-            
-            # End of code block
-            if in_code_block and line.strip() == '```':
-                break
-            
-            # Collect curl command lines
-            if in_code_block:
-                curl_cmd_elements.append(line)
-            
-            # Stop if we hit another heading
-            if line.startswith('#'):
-                break
-    
-    if curl_cmd_elements:
-        curl_cmd_string = '\n'.join(curl_cmd_elements).strip()
-        # Add -i flag if not present to get headers
-        if '-i' not in curl_cmd_string and '--include' not in curl_cmd_string:
-            curl_cmd_string = curl_cmd_string.replace('curl', 'curl -i', 1)
-        # Replace server URL if the substitution string found
-        if server_url:
-            curl_cmd_string = curl_cmd_string.replace('{server_url}', server_url)
-        return curl_cmd_string
-    
-    return None
+    # Add -i flag if not present to get headers
+    if '-i' not in curl_cmd_string and '--include' not in curl_cmd_string:
+        curl_cmd_string = curl_cmd_string.replace('curl', 'curl -i', 1)
+    # Replace server URL if the substitution string found
+    if server_url:
+        curl_cmd_string = curl_cmd_string.replace('{server_url}', server_url)
+    return curl_cmd_string
 
 
-def extract_expected_response(content: str, example_name: str) -> Optional[Dict[str, Any]]:
+def extract_expected_response(
+    content: Union[str, MarkdownIndex],
+    example_name: str
+) -> Optional[Dict[str, Any]]:
     """
     Extract expected JSON response from the specified example section.
     
     Args:
-        content: Full markdown file content
+        content: Full markdown file content, or a MarkdownIndex of it
         example_name: Name of the example to find
         
     Returns:
@@ -202,57 +237,27 @@ def extract_expected_response(content: str, example_name: str) -> Optional[Dict[
         >>> print(response['users'][0]['name'])
         Alice
     """
-    # Create flexible pattern that allows optional backticks around words
-    flexible_pattern = _make_flexible_pattern(example_name)
-    
-    # Look for heading with "response" (h3 or h4)
-    heading_pattern = rf'^###\#?\s+{flexible_pattern}\s+response'
-    
-    lines = content.split('\n')
-    in_example = False
-    in_code_block = False
-    json_lines = []
-    
-    for i, line in enumerate(lines):
-        # Check if we found the heading
-        if re.search(heading_pattern, line, re.IGNORECASE):
-            in_example = True
-            continue
-        
-        # If we're in the example section
-        if in_example:
-            # Look for json code block
-            if line.strip().startswith('```json'):
-                in_code_block = True
-                continue
-            
-            # End of code block
-            if in_code_block and line.strip() == '```':
-                break
-            
-            # Collect JSON lines
-            if in_code_block:
-                json_lines.append(line)
-            
-            # Stop if we hit another heading
-            if line.startswith('#'):
-                break
-    
-    if json_lines:
-        try:
-            return json.loads('\n'.join(json_lines))
-        except json.JSONDecodeError:
-            return None
+    block = _as_index(content).find_code_block(example_name, 'response')
+    if block is None or not block.text.strip():
+        return None
     
-    return None
+    try:
+        return json.loads(block.text)
+    except json.JSONDecodeError:
+        return None
 
 
-def execute_curl(curl_command: str) -> Tuple[Optional[int], Optional[str], str]:
+def execute_curl(curl_command: str, http_engine: str = 'builtin') -> Tuple[Optional[int], Optional[str], str]:
     """
     Execute a curl command and return the response.
     
+    With the builtin engine, the command is parsed and sent over a pooled
+    keep-alive connection. Commands the parser can't handle, and all commands
+    when http_engine is 'curl', run in a curl subprocess.
+    
     Args:
         curl_command: The curl command to execute
+        http_engine: 'builtin' (default) or 'curl'
         
     Returns:
         tuple: (status_code, headers, body) or (None, None, error_message)
@@ -263,6 +268,24 @@ def execute_curl(curl_command: str) -> Tuple[Optional[int], Optional[str], str]:
         >>> if status:
         ...     print(f"Status: {status}")
     """
+    if http_engine == 'builtin':
+        request = parse_curl_command(curl_command)
+        if request is not None:
+            return execute_request(request, timeout=CURL_TIMEOUT_SECONDS)
+    
+    return _execute_curl_subprocess(curl_command)
+
+
+def _execute_curl_subprocess(curl_command: str) -> Tuple[Optional[int], Optional[str], str]:
+    """
+    Execute a curl command in a bash subprocess and parse its -i output.
+    
+    Args:
+        curl_command: The curl command to execute
+        
+    Returns:
+        tuple: (status_code, headers, body) or (None, None, error_message)
+    """
     try:
         # Run curl with -i to get headers
         result = subprocess.run(
@@ -306,14 +329,44 @@ def execute_curl(curl_command: str) -> Tuple[Optional[int], Optional[str], str]:
         return None, None, str(e)
 
 
-def compare_json_objects(actual: Any, expected: Any, path: str = "") -> Tuple[bool, List[str]]:
+def is_read_only_command(curl_command: str) -> bool:
     """
-    Recursively compare two JSON objects and return differences.
+    Check whether a curl command only reads data from the server.
+    
+    Commands that the built-in engine can't parse are treated as changing
+    data, so they are never reordered.
+    
+    Args:
+        curl_command: The curl command to check
+        
+    Returns:
+        bool: True if the command sends a GET, HEAD, or OPTIONS request
+
+    Example:
+        >>> is_read_only_command('curl -i http://localhost:3000/users')
+        True
+        >>> is_read_only_command('curl -X DELETE http://localhost:3000/users/1')
+        False
+    """
+    request = parse_curl_command(curl_command)
+    return request is not None and request.method in READ_ONLY_METHODS
+
+
+def compare_json_objects(
+    actual: Any,
+    expected: Any,
+    limit: Optional[int] = None,
+    list_key: Optional[str] = None
+) -> Tuple[bool, List[str]]:
+    """
+    Compare two JSON objects and return differences.
     
     Args:
         actual: The actual JSON value
         expected: The expected JSON value
-        path: Current path in the object hierarchy (for error messages)
+        limit: Stop comparing after this many differences, or None to find all
+        list_key: Match the items of lists of records by this key, like 'id',
+                  instead of by their order
         
     Returns:
         tuple: (are_equal, list_of_differences)
@@ -327,75 +380,44 @@ def compare_json_objects(actual: Any, expected: Any, path: str = "") -> Tuple[bo
         Equal: False
         Differences: ['Value mismatch at age: expected 25, got 30']
     """
-    differences = []
-    
-    # Compare types
-    if type(actual) != type(expected):
-        differences.append(f"Type mismatch at {path or 'root'}: expected {type(expected).__name__}, got {type(actual).__name__}")
-        return False, differences
-    
-    # Compare based on type
-    if isinstance(expected, dict):
-        # Check for missing keys
-        for key in expected:
-            if key not in actual:
-                differences.append(f"Missing key at {path}.{key}" if path else f"Missing key: {key}")
-        
-        # Check for extra keys
-        for key in actual:
-            if key not in expected:
-                differences.append(f"Extra key at {path}.{key}" if path else f"Extra key: {key}")
-        
-        # Recursively compare common keys
-        for key in expected:
-            if key in actual:
-                new_path = f"{path}.{key}" if path else key
-                are_equal, sub_diffs = compare_json_objects(actual[key], expected[key], new_path)
-                differences.extend(sub_diffs)
-    
-    elif isinstance(expected, list):
-        # Compare list lengths
-        if len(actual) != len(expected):
-            differences.append(f"List length mismatch at {path or 'root'}: expected {len(expected)} items, got {len(actual)}")
-            # Still compare what we can
-            min_len = min(len(actual), len(expected))
-        else:
-            min_len = len(expected)
-        
-        # Compare list items
-        for i in range(min_len):
-            new_path = f"{path}[{i}]" if path else f"[{i}]"
-            are_equal, sub_diffs = compare_json_objects(actual[i], expected[i], new_path)
-            differences.extend(sub_diffs)
-    
-    else:
-        # Compare primitive values
-        if actual != expected:
-            differences.append(f"Value mismatch at {path or 'root'}: expected {expected}, got {actual}")
-    
-    return len(differences) == 0, differences
+    if list_key is None:
+        if json_equal(actual, expected):
+            return True, []
+        return False, diff_json(actual, expected, limit)
+    # json_equal() compares lists in order, so only diff_json() can match items by key
+    diffs = diff_json(actual, expected, limit, list_key)
+    return not diffs, diffs
 
 
 def test_example(
-    content: str,
+    content: Union[str, MarkdownIndex],
     test_config: Dict[str, Any],
     example_name: str,
     expected_codes: List[int],
     file_path: str,
     use_actions: bool,
-    action_level: str
+    action_level: str,
+    http_engine: str = 'builtin',
+    response: Optional[Tuple[Optional[int], Optional[str], str]] = None,
+    curl_cmd: Optional[str] = None,
+    timings: PhaseTimings = NO_TIMINGS
 ) -> bool:
     """
     Test a single example from the documentation.
     
     Args:
-        content: Full markdown file content
+        content: Full markdown file content, or a MarkdownIndex of it
         test_config: Test metadata taken from file's front matter
         example_name: Name of the example to test
         expected_codes: List of acceptable HTTP status codes
         file_path: Path to the markdown file
         use_actions: Whether to output GitHub Actions annotations
         action_level: Annotation level filter
+        http_engine: How to run the curl command ('builtin' or 'curl')
+        response: Result of execute_curl() if the example was already run,
+                  for example by test_file() running examples concurrently
+        curl_cmd: The example's curl command if test_file() already extracted it
+        timings: Timings to record the example's phases in
         
     Returns:
         bool: True if test passed, False otherwise
@@ -414,25 +436,33 @@ def test_example(
         >>> print(f"Test {'passed' if passed else 'failed'}")
     """
     log(f"\nTesting example: {example_name}", "info")
+    document = _as_index(content)
     
-    # Extract curl command
-    server_url = test_config.get('server_url', '')
-    curl_cmd = extract_curl_command(content, server_url, example_name)
+    # Extract curl command, unless it was already extracted
+    if curl_cmd is None:
+        with timings.phase('extract'):
+            curl_cmd = extract_curl_command(document, test_config.get('server_url', ''), example_name)
     if not curl_cmd:
+        request_heading = document.find_heading(example_name, 'request')
         log(f"Could not find example '{example_name}' or it is not formatted correctly", 
-            "warning", file_path, None, use_actions, action_level)
+            "warning", file_path, request_heading.line if request_heading else None,
+            use_actions, action_level)
         log(f"Expected format: '### {example_name} request' section with bash code block", "info")
         log(f"-  Help: {HELP_URLS['example_format']}", "info")
         return False
     
+    request_line = document.find_code_block(example_name, 'request').line
     log(f"  Command: {curl_cmd[:80]}...", "info")
     
-    # Execute curl command
-    status_code, headers, body = execute_curl(curl_cmd)
+    # Execute curl command, unless it was already run
+    if response is None:
+        with timings.phase('execute'):
+            response = execute_curl(curl_cmd, http_engine)
+    status_code, headers, body = response
     
     if status_code is None:
         log(f"Example '{example_name}' failed: {body}", 
-            "error", file_path, None, use_actions, action_level)
+            "error", file_path, request_line, use_actions, action_level)
         return False
     
     log(f"  Status: {status_code}", "info")
@@ -441,32 +471,40 @@ def test_example(
     if status_code not in expected_codes:
         expected_str = ' or '.join(map(str, expected_codes))
         log(f"Example '{example_name}' failed; expected HTTP {expected_str}, got {status_code}", 
-            "error", file_path, None, use_actions, action_level)
+            "error", file_path, request_line, use_actions, action_level)
         return False
     
     log(f"  HTTP {status_code} (success)", "success")
     
     # Parse response body as JSON
     try:
-        response_json = json.loads(body)
+        with timings.phase('parse'):
+            response_json = json.loads(body)
         log("  Valid JSON response received", "success")
     except json.JSONDecodeError:
         log(f"Example '{example_name}' failed: Response is not valid JSON", 
-            "error", file_path, None, use_actions, action_level)
+            "error", file_path, request_line, use_actions, action_level)
         log(f"  Response: {body[:200]}", "info")
         return False
     
     # Extract expected response
-    expected_json = extract_expected_response(content, example_name)
+    with timings.phase('extract'):
+        expected_json = extract_expected_response(document, example_name)
     if expected_json is None:
+        response_heading = document.find_heading(example_name, 'response')
         log(f"Could not find documented response for '{example_name}' or it is not formatted correctly", 
-            "warning", file_path, None, use_actions, action_level)
+            "warning", file_path, response_heading.line if response_heading else request_line,
+            use_actions, action_level)
         log(f"Expected format: '### {example_name} response' section with json code block", "info")
         log(f"-  Help: {HELP_URLS['example_format']}", "info")
         return False
     
-    # Compare actual vs expected
-    are_equal, differences = compare_json_objects(response_json, expected_json)
+    # Compare actual vs expected; one more difference than is shown tells
+    # whether there are more
+    list_key = UNORDERED_LIST_KEY if test_config.get('unordered_lists') else None
+    with timings.phase('compare'):
+        are_equal, differences = compare_json_objects(response_json, expected_json,
+                                                      MAX_DIFFERENCES_SHOWN + 1, list_key)
     
     if are_equal:
         log("  Response matches documentation exactly", "success")
@@ -474,20 +512,176 @@ def test_example(
         return True
     else:
         log(f"Example '{example_name}' failed: Response does not match documentation", 
-            "error", file_path, None, use_actions, action_level)
-        log(f"  Differences found: {len(differences)}", "info")
+            "error", file_path, document.find_code_block(example_name, 'response').line,
+            use_actions, action_level)
+        if len(differences) > MAX_DIFFERENCES_SHOWN:
+            log(f"  Differences found: more than {MAX_DIFFERENCES_SHOWN}", "info")
+        else:
+            log(f"  Differences found: {len(differences)}", "info")
         for diff in differences[:MAX_DIFFERENCES_SHOWN]:
             log(f"    • {diff}", "info")
         if len(differences) > MAX_DIFFERENCES_SHOWN:
-            log(f"  ... and {len(differences) - MAX_DIFFERENCES_SHOWN} more differences", "info")
+            log("  ... and more differences", "info")
         return False
 
 
+@dataclass
+class _Example:
+    """
+    A testable entry of a file, ready to test.
+    
+    Attributes:
+        testable_entry: Entry from the front matter's testable list
+        name: Example name, or None if the entry is invalid
+        expected_codes: Acceptable HTTP status codes
+        curl_cmd: Extracted curl command, or None if it wasn't found
+        cache_key: Result cache key, or None if results aren't cached
+        cached: True if the example passed before and doesn't need to run
+        timings: Phase timings of the example
+    """
+    testable_entry: str
+    name: Optional[str]
+    expected_codes: Optional[List[int]]
+    curl_cmd: Optional[str] = None
+    cache_key: Optional[str] = None
+    cached: bool = False
+    timings: PhaseTimings = NO_TIMINGS
+
+
+def _run_example_group(
+    document: MarkdownIndex,
+    test_config: Dict[str, Any],
+    group: List[_Example],
+    file_path: str,
+    use_actions: bool,
+    action_level: str,
+    http_engine: str,
+    jobs: int,
+    cache: Optional[ResultCache] = None
+) -> Tuple[int, int]:
+    """
+    Test a group of examples, running their read-only requests concurrently.
+    
+    The requests of read-only examples in the group are sent first, up to
+    jobs at a time. Any example that changes data must be the last one in
+    the group, so it still runs after everything before it. Results are
+    then checked and reported in group order.
+    
+    Args:
+        document: Index of the markdown file content
+        test_config: Test metadata taken from file's front matter
+        group: Examples to test
+        file_path: Path to the markdown file
+        use_actions: Whether to output GitHub Actions annotations
+        action_level: Annotation level filter
+        http_engine: How to run the curl commands ('builtin' or 'curl')
+        jobs: Maximum number of requests to run at the same time
+        cache: Result cache to store passed examples in
+        
+    Returns:
+        tuple: (passed_tests, failed_tests)
+    """
+    read_only = {
+        index: example.curl_cmd
+        for index, example in enumerate(group)
+        if not example.cached and example.curl_cmd is not None and is_read_only_command(example.curl_cmd)
+    }
+    
+    def timed_execute(curl_cmd: str) -> Tuple[Tuple[Optional[int], Optional[str], str], float]:
+        started = time.perf_counter()
+        response = execute_curl(curl_cmd, http_engine)
+        return response, time.perf_counter() - started
+    
+    responses: Dict[int, Tuple[Optional[int], Optional[str], str]] = {}
+    if jobs > 1 and len(read_only) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(read_only))) as executor:
+            futures = {
+                index: executor.submit(timed_execute, curl_cmd)
+                for index, curl_cmd in read_only.items()
+            }
+            for index, future in futures.items():
+                responses[index], seconds = future.result()
+                group[index].timings.add('execute', seconds)
+    
+    passed_tests = 0
+    failed_tests = 0
+    
+    for index, example in enumerate(group):
+        if example.name is None:
+            log(f"Invalid testable entry format: {example.testable_entry}", "error", file_path, None, use_actions, action_level)
+            failed_tests += 1
+            continue
+        
+        if example.cached:
+            log(f"\nTesting example: {example.name}", "info")
+            log(f"  ✓ Example '{example.name}' PASSED (cached result)", "success")
+            passed_tests += 1
+            continue
+        
+        if test_example(document, test_config, example.name, example.expected_codes, file_path,
+                        use_actions, action_level, http_engine, responses.get(index), example.curl_cmd,
+                        example.timings):
+            passed_tests += 1
+            if cache is not None and example.cache_key:
+                cache.put(example.cache_key, {'file': file_path, 'example': example.name})
+        else:
+            failed_tests += 1
+    
+    return passed_tests, failed_tests
+
+
+def _tool_version() -> str:
+    """Digest of the code that decides verdicts, so cached results expire when it changes."""
+    global _TOOL_VERSION
+    if _TOOL_VERSION is None:
+        tools_dir = Path(__file__).parent
+        _TOOL_VERSION = ','.join(
+            file_digest(str(tools_dir / name))
+            for name in VERDICT_SOURCES
+        )
+    return _TOOL_VERSION
+
+
+def _database_path(local_database: str) -> str:
+    """Path of a front matter local_database, which may start with /."""
+    return local_database[1:] if local_database.startswith('/') else local_database
+
+
+def _mock_server_version() -> str:
+    """Server version of the --workers mock servers for result cache keys."""
+    return f"mock_service:{file_digest(str(Path(__file__).parent / 'mock_service.py'))}"
+
+
+def _mark_cached_examples(examples: List[_Example], cache: ResultCache) -> None:
+    """
+    Mark the examples that can report a cached result instead of running.
+    
+    If every example in the file passed before with the same keys, none of
+    them run. Otherwise every example from the first one without a cached
+    result runs, and so does every example before it that changes data,
+    since the later examples depend on that data.
+    """
+    hits = [example.cache_key is not None and cache.get(example.cache_key) is not None
+            for example in examples]
+    first_miss = hits.index(False) if False in hits else len(examples)
+    
+    for example in examples[:first_miss]:
+        if first_miss == len(examples) or is_read_only_command(example.curl_cmd):
+            example.cached = True
+    cache.add_reused(sum(example.cached for example in examples))
+
+
 def test_file(
     file_path: str,
     schema_path: str,
     use_actions: bool = False,
-    action_level: str = "warning"
+    action_level: str = "warning",
+    http_engine: str = 'builtin',
+    jobs: int = 1,
+    server_url: Optional[str] = None,
+    cache: Optional[ResultCache] = None,
+    server_version: str = '',
+    timings: Optional[TimingReport] = None
 ) -> Tuple[int, int, int]:
     """
     Test all examples in a documentation file.
@@ -497,6 +691,19 @@ def test_file(
         schema_path: Path to JSON schema file for validation
         use_actions: Whether to output GitHub Actions annotations
         action_level: Annotation level filter (all, warning, error)
+        http_engine: How to run the curl commands ('builtin' or 'curl')
+        jobs: Maximum number of read-only examples to run at the same time.
+              Examples that change data run one at a time, in order, and
+              results are reported in front matter order either way.
+        server_url: Server to substitute for {server_url} in the examples
+                    instead of the front matter's server_url
+        cache: Result cache; examples that passed before with the same
+               request, response, test configuration, database, and server
+               report the cached result instead of running
+        server_version: Server application and version the examples run
+                        on, if it isn't the front matter's test_apps
+        timings: Report to record the time of each phase of the file and
+                 its examples in
         
     Returns:
         tuple: (total_tests, passed_tests, failed_tests)
@@ -511,19 +718,42 @@ def test_file(
         >>> print(f"Ran {total} tests: {passed} passed, {failed} failed")
         Ran 3 tests: 3 passed, 0 failed
     """
+    file_timings = timings.start_file(file_path) if timings else NO_TIMINGS
+    try:
+        return _test_file(file_path, schema_path, use_actions, action_level, http_engine,
+                          jobs, server_url, cache, server_version, file_timings)
+    finally:
+        file_timings.finish()
+
+
+def _test_file(
+    file_path: str,
+    schema_path: str,
+    use_actions: bool,
+    action_level: str,
+    http_engine: str,
+    jobs: int,
+    server_url: Optional[str],
+    cache: Optional[ResultCache],
+    server_version: str,
+    file_timings: PhaseTimings
+) -> Tuple[int, int, int]:
+    """Test all examples in a documentation file; see test_file()."""
     log(f"\n{'='*60}", "info")
     log(f"Testing file: {file_path}", "info")
     log(f"{'='*60}", "info")
     
     # Read file content using shared utility
-    content = read_markdown_file(Path(file_path))
+    with file_timings.phase('read'):
+        content = read_markdown_file(Path(file_path))
     if content is None:
         log(f"File not found or unreadable: {file_path}", 
             "error", file_path, None, use_actions, action_level)
         return 0, 0, 0
     
     # Extract and parse front matter
-    metadata, error_message, error_line = parse_front_matter_with_errors(content)
+    with file_timings.phase('front_matter'):
+        metadata, error_message, error_line = parse_front_matter_with_errors(content)
     if not metadata:
         log("Front matter is required for all documentation files", 
             "error", file_path, error_line, use_actions, action_level)
@@ -531,9 +761,10 @@ def test_file(
         return 0, 0, 0
     
     # Validate front matter against schema
-    is_valid, has_warnings, errors, warnings = validate_front_matter_schema(
-        metadata, schema_path, file_path, use_actions, action_level
-    )
+    with file_timings.phase('schema'):
+        is_valid, has_warnings, errors, warnings = validate_front_matter_schema(
+            metadata, schema_path, file_path, use_actions, action_level
+        )
     
     if not is_valid:
         log("Front matter validation failed. Fix errors before testing examples", "error", file_path, None, use_actions, action_level)
@@ -553,6 +784,11 @@ def test_file(
         log("No testable examples marked in front matter", "info")
         return 0, 0, 0
     
+    documented_config = test_config
+    documented_server_url = test_config.get('server_url', '')
+    if server_url:
+        test_config = dict(test_config, server_url=server_url)
+    
     log(f"Testable examples found: {len(testable)}", "info")
     for item in testable:
         log(f"  - {item}", "info")
@@ -562,24 +798,402 @@ def test_file(
     passed_tests = 0
     failed_tests = 0
     
+    with file_timings.phase('extract'):
+        document = MarkdownIndex(content)
+    examples: List[_Example] = []
+    previous_key = None
+    database_digest = ''
+    if cache is not None:
+        database_digest = file_digest(_database_path(test_config.get('local_database', '')))
+    
     for testable_entry in testable:
         example_name, expected_codes = parse_testable_entry(testable_entry)
+        example = _Example(testable_entry, example_name, expected_codes)
         
-        if example_name is None:
-            log(f"Invalid testable entry format: {testable_entry}", "error", file_path, None, use_actions, action_level)
-            failed_tests += 1
+        if example_name is not None:
+            example.timings = file_timings.example(example_name)
+            if expected_codes is None:
+                # assign default expected HTTP status code
+                example.expected_codes = [200]
+            with example.timings.phase('extract'):
+                example.curl_cmd = extract_curl_command(document, test_config.get('server_url', ''), example_name)
+            if example.curl_cmd and server_url and documented_server_url:
+                # Examples that spell out the documented server use the given one too
+                example.curl_cmd = example.curl_cmd.replace(documented_server_url, server_url)
+            
+            if cache is not None and example.curl_cmd:
+                # Keys are chained, since earlier examples can change the data
+                response_block = document.find_code_block(example_name, 'response')
+                example.cache_key = previous_key = ResultCache.example_key(
+                    document.find_code_block(example_name, 'request').text,
+                    response_block.text if response_block else '',
+                    dict(documented_config, expected_codes=example.expected_codes),
+                    database_digest,
+                    server_version,
+                    previous_key,
+                    _tool_version()
+                )
+        
+        examples.append(example)
+    
+    if cache is not None:
+        _mark_cached_examples(examples, cache)
+    
+    # Examples are tested in groups that end with an example that changes
+    # data, so only read-only requests ever run concurrently
+    group: List[_Example] = []
+    
+    for example in examples:
+        group.append(example)
+        
+        if jobs > 1 and (example.cached or example.curl_cmd is None or is_read_only_command(example.curl_cmd)):
             continue
+        
+        passed, failed = _run_example_group(document, test_config, group, file_path,
+                                            use_actions, action_level, http_engine, jobs, cache)
+        passed_tests += passed
+        failed_tests += failed
+        group = []
+    
+    if group:
+        passed, failed = _run_example_group(document, test_config, group, file_path,
+                                            use_actions, action_level, http_engine, jobs, cache)
+        passed_tests += passed
+        failed_tests += failed
+    
+    return total_tests, passed_tests, failed_tests
 
-        if expected_codes is None:
-            # assign default expected HTTP status code
-            expected_codes = [200]
 
-        if test_example(content, test_config, example_name, expected_codes, file_path, use_actions, action_level):
-            passed_tests += 1
+def _front_matter_not_required(file_path: str) -> bool:
+    """
+    Check whether a file opts out of front matter in its first lines.
+    
+    Args:
+        file_path: Path to the markdown file
+        
+    Returns:
+        bool: True if the front matter not required comment is present
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for _ in range(FRONT_MATTER_NOT_REQUIRED_LINES):
+                line = f.readline()
+                if not line:
+                    break
+                if FRONT_MATTER_NOT_REQUIRED in line.lower():
+                    return True
+    except (OSError, UnicodeDecodeError):
+        pass
+    return False
+
+
+def reset_database(
+    local_database: str,
+    target_path: str,
+    server_url: Optional[str],
+    file_path: str,
+    use_actions: bool,
+    action_level: str,
+    manager: Optional[DatabaseStateManager] = None
+) -> bool:
+    """
+    Reset the test server's database to a document's local_database.
+    
+    With a server URL, the database state manager sends the server only the
+    changes needed to match local_database and confirms the server serves
+    it, copying the database over target_path if that isn't possible.
+    Without one, local_database is copied over target_path and the server
+    is given time to reload it.
+    
+    Args:
+        local_database: Database path from the front matter (leading / allowed)
+        target_path: Database file the test server watches
+        server_url: Server URL from the front matter, used to reset the server
+        file_path: Path to the markdown file (for annotations)
+        use_actions: Whether to output GitHub Actions annotations
+        action_level: Annotation level filter
+        manager: State manager for server_url, reused across resets
+        
+    Returns:
+        bool: True if the database was reset
+    """
+    db_path = _database_path(local_database)
+    
+    if not Path(db_path).is_file():
+        log(f"Database not found: {db_path}", "error", file_path, None, use_actions, action_level)
+        return False
+    
+    log(f"Resetting database from: {db_path}", "info")
+    
+    if not server_url:
+        try:
+            shutil.copyfile(db_path, target_path)
+        except OSError as e:
+            log(f"Could not reset database {target_path}: {e}", "error", file_path, None, use_actions, action_level)
+            return False
+        # Without a server URL the reload can't be confirmed, so give
+        # the test server time to detect and reload the file
+        time.sleep(DATABASE_RELOAD_SECONDS)
+        return True
+    
+    database, error = load_database(db_path)
+    if database is None:
+        log(error, "error", file_path, None, use_actions, action_level)
+        return False
+    
+    manager = manager or DatabaseStateManager(server_url, target_path)
+    reset, error = manager.reset(database, db_path)
+    if not reset:
+        log(f"Could not reset test server database: {error}", "error", None, None, use_actions, action_level)
+        return False
+    
+    if manager.last_method == 'endpoint':
+        log("  Database reset by the test server's reset endpoint", "info")
+    elif manager.last_method == 'rest':
+        log(f"  Database reset with {manager.last_changes} change(s)", "info")
+    else:
+        log(f"  Database reset by reloading {target_path}", "info")
+    return True
+
+
+def _test_file_on_mock_server(
+    server: Any,
+    file_path: str,
+    local_database: str,
+    schema_path: str,
+    use_actions: bool,
+    action_level: str,
+    http_engine: str,
+    jobs: int,
+    cache: Optional[ResultCache] = None,
+    timings: Optional[TimingReport] = None
+) -> Tuple[str, int, int, int, bool]:
+    """
+    Load a file's local_database into a mock server and test the file on it.
+    
+    Returns:
+        tuple: (file_path, total_tests, passed_tests, failed_tests, file_failed)
+    """
+    db_path = _database_path(local_database)
+    
+    if not Path(db_path).is_file():
+        log(f"Database not found: {db_path}", "error", file_path, None, use_actions, action_level)
+        return file_path, 0, 0, 0, True
+    
+    database, error = load_database(db_path)
+    if database is None:
+        log(error, "error", file_path, None, use_actions, action_level)
+        return file_path, 0, 0, 0, True
+    
+    # Same form as the front matter's server_url, since examples may add the scheme
+    host, port = server.server_address[:2]
+    server_url = f"{host}:{port}"
+    
+    log(f"Loading database from: {db_path} into {server_url}", "info")
+    server.database.load(database)
+    
+    total, passed, failed = test_file(file_path, schema_path, use_actions, action_level,
+                                      http_engine, jobs, server_url, cache, _mock_server_version(), timings)
+    return file_path, total, passed, failed, failed > 0
+
+
+def _test_files_on_mock_servers(
+    work: List[Tuple[str, str]],
+    schema_path: str,
+    use_actions: bool,
+    action_level: str,
+    http_engine: str,
+    jobs: int,
+    workers: int,
+    cache: Optional[ResultCache] = None,
+    timings: Optional[TimingReport] = None
+) -> List[Tuple[str, int, int, int, bool]]:
+    """
+    Test files on a pool of mock servers, one file per server at a time.
+    
+    Each file's output is collected while it's tested and printed in
+    one piece, in the order of work.
+    
+    Args:
+        work: (file_path, local_database) for each file to test
+        schema_path: Path to JSON schema file for validation
+        use_actions: Whether to output GitHub Actions annotations
+        action_level: Annotation level filter (all, warning, error)
+        http_engine: How to run the curl commands ('builtin' or 'curl')
+        jobs: Maximum number of read-only examples to run at the same time
+        workers: Number of mock servers to start
+        cache: Result cache for the examples, or None to run them all
+        timings: Report to record the time of each phase in
+        
+    Returns:
+        list: (file_path, total_tests, passed_tests, failed_tests, file_failed)
+              for each file, in the order of work
+    """
+    if not work:
+        return []
+    
+    servers = [start_server(MockDatabase({}), MOCK_SERVER_HOST, 0)
+               for _ in range(min(workers, len(work)))]
+    idle_servers: queue.Queue = queue.Queue()
+    for server in servers:
+        idle_servers.put(server)
+    log(f"\nTesting {len(work)} file(s) on {len(servers)} mock server(s)", "info")
+    
+    def run(file_path: str, local_database: str) -> Tuple[Tuple[str, int, int, int, bool], str]:
+        server = idle_servers.get()
+        try:
+            with capture_log() as output:
+                result = _test_file_on_mock_server(server, file_path, local_database, schema_path,
+                                                   use_actions, action_level, http_engine, jobs,
+                                                   cache, timings)
+            return result, output.getvalue()
+        finally:
+            idle_servers.put(server)
+    
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+            futures = [executor.submit(run, file_path, local_database)
+                       for file_path, local_database in work]
+            for future in futures:
+                result, output = future.result()
+                print(output, end='')
+                results.append(result)
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    
+    return results
+
+
+def test_files(
+    file_paths: List[str],
+    schema_path: str,
+    use_actions: bool = False,
+    action_level: str = "warning",
+    http_engine: str = 'builtin',
+    jobs: int = 1,
+    reset_target: Optional[str] = None,
+    workers: int = 0,
+    cache: Optional[ResultCache] = None,
+    timings: Optional[TimingReport] = None
+) -> List[Tuple[str, int, int, int, bool]]:
+    """
+    Test all examples in several documentation files in one run.
+    
+    Files are grouped by test configuration with group_files_by_config(),
+    so files that share a server and database are tested together. If
+    reset_target is set, the database is reset before each file in a group
+    and files without a local_database are skipped. Otherwise, files without
+    a local_database are tested after the groups.
+    
+    If workers is set, the files are tested on that many in-process mock
+    servers instead of the front matter's server, several files at a time.
+    Each mock server loads a file's local_database before testing it, and
+    files without a local_database are skipped.
+    
+    Args:
+        file_paths: Paths to the markdown files to test
+        schema_path: Path to JSON schema file for validation
+        use_actions: Whether to output GitHub Actions annotations
+        action_level: Annotation level filter (all, warning, error)
+        http_engine: How to run the curl commands ('builtin' or 'curl')
+        jobs: Maximum number of read-only examples to run at the same time
+        reset_target: Database file the test server watches, or None to
+                      leave the server's data alone
+        workers: Number of mock servers to test files on, or 0 to use the
+                 front matter's server
+        cache: Result cache; examples that passed before with the same keys
+               report the cached result instead of running
+        timings: Report to record the time of each phase of each file and
+                 example in
+        
+    Returns:
+        list: (file_path, total_tests, passed_tests, failed_tests, file_failed)
+              for each file that was tested, in the order they were tested
+
+    Example:
+        >>> results = test_files(
+        ...     ['docs/api/users-get-all-users.md', 'docs/api/users-get-user-by-id.md'],
+        ...     '.github/schemas/front-matter-schema.json',
+        ...     reset_target='/tmp/to-do-db-test.json'
+        ... )
+        >>> failed_files = [r[0] for r in results if r[4]]
+    """
+    results: List[Tuple[str, int, int, int, bool]] = []
+    testable_files = []
+    
+    for file_path in file_paths:
+        if not _front_matter_not_required(file_path):
+            testable_files.append(file_path)
+            continue
+        
+        if Path(file_path).parts[:1] == ('docs',):
+            log("Front matter is required for files in /docs directory", 
+                "error", file_path, None, use_actions, action_level)
+            results.append((file_path, 0, 0, 0, True))
+        elif Path(file_path).parts[:1] == ('assignments',):
+            log("Front matter is recommended for assignment files", 
+                "warning", file_path, None, use_actions, action_level)
+            log(f"Skipping {file_path} (front matter not required)", "info")
         else:
-            failed_tests += 1
+            log(f"Skipping {file_path} (front matter not required)", "info")
     
-    return total_tests, passed_tests, failed_tests
+    groups = get_test_configs.group_files_by_config([Path(f) for f in testable_files])
+    
+    if workers:
+        work = [(file_path, local_database)
+                for (_, _, local_database), group_files in groups.items()
+                for file_path in group_files]
+        grouped_files = {file_path for file_path, _ in work}
+        for file_path in testable_files:
+            if file_path not in grouped_files:
+                log(f"Skipping {file_path} (no valid test configuration)", "info")
+        results.extend(_test_files_on_mock_servers(work, schema_path, use_actions, action_level,
+                                                   http_engine, jobs, workers, cache, timings))
+        return results
+    
+    grouped_files = set()
+    # One database state manager per server, so its connections are reused
+    managers: Dict[str, DatabaseStateManager] = {}
+    
+    for group_number, ((test_apps, server_url, local_database), group_files) in enumerate(groups.items(), 1):
+        log(f"\nGroup {group_number}: {len(group_files)} file(s) using {local_database} "
+            f"on {server_url or 'default server'} ({test_apps or 'no test apps'})", "info")
+        
+        for file_path in group_files:
+            grouped_files.add(file_path)
+            
+            if reset_target:
+                manager = None
+                if server_url:
+                    if server_url not in managers:
+                        managers[server_url] = DatabaseStateManager(server_url, reset_target)
+                    manager = managers[server_url]
+                if not reset_database(local_database, reset_target, server_url,
+                                      file_path, use_actions, action_level, manager):
+                    results.append((file_path, 0, 0, 0, True))
+                    continue
+            
+            total, passed, failed = test_file(file_path, schema_path, use_actions, action_level,
+                                              http_engine, jobs, cache=cache, timings=timings)
+            results.append((file_path, total, passed, failed, failed > 0))
+    
+    for file_path in testable_files:
+        if file_path in grouped_files:
+            continue
+        if reset_target:
+            log(f"Skipping {file_path} (no valid test configuration)", "info")
+            continue
+        total, passed, failed = test_file(file_path, schema_path, use_actions, action_level,
+                                          http_engine, jobs, cache=cache, timings=timings)
+        results.append((file_path, total, passed, failed, failed > 0))
+    
+    for manager in managers.values():
+        manager.close()
+    
+    return results
 
 
 def main() -> None:
@@ -593,13 +1207,21 @@ Examples:
   %(prog)s --action docs/api.md           # GitHub Actions output (warnings and errors)
   %(prog)s --action all docs/api.md       # GitHub Actions output (all levels)
   %(prog)s --action error docs/api.md     # GitHub Actions output (errors only)
+  %(prog)s --http-engine curl docs/api.md # Run examples with the curl command
+  %(prog)s --jobs 4 docs/api.md           # Run up to 4 GET examples at a time
+  %(prog)s docs/api/*.md --reset-database /tmp/to-do-db-test.json
+                                          # Test many files, resetting the database
+  %(prog)s docs/api/*.md --workers 4      # Test 4 files at a time on mock servers
+  %(prog)s docs/api/*.md --no-cache       # Run every example, even ones that passed before
+  %(prog)s docs/api/*.md --profile        # Show where the time goes
         """
     )
     
     parser.add_argument(
-        'file',
+        'files',
+        nargs='+',
         type=str,
-        help='Path to the markdown documentation file to test'
+        help='Path(s) to the markdown documentation file(s) to test'
     )
     
     parser.add_argument(
@@ -619,27 +1241,128 @@ Examples:
         help='Path to JSON schema file for front matter validation'
     )
     
+    parser.add_argument(
+        '--http-engine',
+        default='builtin',
+        choices=HTTP_ENGINES,
+        help='Run examples with the built-in HTTP engine (default) or the curl command'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Run up to N read-only examples at the same time (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--reset-database',
+        metavar='DATABASE_FILE',
+        default=None,
+        help='Database file the test server watches; reset from each file\'s local_database before testing it'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Start N in-process json-server stand-ins and test up to N files at a time, '
+             'each on its own server loaded with the file\'s local_database '
+             '(default: 0, test on the running json-server)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Run every example, without reading or storing cached results'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        metavar='DIR',
+        help=f'Directory for cached results of passed examples (default: {DEFAULT_CACHE_DIR})'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print the time spent in each phase and the slowest files and examples'
+    )
+    
+    parser.add_argument(
+        '--timings-json',
+        metavar='FILE',
+        default=None,
+        help='Write the time spent in each phase of each file and example to FILE as JSON'
+    )
+    
     args = parser.parse_args()
     
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.workers < 0:
+        parser.error('--workers must be 0 or more')
+    if args.workers and args.reset_database:
+        parser.error('--workers starts its own servers and can\'t be used with --reset-database')
+
+    
+    use_actions = args.action is not None
+    action_level = args.action or 'warning'
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+    timings = TimingReport() if args.profile or args.timings_json else None
     
-    # Test the file
-    total, passed, failed = test_file(
-        args.file, 
-        args.schema, 
-        args.action is not None, 
-        args.action or 'warning'
+    results = test_files(
+        args.files,
+        args.schema,
+        use_actions,
+        action_level,
+        args.http_engine,
+        args.jobs,
+        args.reset_database,
+        args.workers,
+        cache,
+        timings
     )
     
+    total = sum(result[1] for result in results)
+    passed = sum(result[2] for result in results)
+    failed = sum(result[3] for result in results)
+    failed_files = [result[0] for result in results if result[4]]
+    
     # Print summary
-    log(f"TEST SUMMARY: {args.file}", "info")
+    if len(args.files) == 1:
+        log(f"TEST SUMMARY: {args.files[0]}", "info")
+    else:
+        log(f"\n{'='*60}", "info")
+        log(f"TEST SUMMARY: {len(args.files)} file(s)", "info")
+        log(f"  Files tested: {len(results)}", "info")
+        log(f"  Files failed: {len(failed_files)}", "error" if failed_files else "info")
+        for file_path in failed_files:
+            log(f"    - {file_path}", "info")
     log(f"  Total tests: {total}", "info")
     if passed > 0:
         log(f"  Passed: {passed}", "success")
     if failed > 0:
         log(f"  Failed: {failed}", "error")
+    if cache is not None and cache.reused:
+        log(f"  Cached results used: {cache.reused}", "info")
+    
+    if args.profile:
+        log(f"\n{'='*60}", "info")
+        for line in timings.summary_lines():
+            log(line, "info")
+    if args.timings_json:
+        error = timings.write_json(args.timings_json)
+        if error:
+            log(error, "warning")
     
     # Exit with appropriate code
-    if failed > 0:
+    if failed_files:
+        if len(args.files) > 1:
+            log(f"{len(failed_files)} file(s) failed testing", "error", None, None, use_actions, action_level)
         sys.exit(1)
     elif total == 0:
         log("No tests were run", "warning")
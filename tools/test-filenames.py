@@ -2,25 +2,46 @@
 """
 Validate filenames in changed files list for unsafe characters.
 
-This script checks filenames from the CHANGED_FILES environment variable
-for characters that could cause security issues or break shell commands.
+This script checks filenames from the CHANGED_FILES environment variable,
+or streamed from a file or stdin, for characters that could cause security
+issues or break shell commands.
+
+Streamed filenames are separated by newlines, or by NUL characters with
+--null, so names with commas or newlines can be checked too. They're
+checked as they're read, so memory use doesn't grow with the number of
+files.
 
 Usage:
     test-filenames.py [--action LEVEL]
+    test-filenames.py --files-from FILE [--null] [--action LEVEL]
+
+Arguments:
+    --files-from: File with one filename per entry, or - for stdin
+    --null, -z: Entries are separated by NUL characters instead of newlines
 
 Environment:
-    CHANGED_FILES: Comma-separated list of changed filenames
+    CHANGED_FILES: Comma-separated list of changed filenames, used when
+                   --files-from isn't given
+
+Examples:
+    git diff --name-only -z origin/main | test-filenames.py --files-from - -z
 """
 
 import os
 import re
 import sys
 import argparse
-from typing import List
+from typing import List, Iterable, Iterator, BinaryIO, Tuple
 
 # Import shared utilities
 from doc_test_utils import log
 
+# Pattern matches any unsafe character
+UNSAFE_FILENAME_PATTERN = re.compile(r"[\s,\*\?\[\]\|\&;\$`\"'<>():\\]")
+
+# Bytes read from a filename stream at a time
+READ_SIZE = 64 * 1024
+
 
 def get_changed_files() -> List[str]:
     """
@@ -42,6 +63,45 @@ def get_changed_files() -> List[str]:
     return [f.strip() for f in changed.split(',') if f.strip()]
 
 
+def iter_filenames(stream: BinaryIO, delimiter: bytes = b'\n') -> Iterator[str]:
+    """
+    Read filenames from a stream as they arrive.
+    
+    Names are decoded as UTF-8, with undecodable bytes replaced. Empty
+    entries are skipped, and with newline delimiters a trailing carriage
+    return is dropped. Only one read buffer and one partial name are held
+    in memory at a time.
+    
+    Args:
+        stream: Binary stream, like sys.stdin.buffer
+        delimiter: b'\\n' or b'\\0'
+        
+    Yields:
+        Each filename, without its delimiter
+        
+    Example:
+        >>> list(iter_filenames(io.BytesIO(b'a.md\\0b,c.md\\0'), b'\\0'))
+        ['a.md', 'b,c.md']
+    """
+    remainder = b''
+    while True:
+        chunk = stream.read(READ_SIZE)
+        if not chunk:
+            break
+        entries = (remainder + chunk).split(delimiter)
+        remainder = entries.pop()
+        for entry in entries:
+            if delimiter == b'\n' and entry.endswith(b'\r'):
+                entry = entry[:-1]
+            if entry:
+                yield entry.decode('utf-8', errors='replace')
+    
+    if delimiter == b'\n' and remainder.endswith(b'\r'):
+        remainder = remainder[:-1]
+    if remainder:
+        yield remainder.decode('utf-8', errors='replace')
+
+
 def validate_filenames(files: List[str]) -> List[str]:
     """
     Check filenames for unsafe characters.
@@ -62,15 +122,35 @@ def validate_filenames(files: List[str]) -> List[str]:
         >>> validate_filenames(['safe.py', 'un safe.py', 'bad;file.md'])
         ['un safe.py', 'bad;file.md']
     """
-    # Pattern matches any unsafe character
-    unsafe = re.compile(r"[\s,\*\?\[\]\|\&;\$`\"'<>():\\]")
+    search = UNSAFE_FILENAME_PATTERN.search
+    return [filename for filename in files if search(filename)]
+
+
+def _printable(filename: str) -> str:
+    """Escape control characters, so a name can't start a new log line or workflow command."""
+    return filename if filename.isprintable() else repr(filename)[1:-1]
+
+
+def check_filenames(files: Iterable[str]) -> Tuple[int, int]:
+    """
+    Check filenames one at a time and log each unsafe one.
     
-    bad_files = []
+    Args:
+        files: Filenames, from a list or a stream
+        
+    Returns:
+        Tuple of (files checked, unsafe files)
+    """
+    search = UNSAFE_FILENAME_PATTERN.search
+    checked = 0
+    unsafe = 0
     for filename in files:
-        if unsafe.search(filename):
-            bad_files.append(filename)
-    
-    return bad_files
+        checked += 1
+        log(f"Changed file to check: {_printable(filename)}", "info")
+        if search(filename):
+            unsafe += 1
+            log(f"Unsafe filename: {_printable(filename)}", "error")
+    return checked, unsafe
 
 
 def main():
@@ -83,12 +163,26 @@ Examples:
   %(prog)s                              # Normal output
   %(prog)s --action warning             # GitHub Actions output (warnings)
   %(prog)s --action error               # GitHub Actions output (errors only)
+  git diff --name-only -z main | %(prog)s --files-from - -z
 
 Environment:
   CHANGED_FILES    Comma-separated list of changed filenames
         """
     )
     
+    parser.add_argument(
+        '--files-from',
+        default=None,
+        metavar='FILE',
+        help='Read filenames from FILE, or from stdin if FILE is -, instead of CHANGED_FILES'
+    )
+    
+    parser.add_argument(
+        '--null', '-z',
+        action='store_true',
+        help='Filenames read with --files-from are separated by NUL characters, not newlines'
+    )
+    
     parser.add_argument(
         '--action', '-a',
         type=str,
@@ -104,28 +198,31 @@ Environment:
     use_actions = args.action is not None
     action_level = args.action or 'warning'
     
-    # Get changed files from environment
-    files = get_changed_files()
-    for f in files:
-        log(f"Changed file to check: {f}", "info")
-    
-    if not files:
+    if args.null and args.files_from is None:
+        parser.error('--null requires --files-from')
+    
+    # Validate filenames as they're read from the stream or environment
+    if args.files_from is None:
+        checked, unsafe = check_filenames(get_changed_files())
+    elif args.files_from == '-':
+        checked, unsafe = check_filenames(iter_filenames(sys.stdin.buffer, b'\0' if args.null else b'\n'))
+    else:
+        try:
+            with open(args.files_from, 'rb') as stream:
+                checked, unsafe = check_filenames(iter_filenames(stream, b'\0' if args.null else b'\n'))
+        except OSError as e:
+            log(f"Unable to read {args.files_from}: {e}", "error")
+            sys.exit(1)
+    
+    if not checked:
         log("No changed files reported", "info")
         sys.exit(0)
     
-    log(f"Checking {len(files)} changed files for unsafe characters", "info")
+    log(f"Checked {checked} changed files for unsafe characters", "info")
     
-    # Validate filenames
-    unsafe_files = validate_filenames(files)
-    
-    if unsafe_files:
-        # Log each unsafe filename
-        log("Unsafe filenames detected:", "error")
-        for filename in unsafe_files:
-            log(f"  {filename}", "error")
-        
+    if unsafe:
         # Create GitHub Actions annotation
-        log(f"Found {len(unsafe_files)} unsafe filenames in changed-files list",
+        log(f"Found {unsafe} unsafe filenames in changed-files list",
             "error",
             None,
             None,
@@ -17,7 +17,7 @@ from pathlib import Path
 
 # Import from doc_test_utils
 sys.path.insert(0, str(Path(__file__).parent))
-from doc_test_utils import parse_front_matter_with_errors, read_markdown_file
+from doc_test_utils import parse_front_matter_with_errors, read_front_matter_text
 
 
 def main():
@@ -51,7 +51,7 @@ Examples:
     print(f"Testing: {filepath}")
     print("=" * 60)
     
-    content = read_markdown_file(filepath)
+    content = read_front_matter_text(filepath)
     if content is None:
         print("✗ ERROR: Could not read file")
         sys.exit(1)
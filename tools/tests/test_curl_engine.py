@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Tests for curl_engine module.
+
+Covers:
+- Parsing documented curl commands (methods, headers, data, flags)
+- Rejecting commands that need the curl subprocess
+- Sending requests over pooled keep-alive connections
+- Connection error reporting
+
+Run with:
+    python3 test_curl_engine.py
+    pytest test_curl_engine.py -v
+"""
+
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from curl_engine import parse_curl_command, execute_request, HttpConnectionPool
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Echo the request method, path, headers, and body back as JSON."""
+    protocol_version = 'HTTP/1.1'
+
+    def _echo(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else None
+        payload = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'content_type': self.headers.get('Content-Type'),
+            'body': body,
+            'client_port': self.client_address[1],
+        }).encode('utf-8')
+        self.send_response(201 if self.command == 'POST' else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _echo
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_echo_server():
+    """Start the echo server on a free port and return it."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_parse_curl_command():
+    """Test parsing of documented curl commands."""
+    print("\n" + "="*60)
+    print("TEST: parse_curl_command()")
+    print("="*60)
+
+    # Test 1: Simple GET with -i
+    request = parse_curl_command('curl -i http://localhost:3000/users')
+    assert request is not None, "Should parse simple GET"
+    assert request.method == 'GET', f"Expected GET, got {request.method}"
+    assert request.url == 'http://localhost:3000/users'
+    assert request.body is None
+    print("  SUCCESS: Simple GET parsed")
+
+    # Test 2: Multi-line command with --url and -G
+    request = parse_curl_command(
+        'curl -G -H "Accept: application/json" \\\n    --url "http://localhost:3000/users"'
+    )
+    assert request is not None, "Should parse line continuations"
+    assert request.method == 'GET'
+    assert request.headers == [('Accept', 'application/json')]
+    print("  SUCCESS: Line continuations and --url parsed")
+
+    # Test 3: POST with JSON data
+    request = parse_curl_command(
+        "curl -i -X POST http://localhost:3000/users \\\n"
+        "  -H \"Content-Type: application/json\" \\\n"
+        "  -d '{\"name\": \"a (b); c|d\"}'"
+    )
+    assert request is not None, "Should parse POST with data"
+    assert request.method == 'POST'
+    assert request.body == b'{"name": "a (b); c|d"}', f"Unexpected body: {request.body}"
+    print("  SUCCESS: POST with quoted JSON body parsed")
+
+    # Test 4: Data implies POST, -G moves data to the query string
+    assert parse_curl_command("curl localhost:3000/users -d 'a=1'").method == 'POST'
+    request = parse_curl_command("curl -G localhost:3000/users -d 'userId=1'")
+    assert request.method == 'GET'
+    assert request.url == 'http://localhost:3000/users?userId=1', f"Unexpected URL: {request.url}"
+    print("  SUCCESS: Data method rules and -G handled")
+
+    # Test 5: Combined and attached short flags, --json
+    request = parse_curl_command("curl -sSi -XPATCH localhost:3000/users/1 --json '{\"a\": 1}'")
+    assert request is not None, "Should parse combined flags"
+    assert request.method == 'PATCH'
+    assert ('Content-Type', 'application/json') in request.headers
+    print("  SUCCESS: Combined flags and --json parsed")
+
+    # Test 6: Commands that need curl or a shell
+    for command in [
+        'curl $SERVER/users',
+        'curl http://localhost:3000/users | jq .',
+        'curl -o out.json http://localhost:3000/users',
+        'curl -d @body.json http://localhost:3000/users',
+        'wget http://localhost:3000/users',
+        'curl -X GET',
+    ]:
+        assert parse_curl_command(command) is None, f"Should not parse: {command}"
+    print("  SUCCESS: Unsupported commands left for curl")
+
+    print("  ✓ All parse_curl_command tests passed")
+
+
+def test_execute_request_reuses_connection():
+    """Test requests over a pooled keep-alive connection."""
+    print("\n" + "="*60)
+    print("TEST: execute_request() with connection pool")
+    print("="*60)
+
+    server = _start_echo_server()
+    pool = HttpConnectionPool()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        # Test 1: GET returns status, headers, and body
+        request = parse_curl_command(f'curl -i {base_url}/users?id=1')
+        status_code, headers, body = execute_request(request, pool)
+        assert status_code == 200, f"Expected 200, got {status_code}"
+        assert headers.startswith('HTTP/1.1 200'), f"Unexpected headers: {headers}"
+        first = json.loads(body)
+        assert first['path'] == '/users?id=1', f"Unexpected path: {first['path']}"
+        print("  SUCCESS: GET response parsed")
+
+        # Test 2: POST body and content type are sent
+        request = parse_curl_command(
+            f"curl -X POST {base_url}/users -H 'Content-Type: application/json' -d '{{\"id\": 3}}'"
+        )
+        status_code, _, body = execute_request(request, pool)
+        second = json.loads(body)
+        assert status_code == 201, f"Expected 201, got {status_code}"
+        assert second['body'] == '{"id": 3}', f"Unexpected body: {second['body']}"
+        assert second['content_type'] == 'application/json'
+        print("  SUCCESS: POST body sent")
+
+        # Test 3: Both requests used the same TCP connection
+        assert first['client_port'] == second['client_port'], "Should reuse the keep-alive connection"
+        print("  SUCCESS: Connection reused")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    print("  ✓ All execute_request tests passed")
+
+
+def test_execute_request_connection_refused():
+    """Test error reporting when no server is listening."""
+    print("\n" + "="*60)
+    print("TEST: execute_request() connection refused")
+    print("="*60)
+
+    # Bind and close a socket to get a port nothing listens on
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    port = server.server_address[1]
+    server.server_close()
+
+    request = parse_curl_command(f'curl http://127.0.0.1:{port}/users')
+    status_code, headers, message = execute_request(request, HttpConnectionPool())
+    assert status_code is None, "Should not return a status code"
+    assert headers is None, "Should not return headers"
+    assert 'Failed to connect' in message, f"Unexpected message: {message}"
+    print("  SUCCESS: Connection refused reported")
+
+    print("  ✓ Connection error test passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR curl_engine.py")
+    print("="*70)
+
+    tests = [
+        test_parse_curl_command,
+        test_execute_request_reuses_connection,
+        test_execute_request_connection_refused,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Tests for database_state module.
+
+Covers:
+- Loading local_database files
+- Resetting a json-server-like server by replaying only the differences
+- Cascading deletes and record order
+- Falling back to the watched database file
+- Resetting the mock_service.py server through its reset endpoint
+
+Run with:
+    python3 test_database_state.py
+    pytest test_database_state.py -v
+"""
+
+import sys
+import json
+import copy
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database_state import DatabaseStateManager, load_database
+from mock_service import MockDatabase, start_server
+
+
+DATABASE = {
+    "users": [
+        {"id": 1, "firstName": "Ann"},
+        {"id": 2, "firstName": "Bo"},
+    ],
+    "tasks": [
+        {"id": 1, "userId": 1, "title": "Shop"},
+        {"id": 2, "userId": 2, "title": "Cook"},
+    ],
+}
+
+
+class _RestHandler(BaseHTTPRequestHandler):
+    """Serve an in-memory database with json-server 0.17 write behavior."""
+    protocol_version = 'HTTP/1.1'
+    data = {}
+    writes = []
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _target(self):
+        parts = self.path.strip('/').split('/')
+        record_id = int(parts[1]) if len(parts) > 1 else None
+        return parts[0], record_id
+
+    def _read_body(self):
+        return json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+
+    def do_GET(self):
+        name, _ = self._target()
+        if name == 'db':
+            self._send(200, self.data)
+        elif name in self.data:
+            self._send(200, self.data[name])
+        else:
+            self._send(404, {})
+
+    def do_POST(self):
+        name, _ = self._target()
+        record = self._read_body()
+        if name not in self.data:
+            self._send(404, {})
+            return
+        self.writes.append(('POST', self.path))
+        self.data[name].append(record)
+        self._send(201, record)
+
+    def do_PUT(self):
+        name, record_id = self._target()
+        record = self._read_body()
+        self.writes.append(('PUT', self.path))
+        records = self.data[name]
+        for index, existing in enumerate(records):
+            if existing['id'] == record_id:
+                records[index] = record
+                self._send(200, record)
+                return
+        self._send(404, {})
+
+    def do_DELETE(self):
+        name, record_id = self._target()
+        self.writes.append(('DELETE', self.path))
+        before = len(self.data[name])
+        self.data[name] = [r for r in self.data[name] if r['id'] != record_id]
+        if len(self.data[name]) == before:
+            self._send(404, {})
+            return
+        # Delete dependents, like json-server does for userId
+        foreign_key = f"{name[:-1]}Id"
+        for other in self.data:
+            self.data[other] = [r for r in self.data[other] if r.get(foreign_key) != record_id]
+        self._send(200, {})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Serve collections read-only from a database file."""
+    protocol_version = 'HTTP/1.1'
+    database_path = None
+
+    def do_GET(self):
+        data = json.loads(Path(self.database_path).read_text(encoding='utf-8'))
+        collection = self.path.strip('/')
+        body = json.dumps(data.get(collection, {})).encode('utf-8')
+        self.send_response(200 if collection in data else 404)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server(handler):
+    """Start a server on a free port and return it with its URL."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"127.0.0.1:{server.server_address[1]}"
+
+
+def test_load_database():
+    """Test loading local_database files."""
+    print("\n" + "="*60)
+    print("TEST: load_database()")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        good = Path(temp_dir) / 'db.json'
+        good.write_text(json.dumps(DATABASE), encoding='utf-8')
+        database, error = load_database(str(good))
+        assert database == DATABASE and error is None, f"Unexpected result: {database}, {error}"
+        print("  SUCCESS: Database loaded")
+
+        bad = Path(temp_dir) / 'bad.json'
+        bad.write_text('{"users": [', encoding='utf-8')
+        database, error = load_database(str(bad))
+        assert database is None and 'not valid JSON' in error, f"Unexpected error: {error}"
+
+        database, error = load_database(str(Path(temp_dir) / 'missing.json'))
+        assert database is None and 'Could not read' in error, f"Unexpected error: {error}"
+
+        bad.write_text('[]', encoding='utf-8')
+        database, error = load_database(str(bad))
+        assert database is None and 'JSON object' in error, f"Unexpected error: {error}"
+        print("  SUCCESS: Errors reported")
+
+    print("  ✓ All load_database tests passed")
+
+
+def test_reset_replays_differences():
+    """Test resetting a server through its REST API."""
+    print("\n" + "="*60)
+    print("TEST: DatabaseStateManager.reset() through the REST API")
+    print("="*60)
+
+    _RestHandler.data = {"users": [], "tasks": []}
+    _RestHandler.writes = []
+    server, server_url = _start_server(_RestHandler)
+    manager = DatabaseStateManager(server_url)
+
+    try:
+        # Test 1: An empty server gets every record
+        reset, error = manager.reset(DATABASE)
+        assert reset and error is None, f"Reset failed: {error}"
+        assert _RestHandler.data == DATABASE, f"Unexpected data: {_RestHandler.data}"
+        assert manager.last_method == 'rest' and manager.last_changes == 4
+        print("  SUCCESS: Empty server filled")
+
+        # Test 2: Only changed records are sent
+        _RestHandler.writes = []
+        _RestHandler.data["tasks"][1]["title"] = "Changed"
+        _RestHandler.data["users"].append({"id": 3, "firstName": "Cy"})
+        reset, error = manager.reset(DATABASE)
+        assert reset, f"Reset failed: {error}"
+        assert _RestHandler.data == DATABASE, f"Unexpected data: {_RestHandler.data}"
+        assert sorted(_RestHandler.writes) == [('DELETE', '/users/3'), ('PUT', '/tasks/2')], \
+            f"Unexpected writes: {_RestHandler.writes}"
+        print("  SUCCESS: Only differences replayed")
+
+        # Test 3: A reset of an unchanged server sends nothing
+        _RestHandler.writes = []
+        reset, error = manager.reset(DATABASE)
+        assert reset and _RestHandler.writes == [] and manager.last_changes == 0
+        print("  SUCCESS: Unchanged server left alone")
+
+        # Test 4: A deleted user (and its cascaded tasks) is restored in order
+        _RestHandler.data = {
+            "users": [{"id": 2, "firstName": "Bo"}],
+            "tasks": [{"id": 2, "userId": 2, "title": "Cook"}],
+        }
+        reset, error = manager.reset(DATABASE)
+        assert reset, f"Reset failed: {error}"
+        assert _RestHandler.data == DATABASE, f"Order not restored: {_RestHandler.data}"
+        print("  SUCCESS: Record order restored")
+    finally:
+        manager.close()
+        server.shutdown()
+        server.server_close()
+
+    print("  ✓ All REST reset tests passed")
+
+
+def test_reset_falls_back_to_file():
+    """Test resetting a read-only server by copying its database file."""
+    print("\n" + "="*60)
+    print("TEST: DatabaseStateManager.reset() file fallback")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        watched = Path(temp_dir) / 'watched.json'
+        watched.write_text('{"users": [], "tasks": []}', encoding='utf-8')
+        source = Path(temp_dir) / 'db.json'
+        source.write_text(json.dumps(DATABASE), encoding='utf-8')
+
+        _FileHandler.database_path = str(watched)
+        server, server_url = _start_server(_FileHandler)
+
+        try:
+            # Test 1: The database file is copied and confirmed
+            manager = DatabaseStateManager(server_url, str(watched))
+            reset, error = manager.reset(copy.deepcopy(DATABASE), str(source))
+            assert reset, f"Reset failed: {error}"
+            assert manager.last_method == 'file'
+            assert json.loads(watched.read_text(encoding='utf-8')) == DATABASE
+            manager.close()
+            print("  SUCCESS: Database file copied")
+
+            # Test 2: Without a watched file, the reset fails
+            manager = DatabaseStateManager(server_url)
+            reset, error = manager.reset({"users": [{"id": 9}], "tasks": []})
+            assert not reset and 'Could not reset database' in error, f"Unexpected error: {error}"
+            manager.close()
+            print("  SUCCESS: Reset failure reported")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print("  ✓ All file fallback tests passed")
+
+
+def test_reset_endpoint():
+    """Test resetting the mock service with its reset endpoint."""
+    print("\n" + "="*60)
+    print("TEST: DatabaseStateManager.reset() with a reset endpoint")
+    print("="*60)
+
+    server = start_server(MockDatabase({"users": [], "tasks": []}), host='127.0.0.1', port=0)
+    manager = DatabaseStateManager(server.url)
+
+    try:
+        reset, error = manager.reset(DATABASE)
+        assert reset, f"Reset failed: {error}"
+        assert manager.last_method == 'endpoint' and manager.has_reset_endpoint
+        assert server.database.to_dict() == DATABASE, f"Unexpected data: {server.database.to_dict()}"
+        print("  SUCCESS: Mock service reset in one request")
+    finally:
+        manager.close()
+        server.shutdown()
+        server.server_close()
+
+    # A server without the endpoint is only asked once
+    _RestHandler.data = {"users": [], "tasks": []}
+    rest_server, server_url = _start_server(_RestHandler)
+    manager = DatabaseStateManager(server_url)
+    try:
+        assert manager.reset(DATABASE)[0] and manager.has_reset_endpoint is False
+        assert manager.reset(DATABASE)[0] and manager.last_method == 'rest'
+        print("  SUCCESS: Servers without the endpoint use the REST API")
+    finally:
+        manager.close()
+        rest_server.shutdown()
+        rest_server.server_close()
+
+    print("  ✓ All reset endpoint tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR database_state.py")
+    print("="*70)
+
+    tests = [
+        test_load_database,
+        test_reset_replays_differences,
+        test_reset_falls_back_to_file,
+        test_reset_endpoint,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -10,17 +10,26 @@ Run with:
 
 import sys
 import io
+import tempfile
+import threading
 from pathlib import Path
 
+import yaml
+
 # Add parent directory to path to import doc_test_utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from doc_test_utils import (
     parse_front_matter,
+    parse_front_matter_with_errors,
     read_markdown_file,
+    read_front_matter_text,
+    set_front_matter_cache_dir,
+    clear_front_matter_cache,
     get_test_config,
     get_server_database_key,
-    log
+    log,
+    capture_log
 )
 
 
@@ -238,6 +247,51 @@ def test_log_github_actions():
     print("  ✓ GitHub Actions annotation tests passed")
 
 
+def test_capture_log():
+    """Test collecting log output per thread."""
+    print("\n" + "="*60)
+    print("TEST: capture_log()")
+    print("="*60)
+    
+    captured_output = io.StringIO()
+    original_stdout = sys.stdout
+    thread_outputs = {}
+    
+    def worker(name):
+        with capture_log() as output:
+            for number in range(50):
+                log(f"{name} {number}", "info")
+        thread_outputs[name] = output.getvalue()
+    
+    try:
+        sys.stdout = captured_output
+        
+        with capture_log() as output:
+            log("Captured message", "error", "test.md", 3, True, "error")
+        log("Printed message", "info")
+        
+        threads = [threading.Thread(target=worker, args=(name,)) for name in ('a', 'b')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.stdout = original_stdout
+    
+    assert output.getvalue() == "ERROR: Captured message\n::error file=test.md,line=3::Captured message\n", \
+        f"Unexpected capture: {output.getvalue()!r}"
+    assert captured_output.getvalue() == "INFO: Printed message\n", \
+        f"Only uncaptured output should be printed: {captured_output.getvalue()!r}"
+    print("  SUCCESS: Output and annotations captured")
+    
+    for name in ('a', 'b'):
+        expected = ''.join(f"INFO: {name} {number}\n" for number in range(50))
+        assert thread_outputs[name] == expected, f"Thread {name} output mixed"
+    print("  SUCCESS: Each thread captured only its own output")
+    
+    print("  ✓ All capture_log tests passed")
+
+
 def test_read_markdown_file():
     """Test reading markdown files with error handling."""
     print("\n" + "="*60)
@@ -274,6 +328,122 @@ layout: default
     print("  ✓ All read_markdown_file tests passed")
 
 
+def test_read_front_matter_text():
+    """Test reading only the front matter of markdown files."""
+    print("\n" + "="*60)
+    print("TEST: read_front_matter_text()")
+    print("="*60)
+    
+    test_dir = Path(__file__).parent / "test_data"
+    test_dir.mkdir(exist_ok=True)
+    test_file = test_dir / "test_front_matter_only.md"
+    
+    # Test 1: Reading stops after the closing delimiter
+    test_file.write_text("---\nlayout: default\n---\n# Body\n---\nmore: text\n", encoding='utf-8')
+    assert read_front_matter_text(test_file) == "---\nlayout: default\n---\n"
+    print("  SUCCESS: Body not read")
+    
+    # Test 2: Parsing gives the same metadata, errors, and lines as the whole file
+    cases = [
+        "---\ntitle: Test\ntest:\n  testable:\n    - GET example\n---\n# Body\n",
+        "---\ntitle: Test\ninvalid: [unclosed\n---\n# Body\n",
+        "---\n\n---\n",
+        "---\n---\n# Body\n",
+        "---\ntitle: Test\n# Body without closing delimiter\n",
+        "  ---\ntitle: Test\n---\n",
+        "\n\n---\ntitle: Test\n---\n",
+        "# No front matter\n---\ntitle: Test\n---\n",
+        "--- title\n---\n",
+        "---\r\ntitle: Test\r\n---\r\n# Body\r\n",
+        "---\ntitle: Test\n----\n---\n# Body\n",
+        "---\ntitle: Test\n---foo\nmore: text\n---\n",
+        "---\ntitle: Test\n---  \n",
+        "---\ntitle: Test\n---",
+        "",
+    ]
+    for content in cases:
+        test_file.write_bytes(content.encode('utf-8'))
+        full = parse_front_matter_with_errors(read_markdown_file(test_file))
+        header = parse_front_matter_with_errors(read_front_matter_text(test_file))
+        assert header == full, f"Different result for {content!r}: {header} != {full}"
+    print("  SUCCESS: Same results as parsing the whole file")
+    
+    # Test 3: Only a line of --- closes the front matter
+    test_file.write_text("---\ntitle: Test\ndescription: |\n  ----\n---\n# Body\n", encoding='utf-8')
+    header = read_front_matter_text(test_file)
+    assert header == "---\ntitle: Test\ndescription: |\n  ----\n---\n"
+    metadata, error, _ = parse_front_matter_with_errors(header)
+    assert error is None and metadata['description'] == '----', f"Unexpected: {metadata}, {error}"
+    test_file.write_text("---\ntitle: Test\n----\n---\n# Body\n", encoding='utf-8')
+    assert read_front_matter_text(test_file) == "---\ntitle: Test\n----\n---\n"
+    print("  SUCCESS: ---- line read as front matter")
+    
+    # Test 4: Unreadable files
+    assert read_front_matter_text(test_dir / "nonexistent.md") is None
+    print("  SUCCESS: Non-existent file returns None")
+    
+    test_file.unlink()
+    
+    print("  ✓ All read_front_matter_text tests passed")
+
+
+def test_front_matter_cache():
+    """Test the YAML loader and the caches of parsed front matter."""
+    print("\n" + "="*60)
+    print("TEST: Front matter caches")
+    print("="*60)
+    
+    content = "---\ntitle: Test\ntest:\n  testable:\n    - GET example\n---\n# Body\n"
+    clear_front_matter_cache()
+    
+    # Test 1: Each caller gets its own copy of cached front matter
+    first = parse_front_matter(content)
+    first['test']['testable'].append('changed')
+    assert parse_front_matter(content) == {'title': 'Test', 'test': {'testable': ['GET example']}}
+    print("  SUCCESS: Cached front matter copied")
+    
+    # Test 2: Errors read the same as with the pure-Python loader
+    broken = "---\ntitle: Test\nlist: [1, 2\nother: value\n---\n"
+    metadata, error, line = parse_front_matter_with_errors(broken)
+    try:
+        yaml.load("title: Test\nlist: [1, 2\nother: value", Loader=yaml.SafeLoader)
+        assert False, "Expected a YAML error"
+    except yaml.YAMLError as e:
+        assert metadata is None and str(e) in error, f"Unexpected error: {error}"
+        assert line == e.problem_mark.line + 2
+    print("  SUCCESS: Same errors and lines")
+    
+    # Test 3: Values that aren't JSON are parsed without the caches
+    metadata = parse_front_matter("---\n1: one\ndate: 2024-01-15\n---\n")
+    assert metadata[1] == 'one' and str(metadata['date']) == '2024-01-15'
+    print("  SUCCESS: Non-JSON values parsed")
+    
+    # Test 4: Parsed front matter is shared through the cache directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_front_matter_cache_dir(temp_dir)
+        try:
+            clear_front_matter_cache()
+            parse_front_matter(content)
+            cached_files = list(Path(temp_dir).glob('*.json'))
+            assert len(cached_files) == 1, f"Unexpected cache files: {cached_files}"
+            
+            # Read from disk by a new process, here by forgetting memory
+            cached_files[0].write_text('{"title": "From disk"}', encoding='utf-8')
+            clear_front_matter_cache()
+            assert parse_front_matter(content) == {'title': 'From disk'}
+            
+            # A damaged file is ignored
+            cached_files[0].write_text('{"title', encoding='utf-8')
+            clear_front_matter_cache()
+            assert parse_front_matter(content)['title'] == 'Test'
+        finally:
+            set_front_matter_cache_dir(None)
+            clear_front_matter_cache()
+    print("  SUCCESS: On-disk cache used")
+    
+    print("  ✓ All front matter cache tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*70)
@@ -286,7 +456,10 @@ def run_all_tests():
         test_get_server_database_key,
         test_log_console_output,
         test_log_github_actions,
-        test_read_markdown_file
+        test_capture_log,
+        test_read_markdown_file,
+        test_read_front_matter_text,
+        test_front_matter_cache
     ]
     
     passed = 0
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for doc_tools_daemon module and the doc-tools.py client.
+
+Covers:
+- Running a tool's main() with captured output and exit code
+- Serving requests on a Unix socket
+- Stopping when a tool's source changes
+- Streaming output frames as a tool prints
+- Process pools and environment settings of tools run by the daemon
+
+Run with:
+    python3 test_doc_tools_daemon.py
+    pytest test_doc_tools_daemon.py -v
+"""
+
+import sys
+import os
+import json
+import socket
+import tempfile
+import multiprocessing
+import threading
+import importlib.util
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = TOOLS_DIR.parent
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(TOOLS_DIR))
+
+import doc_tools_daemon
+import doc_test_utils
+import help_urls
+from doc_tools_daemon import DocToolsDaemon, load_tool, run_tool, _bind, _FrameWriter
+
+spec = importlib.util.spec_from_file_location("doc_tools_client", TOOLS_DIR / "doc-tools.py")
+client_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(client_module)
+
+DOC_FILE = 'docs/api/users-get-all-users.md'
+
+
+def test_run_tool():
+    """Test running a loaded tool like a command."""
+    print("\n" + "="*60)
+    print("TEST: run_tool()")
+    print("="*60)
+
+    module = load_tool('get-database-path')
+    saved_cwd = os.getcwd()
+    env = dict(os.environ, DOC_TOOLS_TEST='1')
+
+    # Test 1: Output and exit code of a successful run
+    result = run_tool(module, 'get-database-path', [DOC_FILE], str(REPO_ROOT), env)
+    assert result == {'exit_code': 0, 'output': [['stdout', 'api/to-do-db-source-test.json\n']]}, \
+        f"Unexpected result: {result}"
+    print("  SUCCESS: Output and exit code captured")
+
+    # Test 2: Errors go to stderr, and the exit code is kept
+    result = run_tool(module, 'get-database-path', [], str(REPO_ROOT), env)
+    assert result['exit_code'] == 1
+    assert [stream for stream, _ in result['output']] == ['stderr']
+    assert 'Exactly one filename required' in result['output'][0][1]
+    print("  SUCCESS: Error output and exit code captured")
+
+    # Test 3: The working directory and environment are restored
+    assert os.getcwd() == saved_cwd and 'DOC_TOOLS_TEST' not in os.environ
+    result = run_tool(module, 'get-database-path', [DOC_FILE], str(REPO_ROOT / 'missing'), env)
+    assert result['exit_code'] == 1 and 'Unable to run' in result['output'][0][1]
+    print("  SUCCESS: Working directory and environment restored")
+
+    print("  ✓ All run_tool tests passed")
+
+
+def test_serve_requests():
+    """Test the daemon and client over a Unix socket."""
+    print("\n" + "="*60)
+    print("TEST: DocToolsDaemon.serve()")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        socket_path = str(Path(temp_dir) / 'doc-tools.sock')
+        listener, lock_file = _bind(socket_path)
+        daemon = DocToolsDaemon(socket_path, idle_timeout=30)
+        daemon.modules['get-database-path'] = load_tool('get-database-path')
+        server = threading.Thread(target=daemon.serve, args=(listener,), daemon=True)
+        server.start()
+        try:
+            request_daemon = client_module.request_daemon
+
+            # Test 1: Ping and run a tool
+            assert request_daemon(socket_path, {'command': 'ping'})['pid'] == os.getpid()
+            response = request_daemon(socket_path, {
+                'tool': 'get-database-path', 'args': [DOC_FILE],
+                'cwd': str(REPO_ROOT), 'env': dict(os.environ),
+            })
+            assert response['exit_code'] == 0, f"Unexpected response: {response}"
+            assert response['output'] == [['stdout', 'api/to-do-db-source-test.json\n']]
+            print("  SUCCESS: Tool run through the socket")
+
+            # Test 2: Unknown tools are refused
+            assert 'Unknown tool' in request_daemon(socket_path, {'tool': 'rm'})['error']
+            print("  SUCCESS: Unknown tool refused")
+
+            # Test 3: A second daemon doesn't take over the socket
+            saved_timeout = doc_tools_daemon.LOCK_TIMEOUT
+            doc_tools_daemon.LOCK_TIMEOUT = 0.1
+            try:
+                assert _bind(socket_path) == (None, None)
+            finally:
+                doc_tools_daemon.LOCK_TIMEOUT = saved_timeout
+            print("  SUCCESS: Socket owned by one daemon")
+
+            # Test 4: Edited tools stop the daemon, which stops listening
+            daemon.snapshot = {}
+            response = request_daemon(socket_path, {'tool': 'get-database-path', 'args': [DOC_FILE]})
+            assert response.get('restart') is True, f"Unexpected response: {response}"
+            server.join(timeout=5)
+            assert not server.is_alive() and not Path(socket_path).exists()
+            assert request_daemon(socket_path, {'command': 'ping'}) is None
+            print("  SUCCESS: Stopped after a source change")
+        finally:
+            daemon.stopping = True
+            daemon.close()
+            lock_file.close()
+
+    print("  ✓ All serve tests passed")
+
+
+def test_output_frames():
+    """Test that output is sent a line at a time, in order."""
+    print("\n" + "="*60)
+    print("TEST: _FrameWriter")
+    print("="*60)
+
+    server_side, client_side = socket.socketpair()
+    with server_side, client_side:
+        writer = _FrameWriter(server_side)
+
+        # Test 1: Lines are sent when complete, and a stream change sends what's held
+        writer.output('stdout', 'Checking ')
+        writer.output('stdout', 'docs\n')
+        writer.output('stdout', 'partial')
+        writer.output('stderr', 'Error: bad\n')
+        writer.finish({'exit_code': 1})
+        server_side.shutdown(socket.SHUT_WR)
+        with client_side.makefile('rb') as frames:
+            received = [json.loads(line) for line in frames]
+        assert received == [
+            {'stream': 'stdout', 'text': 'Checking docs\n'},
+            {'stream': 'stdout', 'text': 'partial'},
+            {'stream': 'stderr', 'text': 'Error: bad\n'},
+            {'exit_code': 1},
+        ], f"Unexpected frames: {received}"
+        print("  SUCCESS: Output framed by line and stream")
+
+        # Test 2: A client that went away doesn't stop the tool
+        client_side.close()
+        writer.output('stdout', 'x' * 1024 * 1024 + '\n')
+        writer.finish({'exit_code': 0})
+        assert writer.connected is False
+        print("  SUCCESS: Output dropped after the client left")
+
+    print("  ✓ All output frame tests passed")
+
+
+def test_parallel_tools():
+    """Test tools that start process pools or read settings from the environment."""
+    print("\n" + "="*60)
+    print("TEST: Process pools and settings in the daemon")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        socket_path = str(Path(temp_dir) / 'doc-tools.sock')
+        listener, lock_file = _bind(socket_path)
+        daemon = DocToolsDaemon(socket_path, idle_timeout=30)
+        for name in ('markdown-survey', 'validate-front-matter'):
+            daemon.modules[name] = load_tool(name)
+        server = threading.Thread(target=daemon.serve, args=(listener,), daemon=True)
+        server.start()
+        saved_start_method = multiprocessing.get_start_method(allow_none=True)
+        try:
+            request_daemon = client_module.request_daemon
+
+            # Test 1: Pool workers can run the tool's own functions, even when
+            # new processes would otherwise be spawned
+            multiprocessing.set_start_method('spawn', force=True)
+            files = ['docs/api/users-get-all-users.md', 'docs/api/users-get-user-by-id.md']
+            frames = []
+            response = request_daemon(socket_path, {
+                'tool': 'markdown-survey', 'args': ['--jobs', '2', '--output', 'json'] + files,
+                'cwd': str(REPO_ROOT), 'env': dict(os.environ),
+            }, lambda stream, text: frames.append((stream, text)))
+            assert response == {'exit_code': 0}, f"Unexpected response: {response}, {frames}"
+            survey = json.loads(''.join(text for stream, text in frames if stream == 'stdout'))
+            assert [result['file'] for result in survey['files']] == files, f"Unexpected: {survey}"
+            assert multiprocessing.get_start_method() == 'spawn'
+            print("  SUCCESS: markdown-survey --jobs 2 ran in the daemon")
+
+            # Test 2: Settings read at import time follow the client's environment
+            saved_cache_dir = doc_test_utils.FRONT_MATTER_CACHE_DIR
+            saved_help_url = help_urls.HELP_URLS['front_matter']
+            cache_dir = Path(temp_dir) / 'cache'
+            doc_file = Path(temp_dir) / 'daemon-settings.md'
+            doc_file.write_text(f"---\nlayout: default\nid: {os.getpid()}-{id(cache_dir)}\n---\n",
+                                encoding='utf-8')
+            env = dict(os.environ, FRONT_MATTER_CACHE_DIR=str(cache_dir), WIKI_BASE='https://wiki.test')
+            response = request_daemon(socket_path, {
+                'tool': 'validate-front-matter', 'args': ['--jobs', '1', str(doc_file)],
+                'cwd': str(REPO_ROOT), 'env': env,
+            })
+            assert 'exit_code' in response, f"Unexpected response: {response}"
+            assert cache_dir.is_dir() and any(cache_dir.iterdir()), "Front matter cache not written"
+            assert doc_test_utils.FRONT_MATTER_CACHE_DIR == saved_cache_dir
+            assert help_urls.HELP_URLS['front_matter'] == saved_help_url
+            print("  SUCCESS: Client's FRONT_MATTER_CACHE_DIR used, then restored")
+        finally:
+            multiprocessing.set_start_method(saved_start_method, force=True)
+            request_daemon(socket_path, {'command': 'stop'})
+            server.join(timeout=5)
+            daemon.stopping = True
+            daemon.close()
+            lock_file.close()
+
+    print("  ✓ All parallel tool tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR doc_tools_daemon.py")
+    print("="*70)
+
+    tests = [
+        test_run_tool,
+        test_serve_requests,
+        test_output_frames,
+        test_parallel_tools,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
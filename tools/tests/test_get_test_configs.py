@@ -446,14 +446,14 @@ def test_shared_utilities_integration():
     
     # Verify the module uses shared utilities
     # Check that functions exist in the module
-    assert hasattr(get_configs_module, 'read_markdown_file'), \
-        "Module should import read_markdown_file"
+    assert hasattr(get_configs_module, 'read_front_matter_text'), \
+        "Module should import read_front_matter_text"
     assert hasattr(get_configs_module, 'parse_front_matter'), \
         "Module should import parse_front_matter"
     assert hasattr(get_configs_module, 'get_server_database_key'), \
         "Module should import get_server_database_key"
     
-    print(f"  ✓ Uses read_markdown_file from doc_test_utils")
+    print(f"  ✓ Uses read_front_matter_text from doc_test_utils")
     print(f"  ✓ Uses parse_front_matter from doc_test_utils")
     print(f"  ✓ Uses get_server_database_key from doc_test_utils")
 
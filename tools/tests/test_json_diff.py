@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for json_diff module.
+
+Covers:
+- Type-strict equality
+- Difference messages and paths
+- Stopping after a number of differences
+- Matching list items by id
+
+Run with:
+    python3 test_json_diff.py
+    pytest test_json_diff.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from json_diff import diff_json, json_equal
+
+
+def test_json_equal():
+    """Test type-strict equality."""
+    print("\n" + "="*60)
+    print("TEST: json_equal()")
+    print("="*60)
+
+    tasks = [{"id": i, "title": f"Task {i}", "done": False, "tags": ["a"]} for i in range(100)]
+    assert json_equal(tasks, [dict(task) for task in tasks])
+    assert json_equal({}, {}) and json_equal(None, None)
+    print("  SUCCESS: Equal values")
+
+    assert not json_equal({"id": 1}, {"id": 1.0}), "int and float should differ"
+    assert not json_equal([True], [1]), "bool and int should differ"
+    assert not json_equal({"a": 1}, {"a": 1, "b": 2})
+    assert not json_equal({"a": 1, "c": 2}, {"a": 1, "b": 2})
+    assert not json_equal([1, 2], [2, 1])
+    assert not json_equal(float('nan'), float('nan'))
+    print("  SUCCESS: Different values and types")
+
+    print("  ✓ All json_equal tests passed")
+
+
+def test_diff_json_messages():
+    """Test difference messages and paths."""
+    print("\n" + "="*60)
+    print("TEST: diff_json() messages")
+    print("="*60)
+
+    actual = {"user": {"id": 1, "name": "Wrong", "extra": True}, "tasks": [{"id": 1}, {"id": "2"}]}
+    expected = {"user": {"id": 1, "name": "Right", "email": "a@b.c"}, "tasks": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    assert diff_json(actual, expected) == [
+        "Missing key at user.email",
+        "Extra key at user.extra",
+        "Value mismatch at user.name: expected Right, got Wrong",
+        "List length mismatch at tasks: expected 3 items, got 2",
+        "Type mismatch at tasks[1].id: expected int, got str",
+    ], f"Unexpected differences: {diff_json(actual, expected)}"
+    print("  SUCCESS: Nested paths")
+
+    assert diff_json({"b": 1}, {"a": 1}) == ["Missing key: a", "Extra key: b"]
+    assert diff_json([[1]], [[2]]) == ["Value mismatch at [0][0]: expected 2, got 1"]
+    assert diff_json("a", 1) == ["Type mismatch at root: expected int, got str"]
+    tasks = [{"id": 1}]
+    assert diff_json(tasks, tasks) == []
+    print("  SUCCESS: Root paths")
+
+    print("  ✓ All message tests passed")
+
+
+def test_diff_json_limit():
+    """Test stopping after a number of differences."""
+    print("\n" + "="*60)
+    print("TEST: diff_json() limit")
+    print("="*60)
+
+    actual = [{"id": i, "title": "Changed"} for i in range(1000)]
+    expected = [{"id": i, "title": "Task"} for i in range(1000)]
+    assert len(diff_json(actual, expected)) == 1000
+    differences = diff_json(actual, expected, limit=3)
+    assert differences == diff_json(actual, expected)[:3], f"Unexpected differences: {differences}"
+    print("  SUCCESS: Stopped after the limit")
+
+    print("  ✓ All limit tests passed")
+
+
+def test_diff_json_list_key():
+    """Test matching list items by id."""
+    print("\n" + "="*60)
+    print("TEST: diff_json() with list_key")
+    print("="*60)
+
+    expected = {"users": [{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bo"}, {"id": 3, "name": "Cy"}]}
+
+    # Test 1: Order doesn't matter
+    actual = {"users": list(reversed(expected["users"]))}
+    assert diff_json(actual, expected) != []
+    assert diff_json(actual, expected, list_key='id') == []
+    print("  SUCCESS: Items matched by id")
+
+    # Test 2: Missing, extra, and changed items are reported by id
+    actual = {"users": [{"id": 4, "name": "Di"}, {"id": 2, "name": "Bob"}, {"id": 1, "name": "Ann"}]}
+    assert diff_json(actual, expected, list_key='id') == [
+        "Missing item at users: id 3",
+        "Extra item at users: id 4",
+        "Value mismatch at users[id=2].name: expected Bo, got Bob",
+    ], f"Unexpected differences: {diff_json(actual, expected, list_key='id')}"
+    print("  SUCCESS: Differences reported by id")
+
+    # Test 3: Lists without unique ids are compared in order
+    assert diff_json([2, 1], [1, 2], list_key='id') == diff_json([2, 1], [1, 2])
+    assert diff_json([{"id": 1}, {"id": 1}], [{"id": 1}], list_key='id') == [
+        "List length mismatch at root: expected 1 items, got 2"
+    ]
+    assert diff_json([{"id": "1"}], [{"id": 1}], list_key='id') == [
+        "Missing item at root: id 1",
+        "Extra item at root: id 1",
+    ]
+    print("  SUCCESS: Lists that can't be keyed compared in order")
+
+    print("  ✓ All list key tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR json_diff.py")
+    print("="*70)
+
+    tests = [
+        test_json_equal,
+        test_diff_json_messages,
+        test_diff_json_limit,
+        test_diff_json_list_key,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Tests for linter_exception_index module.
+
+Covers:
+- Reusing index entries for unchanged files
+- Finding the files that disable a rule
+- Finding the exceptions a git diff adds
+
+Run with:
+    python3 test_linter_exception_index.py
+    pytest test_linter_exception_index.py -v
+"""
+
+import sys
+import os
+import subprocess
+import tempfile
+import importlib.util
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from linter_exception_index import ExceptionIndex, rule_linter
+
+spec = importlib.util.spec_from_file_location(
+    "list_linter_exceptions",
+    Path(__file__).parent.parent / "list-linter-exceptions.py"
+)
+list_linter_exceptions = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(list_linter_exceptions)
+scan = list_linter_exceptions.list_vale_exceptions
+
+
+def test_incremental_update():
+    """Test that only changed files are scanned again."""
+    print("\n" + "="*60)
+    print("TEST: ExceptionIndex.update()")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        first = Path(temp_dir) / 'first.md'
+        second = Path(temp_dir) / 'second.md'
+        first.write_text("Text <!-- vale Microsoft.Passive = NO -->\n", encoding='utf-8')
+        second.write_text("Text <!-- markdownlint-disable MD013 -->\n", encoding='utf-8')
+        index_path = str(Path(temp_dir) / 'cache' / 'index.json')
+
+        # Test 1: A new index scans every file and matches a direct scan
+        index = ExceptionIndex(index_path, scan)
+        results, errors = index.update([str(first), str(second)])
+        assert errors == {} and index.scanned == 2
+        assert results[str(first)] == scan(first.read_text(encoding='utf-8'))
+        assert index.save()
+        print("  SUCCESS: New index scanned every file")
+
+        # Test 2: Unchanged files are reused after loading the index
+        index = ExceptionIndex(index_path, scan)
+        index.load()
+        index.update([str(first), str(second)])
+        assert (index.scanned, index.reused) == (0, 2)
+        print("  SUCCESS: Unchanged files reused")
+
+        # Test 3: Touched files with the same content aren't rescanned
+        os.utime(first, ns=(0, 0))
+        second.write_text("Text <!-- vale Microsoft.We = NO -->\n", encoding='utf-8')
+        results, _ = index.update([str(first), str(second)])
+        assert (index.scanned, index.reused) == (1, 3)
+        assert results[str(second)]['vale'][0]['rule'] == 'Microsoft.We'
+        print("  SUCCESS: Only the edited file rescanned")
+
+        # Test 4: Missing files are errors and leave the index
+        second.unlink()
+        results, errors = index.update([str(first), str(second)])
+        assert str(second) in errors and 'File not found' in errors[str(second)]
+        assert os.path.normpath(str(second)) not in index.files
+        print("  SUCCESS: Missing file removed from the index")
+
+        # Test 5: A different scan mode starts a new index
+        index.save()
+        index = ExceptionIndex(index_path, scan, 'multiline')
+        index.load()
+        assert index.files == {}
+        print("  SUCCESS: Scan mode change rebuilds the index")
+
+    print("  ✓ All update tests passed")
+
+
+def test_files_disabling():
+    """Test finding the exceptions that disable a rule."""
+    print("\n" + "="*60)
+    print("TEST: ExceptionIndex.files_disabling()")
+    print("="*60)
+
+    assert rule_linter('MD013') == 'markdownlint'
+    assert rule_linter('Microsoft.Passive') == 'vale'
+    print("  SUCCESS: Rules matched to linters")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for name, content in [
+            ('a.md', "<!-- markdownlint-disable MD013 -->\n"),
+            ('b.md', "<!-- markdownlint-disable -->\n"),
+            ('c.md', "<!-- vale Microsoft.Passive = NO -->\n"),
+        ]:
+            path = Path(temp_dir) / name
+            path.write_text(content, encoding='utf-8')
+            paths.append(str(path))
+
+        index = ExceptionIndex(str(Path(temp_dir) / 'index.json'), scan)
+        index.update(paths)
+
+        found = index.files_disabling('MD013')
+        assert [Path(e['file']).name for e in found] == ['a.md', 'b.md'], f"Unexpected: {found}"
+        assert found[1]['rule'] == 'markdownlint-disable (global)'
+        print("  SUCCESS: Rule and global disables found")
+
+        found = index.files_disabling('Microsoft.Passive', [paths[2]])
+        assert len(found) == 1 and found[0]['linter'] == 'vale' and found[0]['line'] == 1
+        assert index.files_disabling('Microsoft.Passive', [paths[0]]) == []
+        print("  SUCCESS: Search limited to the given files")
+
+    print("  ✓ All files_disabling tests passed")
+
+
+def test_new_exceptions():
+    """Test finding the exceptions added since a git revision."""
+    print("\n" + "="*60)
+    print("TEST: ExceptionIndex.new_exceptions()")
+    print("="*60)
+
+    saved_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            os.chdir(temp_dir)
+            git = ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com']
+            subprocess.run(['git', 'init', '-q'], check=True)
+            Path('kept.md').write_text("A <!-- vale Microsoft.We = NO -->\n", encoding='utf-8')
+            Path('old.md').write_text("B <!-- markdownlint-disable MD013 -->\n", encoding='utf-8')
+            subprocess.run(git + ['add', '.'], check=True)
+            subprocess.run(git + ['commit', '-q', '-m', 'Base'], check=True)
+
+            # Moved tag, renamed file, and new untracked file
+            Path('kept.md').write_text(
+                "New line\nA <!-- vale Microsoft.We = NO -->\nC <!-- vale Microsoft.Passive = NO -->\n",
+                encoding='utf-8')
+            subprocess.run(git + ['mv', 'old.md', 'renamed.md'], check=True)
+            Path('added.md').write_text("<!-- markdownlint-disable -->\n", encoding='utf-8')
+
+            index = ExceptionIndex('index.json', scan)
+            new, error = index.new_exceptions('HEAD', ['kept.md', 'renamed.md', 'added.md'])
+            assert error is None, error
+            assert sorted(new) == ['added.md', 'kept.md'], f"Unexpected: {new}"
+            assert [(e['rule'], e['line']) for e in new['kept.md']['vale']] == [('Microsoft.Passive', 3)]
+            assert new['added.md']['markdownlint'][0]['rule'] == 'markdownlint-disable (global)'
+            print("  SUCCESS: Only added tags reported")
+
+            new, error = index.new_exceptions('no-such-ref', ['kept.md'])
+            assert new is None and 'no-such-ref' in error
+            print("  SUCCESS: Unknown revision reported")
+        finally:
+            os.chdir(saved_cwd)
+
+    print("  ✓ All new_exceptions tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR linter_exception_index.py")
+    print("="*70)
+
+    tests = [
+        test_incremental_update,
+        test_files_disabling,
+        test_new_exceptions,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
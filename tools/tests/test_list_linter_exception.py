@@ -303,6 +303,44 @@ def test_with_test_data_files():
     print("  ✓ Test data file tests completed")
 
 
+def test_same_line_and_multiline_exceptions():
+    """Test several tags on a line and tags in multi-line comments."""
+    print("\n" + "="*60)
+    print("TEST: Same-line and multi-line exceptions")
+    print("="*60)
+    
+    content = "\n".join([
+        "<!-- vale off --> text <!-- vale Rule.One = NO --> <!-- vale Rule.Two = NO -->",  # Line 1
+        "<!--",                                                                         # Line 2
+        "  vale Rule.Three = NO",                                                        # Line 3
+        "-->",                                                                          # Line 4
+        "<!-- markdownlint-disable",                                                    # Line 5
+        "     MD013 -->",                                                               # Line 6
+    ])
+    
+    # Test 1: The first tag of each kind on a line, specific rules first
+    exceptions = list_linter_exceptions.list_vale_exceptions(content)
+    assert exceptions['vale'] == [
+        {'line': 1, 'rule': 'Rule.One', 'full_match': content.split("\n")[0]},
+        {'line': 1, 'rule': 'vale-off (global)', 'full_match': content.split("\n")[0]},
+    ], f"Unexpected Vale exceptions: {exceptions['vale']}"
+    assert exceptions['markdownlint'] == []
+    print("  SUCCESS: Same-line tags listed like before")
+    
+    # Test 2: Multi-line comments are found at the line they start on
+    exceptions = list_linter_exceptions.list_vale_exceptions(content, multiline=True)
+    assert [(e['line'], e['rule']) for e in exceptions['vale']] == [
+        (1, 'Rule.One'), (1, 'vale-off (global)'), (2, 'Rule.Three')
+    ], f"Unexpected Vale exceptions: {exceptions['vale']}"
+    assert exceptions['vale'][2]['full_match'] == '<!-- vale Rule.Three = NO -->'
+    assert exceptions['markdownlint'] == [
+        {'line': 5, 'rule': 'MD013', 'full_match': '<!-- markdownlint-disable MD013 -->'}
+    ], f"Unexpected markdownlint exceptions: {exceptions['markdownlint']}"
+    print("  SUCCESS: Multi-line comments found")
+    
+    print("  ✓ Same-line and multi-line tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*70)
@@ -316,7 +354,8 @@ def run_all_tests():
         test_malformed_exceptions,
         test_empty_file,
         test_exception_line_numbers,
-        test_with_test_data_files
+        test_with_test_data_files,
+        test_same_line_and_multiline_exceptions
     ]
     
     passed = 0
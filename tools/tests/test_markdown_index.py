@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for markdown_index module.
+
+Covers:
+- Example name normalization
+- Heading and code block tokenizing with line numbers
+- Example section lookup by name
+- Headings and fences inside fenced code blocks
+
+Run with:
+    python3 test_markdown_index.py
+    pytest test_markdown_index.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from markdown_index import MarkdownIndex, normalize_example_name
+
+
+SAMPLE_DOC = """---
+title: Sample
+---
+
+# Get user
+
+## Examples
+
+### `GET` user request
+
+```bash
+# Get the first user
+curl {server_url}/users/1
+```
+
+### GET user response
+
+Returns the user.
+
+```json
+{"id": 1}
+```
+
+#### Delete user requests
+
+```sh
+curl -X DELETE {server_url}/users/1
+```
+
+### GET user request (again)
+
+```bash
+curl {server_url}/users/2
+```
+"""
+
+
+def test_normalize_example_name():
+    """Test example name normalization."""
+    print("\n" + "="*60)
+    print("TEST: normalize_example_name()")
+    print("="*60)
+
+    assert normalize_example_name('GET example') == 'get example'
+    assert normalize_example_name('`GET`  Example') == 'get example'
+    assert normalize_example_name('  `POST` `/users` ') == 'post /users'
+    print("  SUCCESS: Case, backticks, and whitespace normalized")
+
+    print("  ✓ All normalize_example_name tests passed")
+
+
+def test_tokenize_line_numbers():
+    """Test headings and code blocks are found with line numbers."""
+    print("\n" + "="*60)
+    print("TEST: MarkdownIndex tokenizing")
+    print("="*60)
+
+    index = MarkdownIndex(SAMPLE_DOC)
+
+    # Test 1: Headings and their levels
+    assert [(h.level, h.line) for h in index.headings] == [
+        (1, 5), (2, 7), (3, 9), (3, 16), (4, 24), (3, 30)
+    ], f"Unexpected headings: {index.headings}"
+    print("  SUCCESS: Headings found, comment in bash block ignored")
+
+    # Test 2: Code blocks keep their content and opening line
+    assert [(b.info, b.line) for b in index.code_blocks] == [
+        ('bash', 11), ('json', 20), ('sh', 26), ('bash', 32)
+    ], f"Unexpected code blocks: {index.code_blocks}"
+    assert index.code_blocks[0].text == '# Get the first user\ncurl {server_url}/users/1'
+    print("  SUCCESS: Code blocks found")
+
+    # Test 3: Unclosed fence runs to the end of the document
+    index = MarkdownIndex("### A request\n```bash\ncurl localhost\n")
+    assert index.find_code_block('A', 'request').text == 'curl localhost\n'
+    print("  SUCCESS: Unclosed fence handled")
+
+    print("  ✓ All tokenizing tests passed")
+
+
+def test_find_code_block():
+    """Test example section lookup."""
+    print("\n" + "="*60)
+    print("TEST: MarkdownIndex.find_code_block()")
+    print("="*60)
+
+    index = MarkdownIndex(SAMPLE_DOC)
+
+    # Test 1: Backticks and case in the heading are ignored
+    block = index.find_code_block('GET user', 'request')
+    assert block is not None and block.line == 11, f"Unexpected block: {block}"
+    assert index.find_heading('get USER', 'request').line == 9
+    print("  SUCCESS: Request found by normalized name")
+
+    # Test 2: Text between heading and code block is skipped
+    block = index.find_code_block('GET user', 'response')
+    assert block is not None and block.text == '{"id": 1}', f"Unexpected block: {block}"
+    print("  SUCCESS: Response found")
+
+    # Test 3: Level 4 heading, sh block, and "requests" suffix
+    block = index.find_code_block('Delete user', 'request')
+    assert block is not None and block.line == 26, f"Unexpected block: {block}"
+    print("  SUCCESS: Level 4 heading found")
+
+    # Test 4: Missing sections and wrong languages
+    assert index.find_code_block('Missing', 'request') is None
+    assert index.find_code_block('Delete user', 'response') is None
+    assert index.find_code_block('Get', 'request') is None, "Level 1 heading should not match"
+    assert index.find_code_block('Examples', 'request') is None
+    print("  SUCCESS: Missing sections return None")
+
+    # Test 5: A section without a matching code block doesn't borrow the next one
+    index = MarkdownIndex("### A response\n\n### B response\n```json\n{}\n```\n")
+    assert index.find_code_block('A', 'response') is None
+    assert index.find_code_block('B', 'response').line == 4
+    print("  SUCCESS: Code block lookup stays inside the section")
+
+    print("  ✓ All find_code_block tests passed")
+
+
+def test_headings_inside_fences():
+    """Test headings in longer fences are not example sections."""
+    print("\n" + "="*60)
+    print("TEST: MarkdownIndex with nested fences")
+    print("="*60)
+
+    content = (
+        "````markdown\n"
+        "### A request\n"
+        "```bash\n"
+        "curl inside\n"
+        "```\n"
+        "````\n"
+        "\n"
+        "### A request\n"
+        "```bash\n"
+        "curl outside\n"
+        "```\n"
+    )
+    index = MarkdownIndex(content)
+    assert len(index.headings) == 1, f"Unexpected headings: {index.headings}"
+    block = index.find_code_block('A', 'request')
+    assert block.text == 'curl outside' and block.line == 9, f"Unexpected block: {block}"
+    print("  SUCCESS: Four-backtick fence kept as one block")
+
+    print("  ✓ All nested fence tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR markdown_index.py")
+    print("="*70)
+
+    tests = [
+        test_normalize_example_name,
+        test_tokenize_line_numbers,
+        test_find_code_block,
+        test_headings_inside_fences,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
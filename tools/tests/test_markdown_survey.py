@@ -5,6 +5,7 @@ Tests for markdown-survey.py
 Covers:
 - Word counting algorithm (with various content types)
 - Markdown notation detection (all pattern types)
+- Surveying files on a process pool, summary, and JSON output
 - CLI argument parsing
 - File reading and error handling
 - GitHub Actions annotation output
@@ -14,6 +15,7 @@ Run with:
     pytest test_markdown_survey.py -v
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -27,11 +29,16 @@ spec = importlib.util.spec_from_file_location(
     Path(__file__).parent.parent / "markdown-survey.py"
 )
 markdown_survey = importlib.util.module_from_spec(spec)
+# Registered so worker processes can find its functions
+sys.modules["markdown_survey"] = markdown_survey
 spec.loader.exec_module(markdown_survey)
 
 # Import the functions we're testing
 count_words = markdown_survey.count_words
 list_markdown_notations = markdown_survey.list_markdown_notations
+survey_files = markdown_survey.survey_files
+summarize = markdown_survey.summarize
+survey_json = markdown_survey.survey_json
 
 
 def test_count_words_simple():
@@ -474,6 +481,103 @@ def test_list_markdown_notations_real_file():
     print("  ✓ All real file tests passed")
 
 
+# Notation patterns each line is checked against, in report order
+NOTATION_PATTERNS = {
+    r'^#\s': 'heading_1',
+    r'^##\s': 'heading_2',
+    r'^###\s': 'heading_3',
+    r'^####\s': 'heading_4',
+    r'^#####\s': 'heading_5',
+    r'^######\s': 'heading_6',
+    r'\*\*': 'bold_asterisk',
+    r'__': 'bold_underscore',
+    r'(?<!\*)\*(?!\*)': 'italic_asterisk',
+    r'(?<!_)_(?!_)': 'italic_underscore',
+    r'```': 'code_block',
+    r'`': 'inline_code',
+    r'!\[.*?\]\(.*?\)': 'image',
+    r'(?<!!)\[.*?\]\(.*?\)': 'link',
+    r'^>\s': 'blockquote',
+    r'^\s*[-*+]\s': 'unordered_list',
+    r'^\s*\d+\.\s': 'ordered_list',
+    r'^(\*{3,}|-{3,}|_{3,})$': 'horizontal_rule',
+    r'~~': 'strikethrough',
+    r'\|': 'table_pipe',
+}
+
+
+def test_list_markdown_notations_matches_patterns():
+    """Test that the line scanner finds what the notation patterns match."""
+    print("\n" + "="*60)
+    print("TEST: list_markdown_notations() matches notation patterns")
+    print("="*60)
+    
+    def expected_notations(content):
+        return [name for line in content.split('\n')
+                for pattern, name in NOTATION_PATTERNS.items() if re.search(pattern, line)]
+    
+    # Test 1: Every test data file, in order
+    test_data_dir = Path(__file__).parent / "test_data"
+    for path in sorted(test_data_dir.rglob('*.md')):
+        content = path.read_text(encoding='utf-8')
+        assert list_markdown_notations(content) == expected_notations(content), f"Different notations in {path.name}"
+    print("  SUCCESS: Test data files match")
+    
+    # Test 2: Lines near the edges of the patterns
+    lines = [
+        '#', '#\tTab heading', '####### Seven', '#\r', '###### Six',
+        '>', '>quote', '> quote', '-', '-item', '\t- item', '  * item', '+\u00a0item',
+        '1.', '1.item', '  12. item', '\u0663. Arabic digit', '1) item',
+        '***', '**', '---', '--- ', '___', '*-*', '****',
+        '*a*', '**a**', '***a***', '_a_', 'snake_case', 'a__b',
+        '![alt](img.png)', '!![x](y)', '[x](y)', '[x] (y)', '[](', '``', '```',
+        'a ~~b~~ | c',
+    ]
+    content = '\n'.join(lines)
+    assert list_markdown_notations(content) == expected_notations(content), \
+        f"Different notations: {list_markdown_notations(content)}"
+    print("  SUCCESS: Edge case lines match")
+    
+    print("  ✓ All pattern equivalence tests passed")
+
+
+def test_survey_files():
+    """Test surveying files in order, on a process pool, and as JSON."""
+    print("\n" + "="*60)
+    print("TEST: survey_files()")
+    print("="*60)
+    
+    test_data_dir = Path(__file__).parent / "test_data"
+    filenames = [str(path) for path in sorted(test_data_dir.glob('*.md'))]
+    filenames.append(str(test_data_dir / "missing.md"))
+    
+    # Test 1: Counts match the counting functions, in file order
+    results = survey_files(filenames)
+    assert [result['file'] for result in results] == filenames
+    content = Path(filenames[0]).read_text(encoding='utf-8')
+    assert results[0]['words'] == count_words(content)
+    assert sum(results[0]['notations'].values()) == len(list_markdown_notations(content))
+    assert 'File not found' in results[-1]['error']
+    print("  SUCCESS: Files surveyed in order")
+    
+    # Test 2: A process pool gives the same results
+    assert survey_files(filenames, jobs=2) == results
+    print("  SUCCESS: Same results with 2 processes")
+    
+    # Test 3: Summary and JSON output
+    summary = summarize(results)
+    assert summary['files'] == len(filenames) - 1 and summary['failed'] == 1
+    assert summary['words'] == sum(result.get('words', 0) for result in results)
+    assert summary['markdown_symbols'] == sum(summary['notations'].values())
+    output = survey_json(results)
+    assert output['summary'] == summary
+    assert output['files'][-1] == {'file': filenames[-1], 'error': f"Error: File not found: {filenames[-1]}"}
+    assert output['files'][0]['notations'] == dict(sorted(results[0]['notations'].items()))
+    print("  SUCCESS: Summary and JSON built")
+    
+    print("  ✓ All survey_files tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*70)
@@ -494,6 +598,8 @@ def run_all_tests():
         test_list_markdown_notations_lists,
         test_list_markdown_notations_other,
         test_list_markdown_notations_real_file,
+        test_list_markdown_notations_matches_patterns,
+        test_survey_files,
     ]
     
     passed = 0
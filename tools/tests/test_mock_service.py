@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Tests for mock_service module.
+
+Covers:
+- Record routes (GET, POST, PUT, PATCH, DELETE) with json-server responses
+- Foreign key indexes and cascading deletes
+- List queries (filters, q, _sort, _page/_limit, _start/_end, _embed, _expand)
+- The reset endpoint
+- Serving over HTTP with keep-alive connections
+
+Run with:
+    python3 test_mock_service.py
+    pytest test_mock_service.py -v
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from curl_engine import parse_curl_command, execute_request, HttpConnectionPool
+from mock_service import MockDatabase, start_server, js_string, RESET_PATH
+
+SOURCE_DATABASE = Path(__file__).parent.parent.parent / 'api' / 'to-do-db-source.json'
+
+
+def _database():
+    """Fresh mock database with three users and four tasks."""
+    return MockDatabase({
+        "users": [
+            {"lastName": "Smith", "firstName": "Ann", "id": 1},
+            {"lastName": "Jones", "firstName": "Bo", "id": 2},
+            {"lastName": "Smith", "firstName": "Cy", "id": 3},
+        ],
+        "tasks": [
+            {"userId": 1, "title": "Shop", "warning": "10", "id": 1},
+            {"userId": 2, "title": "Cook", "warning": "20", "id": 2},
+            {"userId": 1, "title": "Walk", "warning": "5", "id": 3},
+            {"userId": 3, "title": "Bake", "warning": "30", "id": 4},
+        ],
+    })
+
+
+def _ids(payload):
+    """Ids of the records in a list response."""
+    return [record['id'] for record in payload]
+
+
+def test_js_string():
+    """Test JavaScript string conversion used for id and filter matching."""
+    print("\n" + "="*60)
+    print("TEST: js_string()")
+    print("="*60)
+
+    assert js_string(1) == '1' and js_string(1.0) == '1' and js_string(1.5) == '1.5'
+    assert js_string(True) == 'true' and js_string(None) == 'null'
+    assert js_string(['a', 2]) == 'a,2'
+    print("  SUCCESS: Values converted like toString()")
+
+    print("  ✓ All js_string tests passed")
+
+
+def test_record_routes():
+    """Test single record routes."""
+    print("\n" + "="*60)
+    print("TEST: MockDatabase record routes")
+    print("="*60)
+
+    db = _database()
+
+    # Test 1: GET by id, including string ids
+    status, _, payload = db.handle_request('GET', '/users/2')
+    assert status == 200 and payload['firstName'] == 'Bo', f"Unexpected: {status} {payload}"
+    status, _, payload = db.handle_request('GET', '/users/9')
+    assert status == 404 and payload == {}, f"Unexpected: {status} {payload}"
+    print("  SUCCESS: GET by id")
+
+    # Test 2: POST gives the next id, and rejects duplicate ids
+    status, _, payload = db.handle_request('POST', '/users', {"firstName": "Di"})
+    assert status == 201 and payload == {"firstName": "Di", "id": 4}, f"Unexpected: {status} {payload}"
+    status, _, _ = db.handle_request('POST', '/users', {"firstName": "Ed", "id": 4})
+    assert status == 500, f"Duplicate id should fail, got {status}"
+    print("  SUCCESS: POST creates records")
+
+    # Test 3: PUT replaces and PATCH merges, keeping the id
+    status, _, payload = db.handle_request('PUT', '/users/4', {"firstName": "Dee", "id": 99})
+    assert status == 200 and payload == {"firstName": "Dee", "id": 4}, f"Unexpected: {payload}"
+    status, _, payload = db.handle_request('PATCH', '/tasks/1', {"title": "Shop more"})
+    assert payload == {"userId": 1, "title": "Shop more", "warning": "10", "id": 1}, f"Unexpected: {payload}"
+    assert db.handle_request('PATCH', '/tasks/9', {"title": "x"})[0] == 404
+    print("  SUCCESS: PUT and PATCH update records")
+
+    # Test 4: DELETE removes the user's tasks too
+    status, _, payload = db.handle_request('DELETE', '/users/1')
+    assert status == 200 and payload == {}, f"Unexpected: {status} {payload}"
+    assert _ids(db.handle_request('GET', '/tasks')[2]) == [2, 4], "User 1's tasks should be deleted"
+    assert db.handle_request('DELETE', '/users/1')[0] == 404
+    print("  SUCCESS: DELETE cascades to dependents")
+
+    # Test 5: Unknown routes
+    status, _, payload = db.handle_request('GET', '/projects')
+    assert status == 404 and payload == 'Cannot GET /projects', f"Unexpected: {status} {payload}"
+    print("  SUCCESS: Unknown routes return 404")
+
+    print("  ✓ All record route tests passed")
+
+
+def test_foreign_key_index():
+    """Test the userId index stays correct as records change."""
+    print("\n" + "="*60)
+    print("TEST: MockCollection foreign key index")
+    print("="*60)
+
+    db = _database()
+    tasks = db.collections['tasks']
+
+    assert _ids(tasks.find('userId', '1')) == [1, 3], "Index should list tasks in order"
+    assert tasks.find('title', 'Shop') is None, "Only foreign keys are indexed"
+
+    # Moving a task to another user keeps the new bucket in collection order
+    db.handle_request('PATCH', '/tasks/1', {"userId": 3})
+    assert _ids(tasks.find('userId', '1')) == [3]
+    assert _ids(tasks.find('userId', '3')) == [1, 4], f"Unexpected order: {tasks.find('userId', '3')}"
+
+    # Filters and nested routes use the index
+    assert _ids(db.handle_request('GET', '/tasks?userId=3')[2]) == [1, 4]
+    assert _ids(db.handle_request('GET', '/users/3/tasks')[2]) == [1, 4]
+    status, _, payload = db.handle_request('POST', '/users/2/tasks', {"title": "Nap"})
+    assert status == 201 and payload['userId'] == 2, f"Unexpected: {payload}"
+    assert _ids(tasks.find('userId', '2')) == [2, 5]
+    print("  SUCCESS: Index updated by PATCH and POST")
+
+    # New ids follow the largest id, including after it's deleted
+    db.handle_request('DELETE', '/tasks/5')
+    assert db.handle_request('POST', '/tasks', {"title": "Read"})[2]['id'] == 5
+    db.handle_request('POST', '/tasks', {"title": "Swim", "id": 9})
+    assert db.handle_request('POST', '/tasks', {"title": "Run"})[2]['id'] == 10
+    db.handle_request('POST', '/tasks', {"title": "Nap", "id": "nap"})
+    assert isinstance(db.handle_request('POST', '/tasks', {"title": "Sew"})[2]['id'], str)
+    print("  SUCCESS: Ids created like json-server")
+
+    print("  ✓ All foreign key index tests passed")
+
+
+def test_list_queries():
+    """Test json-server list query parameters."""
+    print("\n" + "="*60)
+    print("TEST: MockDatabase list queries")
+    print("="*60)
+
+    db = _database()
+
+    def get(target):
+        return db.handle_request('GET', target, host='localhost:3000')
+
+    # Test 1: Field filters and operators
+    assert _ids(get('/users?lastName=Smith')[2]) == [1, 3]
+    assert _ids(get('/users?id=1&id=2')[2]) == [1, 2]
+    assert _ids(get('/tasks?id_gte=2&id_lte=3')[2]) == [2, 3]
+    assert _ids(get('/tasks?warning_ne=10')[2]) == [2, 3, 4]
+    assert _ids(get('/tasks?title_like=^b')[2]) == [4]
+    assert _ids(get('/users?q=smi')[2]) == [1, 3]
+    print("  SUCCESS: Filters applied")
+
+    # Test 2: Sorting, including string fields and several fields
+    assert _ids(get('/tasks?_sort=title')[2]) == [4, 2, 1, 3]
+    assert _ids(get('/tasks?_sort=warning&_order=desc')[2]) == [3, 4, 2, 1]
+    assert _ids(get('/users?_sort=lastName,id&_order=asc,desc')[2]) == [2, 3, 1]
+    print("  SUCCESS: Sorting applied")
+
+    # Test 3: Paging with X-Total-Count and Link headers
+    status, headers, payload = get('/tasks?_page=2&_limit=1')
+    headers = dict(headers)
+    assert _ids(payload) == [2], f"Unexpected page: {payload}"
+    assert headers['X-Total-Count'] == '4'
+    assert headers['Link'] == (
+        '<http://localhost:3000/tasks?_page=1&_limit=1>; rel="first", '
+        '<http://localhost:3000/tasks?_page=1&_limit=1>; rel="prev", '
+        '<http://localhost:3000/tasks?_page=3&_limit=1>; rel="next", '
+        '<http://localhost:3000/tasks?_page=4&_limit=1>; rel="last"'
+    ), f"Unexpected Link: {headers['Link']}"
+    assert _ids(get('/tasks?_page=1')[2]) == [1, 2, 3, 4], "Default page size is 10"
+    assert 'Link' not in dict(get('/tasks?_page=1')[1]), "One page has no links"
+    print("  SUCCESS: Paging applied")
+
+    # Test 4: Slicing
+    assert _ids(get('/tasks?_start=1&_end=3')[2]) == [2, 3]
+    assert _ids(get('/tasks?_start=2&_limit=5')[2]) == [3, 4]
+    assert 'X-Total-Count' not in dict(get('/tasks')[1])
+    print("  SUCCESS: Slicing applied")
+
+    # Test 5: Embedding children and expanding parents
+    payload = get('/users/1?_embed=tasks')[2]
+    assert _ids(payload['tasks']) == [1, 3], f"Unexpected embed: {payload}"
+    payload = get('/tasks?_expand=user&userId=2')[2]
+    assert payload[0]['user']['firstName'] == 'Bo', f"Unexpected expand: {payload}"
+    assert 'tasks' not in db.collections['users'].get(1), "Embedding must not change records"
+    print("  SUCCESS: Embed and expand applied")
+
+    print("  ✓ All list query tests passed")
+
+
+def test_reset_endpoint():
+    """Test replacing and reloading the whole database."""
+    print("\n" + "="*60)
+    print("TEST: MockDatabase reset endpoint")
+    print("="*60)
+
+    db = MockDatabase.from_file(str(SOURCE_DATABASE))
+    original = db.to_dict()
+
+    db.handle_request('DELETE', '/users/1')
+    status, _, _ = db.handle_request('POST', RESET_PATH)
+    assert status == 200 and db.to_dict() == original, "Empty reset should reload the file"
+    print("  SUCCESS: Database file reloaded")
+
+    status, _, _ = db.handle_request('POST', RESET_PATH, {"users": [{"id": 7}], "tasks": []})
+    assert status == 200 and db.to_dict() == {"users": [{"id": 7}], "tasks": []}
+    assert db.handle_request('GET', '/users/7')[0] == 200
+    print("  SUCCESS: Database replaced")
+
+    print("  ✓ All reset endpoint tests passed")
+
+
+def test_http_server():
+    """Test serving the mock over HTTP."""
+    print("\n" + "="*60)
+    print("TEST: start_server()")
+    print("="*60)
+
+    server = start_server(_database(), host='127.0.0.1', port=0)
+    pool = HttpConnectionPool()
+
+    try:
+        # Test 1: JSON response with json-server formatting
+        request = parse_curl_command(f'curl -i {server.url}/users/1')
+        status_code, headers, body = execute_request(request, pool)
+        assert status_code == 200, f"Expected 200, got {status_code}"
+        assert 'application/json; charset=utf-8' in headers, f"Unexpected headers: {headers}"
+        assert json.loads(body) == {"lastName": "Smith", "firstName": "Ann", "id": 1}
+        assert body.startswith('{\n  "lastName"'), "Responses are indented like json-server"
+        print("  SUCCESS: GET served")
+
+        # Test 2: POST with a JSON body, then a form body
+        request = parse_curl_command(
+            f"curl -X POST {server.url}/tasks -H 'Content-Type: application/json' "
+            "-d '{\"userId\": 2, \"title\": \"Nap\"}'"
+        )
+        status_code, _, body = execute_request(request, pool)
+        assert status_code == 201 and json.loads(body)['id'] == 5, f"Unexpected: {status_code} {body}"
+        request = parse_curl_command(f"curl {server.url}/users -d 'firstName=Di'")
+        status_code, _, body = execute_request(request, pool)
+        assert status_code == 201 and json.loads(body) == {"firstName": "Di", "id": 4}, f"Unexpected: {body}"
+        print("  SUCCESS: POST served")
+
+        # Test 3: Invalid JSON body
+        request = parse_curl_command(
+            f"curl -X POST {server.url}/tasks -H 'Content-Type: application/json' -d '{{bad'"
+        )
+        assert execute_request(request, pool)[0] == 400
+        print("  SUCCESS: Invalid body rejected")
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    print("  ✓ All HTTP server tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR mock_service.py")
+    print("="*70)
+
+    tests = [
+        test_js_string,
+        test_record_routes,
+        test_foreign_key_index,
+        test_list_queries,
+        test_reset_endpoint,
+        test_http_server,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for phase_timings module.
+
+Covers:
+- Recording file and example phases
+- Timings that record nothing
+- JSON report and summary
+
+Run with:
+    python3 test_phase_timings.py
+    pytest test_phase_timings.py -v
+"""
+
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from phase_timings import TimingReport, NO_TIMINGS, PHASES
+
+
+def test_record_phases():
+    """Test recording the phases of files and examples."""
+    print("\n" + "="*60)
+    print("TEST: PhaseTimings phases")
+    print("="*60)
+
+    report = TimingReport()
+    file_timings = report.start_file('docs/api/users.md')
+    with file_timings.phase('read'):
+        time.sleep(0.01)
+    example = file_timings.example('GET example')
+    with example.phase('execute'):
+        time.sleep(0.01)
+    example.add('execute', 0.5)
+    file_timings.finish()
+
+    assert file_timings.phases['read'] >= 0.01, f"Unexpected phases: {file_timings.phases}"
+    assert example.phases['execute'] >= 0.51, f"Unexpected phases: {example.phases}"
+    assert file_timings.seconds >= 0.02
+    assert file_timings.total('execute') == example.phases['execute']
+    print("  SUCCESS: File and example phases recorded")
+
+    # A phase is recorded even if its code raises
+    try:
+        with example.phase('compare'):
+            raise ValueError()
+    except ValueError:
+        pass
+    assert 'compare' in example.phases
+    print("  SUCCESS: Phase recorded on error")
+
+    print("  ✓ All phase tests passed")
+
+
+def test_no_timings():
+    """Test that NO_TIMINGS records nothing."""
+    print("\n" + "="*60)
+    print("TEST: NO_TIMINGS")
+    print("="*60)
+
+    with NO_TIMINGS.phase('read'):
+        pass
+    example = NO_TIMINGS.example('GET example')
+    example.add('execute', 1.0)
+    NO_TIMINGS.finish()
+    assert NO_TIMINGS.phases == {} and NO_TIMINGS.examples == [] and NO_TIMINGS.seconds is None
+    print("  SUCCESS: Nothing recorded")
+
+    print("  ✓ All NO_TIMINGS tests passed")
+
+
+def test_report():
+    """Test the JSON report and summary."""
+    print("\n" + "="*60)
+    print("TEST: TimingReport output")
+    print("="*60)
+
+    report = TimingReport()
+    for name, seconds in [('a.md', 0.2), ('b.md', 0.1)]:
+        file_timings = report.start_file(name)
+        file_timings.add('schema', seconds)
+        file_timings.example('GET example').add('execute', seconds * 2)
+        file_timings.finish()
+
+    # Test 1: Totals cover files and examples, in phase order
+    totals = report.totals()
+    assert list(totals) == PHASES, f"Unexpected phases: {list(totals)}"
+    assert abs(totals['schema'] - 0.3) < 1e-9 and abs(totals['execute'] - 0.6) < 1e-9
+    print("  SUCCESS: Totals computed")
+
+    # Test 2: The JSON report has every file and example
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'timings.json'
+        assert report.write_json(str(path)) is None
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert data['version'] == 1 and [f['name'] for f in data['files']] == ['a.md', 'b.md']
+        assert data['files'][0]['examples'][0] == {'name': 'GET example', 'phases': {'execute': 0.4}}
+        assert 'Could not write' in report.write_json(str(Path(temp_dir) / 'missing' / 'timings.json'))
+    print("  SUCCESS: JSON report written")
+
+    # Test 3: The summary lists the slowest examples first
+    lines = report.summary_lines()
+    assert lines[0] == "Time by phase:"
+    slowest = lines[lines.index("Slowest examples:") + 1]
+    assert slowest.endswith('a.md: GET example'), f"Unexpected summary: {lines}"
+    print("  SUCCESS: Summary built")
+
+    print("  ✓ All report tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR phase_timings.py")
+    print("="*70)
+
+    tests = [
+        test_record_phases,
+        test_no_timings,
+        test_report,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
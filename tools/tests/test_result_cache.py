@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for result_cache module.
+
+Covers:
+- Content-hash keys of examples
+- Storing and looking up results
+- File digests
+
+Run with:
+    python3 test_result_cache.py
+    pytest test_result_cache.py -v
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from result_cache import ResultCache, file_digest
+
+
+CONFIG = {
+    "test_apps": ["json-server@0.17.4"],
+    "server_url": "localhost:3000",
+    "local_database": "/api/to-do-db-source-test.json",
+    "testable": ["GET example"],
+}
+
+
+def _key(**changes):
+    """Build an example key, with some of the inputs changed."""
+    inputs = {
+        'request_block': 'curl http://{server_url}/users',
+        'response_block': '[]',
+        'test_config': CONFIG,
+        'database_digest': 'a' * 64,
+        'server_version': '',
+        'previous_key': None,
+        'tool_version': 'v1',
+    }
+    inputs.update(changes)
+    return ResultCache.example_key(**inputs)
+
+
+def test_example_key():
+    """Test that keys change with everything a result depends on."""
+    print("\n" + "="*60)
+    print("TEST: ResultCache.example_key()")
+    print("="*60)
+
+    key = _key()
+    assert key == _key() and len(key) == 64, f"Key should be a stable digest: {key}"
+    print("  SUCCESS: Keys are stable")
+
+    changed = [
+        _key(request_block='curl http://{server_url}/tasks'),
+        _key(response_block='[{"id": 1}]'),
+        _key(test_config=dict(CONFIG, server_url='localhost:3001')),
+        _key(database_digest='b' * 64),
+        _key(server_version='mock_service:1'),
+        _key(previous_key=key),
+        _key(tool_version='v2'),
+    ]
+    assert key not in changed and len(set(changed)) == len(changed), "Each input should change the key"
+    print("  SUCCESS: Every input changes the key")
+
+    assert _key(test_config=dict(CONFIG, testable=['GET example', 'POST example'])) == key, \
+        "The testable list should not change the key"
+    print("  SUCCESS: Adding examples doesn't change other keys")
+
+    print("  ✓ All example key tests passed")
+
+
+def test_get_and_put():
+    """Test storing and looking up results."""
+    print("\n" + "="*60)
+    print("TEST: ResultCache.get() and put()")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResultCache(str(Path(temp_dir) / 'cache'))
+        key = _key()
+
+        # Test 1: A missing result is a miss
+        assert cache.get(key) is None and cache.misses == 1
+        print("  SUCCESS: Missing result is a miss")
+
+        # Test 2: A stored result is found by another cache on the same directory
+        assert cache.put(key, {'file': 'users.md', 'example': 'GET example'})
+        other = ResultCache(str(Path(temp_dir) / 'cache'))
+        result = other.get(key)
+        assert result['example'] == 'GET example' and 'cached_at' in result, f"Unexpected result: {result}"
+        assert other.hits == 1
+        assert not list(Path(temp_dir).rglob('*.tmp')), "Temporary files should be renamed"
+        print("  SUCCESS: Stored result found")
+
+        # Test 3: A damaged result is a miss
+        next(Path(temp_dir).rglob('*.json')).write_text('{"file": ', encoding='utf-8')
+        assert other.get(key) is None and other.misses == 1
+        print("  SUCCESS: Damaged result is a miss")
+
+        # Test 4: A cache directory that can't be created doesn't store results
+        blocker = Path(temp_dir) / 'file'
+        blocker.write_text('', encoding='utf-8')
+        assert not ResultCache(str(blocker / 'cache')).put(key, {})
+        print("  SUCCESS: Unwritable cache reported")
+
+    print("  ✓ All get and put tests passed")
+
+
+def test_file_digest():
+    """Test file digests."""
+    print("\n" + "="*60)
+    print("TEST: file_digest()")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'db.json'
+        path.write_text('{"users": []}', encoding='utf-8')
+        digest = file_digest(str(path))
+        assert len(digest) == 64 and digest == file_digest(str(path))
+
+        path.write_text('{"users": [{"id": 1}]}', encoding='utf-8')
+        assert file_digest(str(path)) != digest, "Digest should change with the file"
+        print("  SUCCESS: Digest follows file content")
+
+        assert file_digest(str(Path(temp_dir) / 'missing.json')) == 'missing'
+        print("  SUCCESS: Missing file reported")
+
+    print("  ✓ All file digest tests passed")
+
+
+def run_all_tests():
+    """Run all test functions."""
+    print("\n" + "="*70)
+    print(" RUNNING ALL TESTS FOR result_cache.py")
+    print("="*70)
+
+    tests = [
+        test_example_key,
+        test_get_and_put,
+        test_file_digest,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            failed += 1
+            print(f"\n  ✗ FAILED: {test_func.__name__}")
+            print(f"    {str(e)}")
+        except Exception as e:
+            failed += 1
+            print(f"\n  ✗ ERROR in {test_func.__name__}")
+            print(f"    {str(e)}")
+
+    print("\n" + "="*70)
+    print(f" TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -9,6 +9,8 @@ Covers:
 - Error and warning message generation
 - Graceful handling when jsonschema unavailable
 - Cache clearing functionality
+- Compiled validator registry keyed by schema path and modification time
+- Bulk validation of files with line numbers
 
 Run with:
     python3 test_schema_validator.py
@@ -36,6 +38,9 @@ if spec and spec.loader:
     clear_schema_cache = schema_validator.clear_schema_cache
     validate_front_matter_schema = schema_validator.validate_front_matter_schema
     validate_with_default_schema = schema_validator.validate_with_default_schema
+    get_compiled_schema = schema_validator.get_compiled_schema
+    categorize_validation_error = schema_validator.categorize_validation_error
+    validate_files = schema_validator.validate_files
     JSONSCHEMA_AVAILABLE = schema_validator.JSONSCHEMA_AVAILABLE
 
 
@@ -447,6 +452,139 @@ def test_real_schema_file():
     print("  ✓ All real schema tests passed")
 
 
+def test_compiled_schema_registry():
+    """Test that compiled validators are reused until the schema changes."""
+    print("\n" + "="*60)
+    print("TEST: get_compiled_schema()")
+    print("="*60)
+    
+    if not JSONSCHEMA_AVAILABLE:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    import os
+    import tempfile
+    
+    schema = {
+        "type": "object",
+        "required": ["layout"],
+        "properties": {
+            "layout": {"type": "string", "enum": ["default"]},
+            "tags": {"type": "array", "items": {"type": "string"}}
+        }
+    }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        schema_path = Path(temp_dir) / 'schema.json'
+        schema_path.write_text(json.dumps(schema), encoding='utf-8')
+        clear_schema_cache()
+        
+        # Test 1: The compiled schema is reused
+        compiled = get_compiled_schema(str(schema_path))
+        assert compiled is get_compiled_schema(str(schema_path)), "Should reuse the compiled schema"
+        assert compiled.required_fields == frozenset(['layout'])
+        assert compiled.field_categories == {'layout': 'required', 'tags': 'optional'}
+        print("  SUCCESS: Compiled schema reused")
+        
+        # Test 2: Errors are categorized like categorize_validation_error()
+        metadata = {"tags": [1]}
+        for error in compiled.validator.iter_errors(metadata):
+            assert compiled.categorize(error) == categorize_validation_error(error, schema)
+        metadata = {"layout": "wide"}
+        error = next(compiled.validator.iter_errors(metadata))
+        assert compiled.categorize(error)[0], "Invalid required field should be an error"
+        print("  SUCCESS: Errors categorized")
+        
+        # Test 3: A changed schema file is compiled again
+        schema["required"] = ["layout", "tags"]
+        schema_path.write_text(json.dumps(schema), encoding='utf-8')
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        changed = get_compiled_schema(str(schema_path))
+        assert changed is not compiled and 'tags' in changed.required_fields, "Should compile the changed schema"
+        print("  SUCCESS: Changed schema compiled again")
+        
+        # Test 4: Missing schemas aren't compiled
+        assert get_compiled_schema(str(Path(temp_dir) / 'missing.json')) is None
+        print("  SUCCESS: Missing schema handled")
+    
+    clear_schema_cache()
+    print("  ✓ All compiled schema tests passed")
+
+
+def test_validate_files():
+    """Test validating the front matter of many files."""
+    print("\n" + "="*60)
+    print("TEST: validate_files()")
+    print("="*60)
+    
+    if not JSONSCHEMA_AVAILABLE:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    import tempfile
+    
+    real_schema_path = str(Path(__file__).parent.parent.parent / '.github' / 'schemas' / 'front-matter-schema.json')
+    valid = "---\nlayout: default\ndescription: Get all the users of the To-Do service\ntopic_type: reference\n---\n# Page\n"
+    files = {
+        'valid.md': valid,
+        'sub/nested.md': valid,
+        'warning.md': valid.replace('---\n# Page', 'test:\n  testable:\n    - GET example\n  server_url: "bad url"\n---\n# Page'),
+        'invalid.md': "---\nlayout: wide\ndescription: A page\n---\n",
+        'broken.md': "---\nlayout: [default\n---\n",
+        'opt_out.md': "<!-- front matter not required -->\n# Notes\n",
+    }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, content in files.items():
+            (Path(temp_dir) / name).parent.mkdir(parents=True, exist_ok=True)
+            (Path(temp_dir) / name).write_text(content, encoding='utf-8')
+        
+        results = validate_files([temp_dir], real_schema_path, jobs=1)
+        by_file = {str(Path(r['file']).relative_to(temp_dir)): r for r in results}
+        
+        # Test 1: Directories are searched recursively, in path order
+        assert list(by_file) == sorted(files), f"Unexpected files: {list(by_file)}"
+        assert by_file['valid.md'] == {'file': str(Path(temp_dir) / 'valid.md'), 'valid': True,
+                                       'skipped': False, 'errors': [], 'warnings': []}
+        assert by_file['sub/nested.md']['valid']
+        print("  SUCCESS: Valid files found and passed")
+        
+        # Test 2: Problems are reported with their lines
+        warning = by_file['warning.md']
+        assert warning['valid'] and warning['warnings'][0]['line'] == 8, f"Unexpected result: {warning}"
+        invalid = by_file['invalid.md']
+        assert not invalid['valid'], f"Unexpected result: {invalid}"
+        assert {'message': 'Required field missing: topic_type', 'line': 1} in invalid['errors']
+        assert any(e['line'] == 2 and "'layout'" in e['message'] for e in invalid['errors'])
+        broken = by_file['broken.md']
+        assert not broken['valid'] and broken['errors'][0]['line'] == 2, f"Unexpected result: {broken}"
+        print("  SUCCESS: Errors and warnings have line numbers")
+        
+        # Test 3: Files that don't need front matter are skipped
+        assert by_file['opt_out.md']['skipped'] and by_file['opt_out.md']['valid']
+        print("  SUCCESS: Opted-out file skipped")
+        
+        # Test 4: A process pool gives the same results. Pool workers find
+        # functions by module name, so use the imported module.
+        import schema_validator as imported_validator
+        original_minimum = imported_validator.MIN_FILES_PER_PROCESS_POOL
+        imported_validator.MIN_FILES_PER_PROCESS_POOL = 2
+        try:
+            pooled = imported_validator.validate_files([f"{temp_dir}/**/*.md"], real_schema_path, jobs=2)
+        finally:
+            imported_validator.MIN_FILES_PER_PROCESS_POOL = original_minimum
+        assert pooled == results, "Process pool results should match"
+        print("  SUCCESS: Process pool results match")
+        
+        # Test 5: Missing files are reported
+        missing = validate_files([str(Path(temp_dir) / 'missing.md')], real_schema_path)[0]
+        assert not missing['valid'] and 'Could not read' in missing['errors'][0]['message']
+        print("  SUCCESS: Missing file reported")
+    
+    print("  ✓ All validate_files tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*70)
@@ -462,7 +600,9 @@ def run_all_tests():
         test_validate_nested_objects,
         test_validate_without_jsonschema,
         test_validate_with_default_schema,
-        test_real_schema_file
+        test_real_schema_file,
+        test_compiled_schema_registry,
+        test_validate_files
     ]
     
     passed = 0
@@ -8,6 +8,10 @@ Covers:
 - Extract expected JSON responses
 - JSON object comparison
 - Front matter validation (when jsonschema available)
+- Read-only command detection and concurrent example execution
+- Multi-file batch testing with database resets
+- Skipping passed examples with the result cache
+- Phase timings of files and examples
 
 Note: These are unit tests. Integration tests requiring a running
       json-server would be separate.
@@ -17,14 +21,23 @@ Run with:
     pytest test_test_api_docs.py -v
 """
 
+import os
 import sys
+import io
 import json
+import tempfile
+import threading
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from result_cache import ResultCache
+from phase_timings import TimingReport
+
 # Import the script module (uses hyphens, needs importlib)
 import importlib.util
 spec = importlib.util.spec_from_file_location(
@@ -39,6 +52,12 @@ parse_testable_entry = test_api_docs.parse_testable_entry
 extract_curl_command = test_api_docs.extract_curl_command
 extract_expected_response = test_api_docs.extract_expected_response
 compare_json_objects = test_api_docs.compare_json_objects
+is_read_only_command = test_api_docs.is_read_only_command
+# Not named test_* so pytest doesn't collect them
+run_test_file = test_api_docs.test_file
+run_test_files = test_api_docs.test_files
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent / '.github' / 'schemas' / 'front-matter-schema.json'
 # Import schema validator directly
 import importlib.util
 schema_validator_spec = importlib.util.spec_from_file_location("schema_validator", 
@@ -375,6 +394,52 @@ def test_compare_json_objects_different():
     print("  ✓ All difference detection tests passed")
 
 
+def test_compare_json_objects_list_key():
+    """Test JSON comparison that matches list items by id."""
+    print("\n" + "="*60)
+    print("TEST: compare_json_objects() - list_key")
+    print("="*60)
+    
+    # Test 1: Reordered records are equal when matched by id
+    actual = [{"id": 2, "name": "Bo"}, {"id": 1, "name": "Ann"}]
+    expected = [{"id": 1, "name": "Ann"}, {"id": 2, "name": "Bo"}]
+    assert compare_json_objects(actual, expected, list_key='id') == (True, [])
+    assert compare_json_objects({"users": actual}, {"users": expected}, list_key='id') == (True, [])
+    print("  SUCCESS: Reordered records matched by id")
+    
+    # Test 2: Without list_key, order matters
+    are_equal, diffs = compare_json_objects(actual, expected)
+    assert not are_equal and diffs, "Reordered lists should differ without list_key"
+    print("  SUCCESS: Order compared without list_key")
+    
+    # Test 3: Real differences are still found
+    actual = [{"id": 2, "name": "Bo"}, {"id": 1, "name": "Al"}]
+    are_equal, diffs = compare_json_objects(actual, expected, list_key='id')
+    assert not are_equal and len(diffs) == 1, f"Unexpected: {diffs}"
+    print("  SUCCESS: Changed record reported")
+    
+    # Test 4: An example whose front matter sets unordered_lists passes
+    content = (
+        "### `GET` example request\n\n"
+        "```bash\ncurl http://localhost:3000/users\n```\n\n"
+        "#### `GET` example response\n\n"
+        "```json\n[{\"id\": 1}, {\"id\": 2}]\n```\n"
+    )
+    response = (200, None, '[{"id": 2}, {"id": 1}]')
+    with redirect_stdout(io.StringIO()):
+        passed = test_api_docs.test_example(
+            content, {'unordered_lists': True}, 'GET example', [200], 'example.md',
+            False, 'warning', response=response)
+        failed = test_api_docs.test_example(
+            content, {}, 'GET example', [200], 'example.md',
+            False, 'warning', response=response)
+    assert passed, "Example with reordered records should pass"
+    assert not failed, "Example without unordered_lists should fail"
+    print("  SUCCESS: unordered_lists example passed")
+    
+    print("  ✓ All list_key tests passed")
+
+
 def test_validate_front_matter_with_jsonschema():
     """Test front matter validation when jsonschema is available."""
     print("\n" + "="*60)
@@ -516,6 +581,493 @@ def test_real_test_data_files():
     print("  ✓ All real file tests passed")
 
 
+def test_is_read_only_command():
+    """Test detection of commands that don't change data."""
+    print("\n" + "="*60)
+    print("TEST: is_read_only_command()")
+    print("="*60)
+    
+    test_cases = [
+        ("curl -i http://localhost:3000/users", True, "Plain GET"),
+        ("curl -G -H 'Accept: application/json' --url http://localhost:3000/users", True, "GET with -G"),
+        ("curl -I http://localhost:3000/users", True, "HEAD"),
+        ("curl -X POST http://localhost:3000/users -d '{}'", False, "POST"),
+        ("curl -X DELETE http://localhost:3000/users/1", False, "DELETE"),
+        ("curl http://localhost:3000/users -d '{}'", False, "Data implies POST"),
+        ("curl $SERVER/users", False, "Unparsable command is treated as changing data"),
+    ]
+    
+    for command, expected, description in test_cases:
+        result = is_read_only_command(command)
+        assert result == expected, f"{description}: expected {expected}, got {result}"
+        print(f"  SUCCESS: {description}")
+    
+    print("  ✓ All is_read_only_command tests passed")
+
+
+class _UsersHandler(BaseHTTPRequestHandler):
+    """Minimal users service that records the order of requests."""
+    protocol_version = 'HTTP/1.1'
+    users = []
+    requests = []
+    
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        self.requests.append(('GET', self.path))
+        if self.path == '/users':
+            self._send(200, self.users)
+        else:
+            user_id = int(self.path.rsplit('/', 1)[1])
+            self._send(200, next(u for u in self.users if u['id'] == user_id))
+    
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        user = json.loads(self.rfile.read(length))
+        self.requests.append(('POST', self.path))
+        self.users.append(user)
+        self._send(201, user)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def test_test_file_concurrent_jobs():
+    """Test concurrent read-only examples keep data changes in order."""
+    print("\n" + "="*60)
+    print("TEST: test_file() with jobs > 1")
+    print("="*60)
+    
+    try:
+        import jsonschema
+    except ImportError:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    _UsersHandler.users = [{"id": 1, "name": "Ann"}]
+    _UsersHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _UsersHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"127.0.0.1:{server.server_address[1]}"
+    
+    content = f"""---
+layout: default
+description: Concurrency test document
+topic_type: reference
+test:
+    server_url: {server_url}
+    testable:
+        - GET one
+        - GET all
+        - POST example / 201
+        - GET two
+        - GET all after
+---
+
+### GET one request
+
+```bash
+curl http://{{server_url}}/users/1
+```
+
+### GET one response
+
+```json
+{{"id": 1, "name": "Ann"}}
+```
+
+### GET all request
+
+```bash
+curl http://{{server_url}}/users
+```
+
+### GET all response
+
+```json
+[{{"id": 1, "name": "Ann"}}]
+```
+
+### POST example request
+
+```bash
+curl -X POST http://{{server_url}}/users -H "Content-Type: application/json" -d '{{"id": 2, "name": "Bo"}}'
+```
+
+### POST example response
+
+```json
+{{"id": 2, "name": "Bo"}}
+```
+
+### GET two request
+
+```bash
+curl http://{{server_url}}/users/2
+```
+
+### GET two response
+
+```json
+{{"id": 2, "name": "Bo"}}
+```
+
+### GET all after request
+
+```bash
+curl http://{{server_url}}/users
+```
+
+### GET all after response
+
+```json
+[{{"id": 1, "name": "Ann"}}, {{"id": 2, "name": "Bo"}}]
+```
+"""
+    
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doc_path = Path(temp_dir) / 'concurrent.md'
+            doc_path.write_text(content, encoding='utf-8')
+            
+            output = io.StringIO()
+            timings = TimingReport()
+            with redirect_stdout(output):
+                total, passed, failed = run_test_file(str(doc_path), str(SCHEMA_PATH), jobs=4,
+                                                      timings=timings)
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    assert (total, passed, failed) == (5, 5, 0), f"Unexpected results: {(total, passed, failed)}\n{output.getvalue()}"
+    print("  SUCCESS: All examples passed with jobs=4")
+    
+    # The POST runs after both earlier GETs and before both later GETs
+    methods = [method for method, _ in _UsersHandler.requests]
+    assert methods.index('POST') == 2, f"POST should be third request: {_UsersHandler.requests}"
+    print("  SUCCESS: Data-changing example stayed in order")
+    
+    # Results are reported in front matter order
+    tested = [line for line in output.getvalue().splitlines() if 'Testing example:' in line]
+    expected_order = ['GET one', 'GET all', 'POST example', 'GET two', 'GET all after']
+    assert [line.split('Testing example: ', 1)[1] for line in tested] == expected_order, f"Unexpected order: {tested}"
+    print("  SUCCESS: Results reported in front matter order")
+    
+    # Every phase is timed, including requests run ahead of their example
+    file_timings = timings.files[0]
+    assert {'read', 'front_matter', 'schema', 'extract'} <= set(file_timings.phases), \
+        f"Unexpected file phases: {file_timings.phases}"
+    assert [example.name for example in file_timings.examples] == expected_order
+    for example in file_timings.examples:
+        assert {'extract', 'execute', 'parse', 'compare'} <= set(example.phases), \
+            f"Unexpected phases for {example.name}: {example.phases}"
+    assert file_timings.seconds is not None
+    print("  SUCCESS: Phase timings recorded")
+    
+    print("  ✓ Concurrent example test passed")
+
+
+class _WatchedDatabaseHandler(BaseHTTPRequestHandler):
+    """Serve collections from a database file, like json-server --watch."""
+    protocol_version = 'HTTP/1.1'
+    database_path = None
+    
+    def do_GET(self):
+        data = json.loads(Path(self.database_path).read_text(encoding='utf-8'))
+        collection = self.path.strip('/')
+        body = json.dumps(data.get(collection, {})).encode('utf-8')
+        self.send_response(200 if collection in data else 404)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def _batch_doc(server_url, database, expected_users):
+    """Build a test document whose GET example expects expected_users."""
+    return f"""---
+layout: default
+description: Batch test document
+topic_type: reference
+test:
+    test_apps:
+        - json-server@0.17.4
+    server_url: {server_url}
+    local_database: {database}
+    testable:
+        - GET example
+---
+
+### GET example request
+
+```bash
+curl http://{server_url}/users
+```
+
+### GET example response
+
+```json
+{json.dumps(expected_users)}
+```
+"""
+
+
+def test_test_files_batch_with_reset():
+    """Test several files in one run with a database reset per file."""
+    print("\n" + "="*60)
+    print("TEST: test_files() batch mode")
+    print("="*60)
+    
+    try:
+        import jsonschema
+    except ImportError:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    original_cwd = Path.cwd()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        watched = temp_path / 'watched.json'
+        watched.write_text('{"users": []}', encoding='utf-8')
+        
+        _WatchedDatabaseHandler.database_path = str(watched)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _WatchedDatabaseHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        server_url = f"127.0.0.1:{server.server_address[1]}"
+        
+        ann = [{"id": 1, "name": "Ann"}]
+        bo = [{"id": 2, "name": "Bo"}]
+        (temp_path / 'db_ann.json').write_text(json.dumps({"users": ann}), encoding='utf-8')
+        (temp_path / 'db_bo.json').write_text(json.dumps({"users": bo}), encoding='utf-8')
+        
+        (temp_path / 'ann.md').write_text(_batch_doc(server_url, '/db_ann.json', ann), encoding='utf-8')
+        (temp_path / 'bo.md').write_text(_batch_doc(server_url, '/db_bo.json', bo), encoding='utf-8')
+        (temp_path / 'ann_again.md').write_text(_batch_doc(server_url, '/db_ann.json', ann), encoding='utf-8')
+        (temp_path / 'missing_db.md').write_text(_batch_doc(server_url, '/db_none.json', ann), encoding='utf-8')
+        (temp_path / 'no_config.md').write_text("---\nlayout: default\n---\n# No tests\n", encoding='utf-8')
+        
+        try:
+            os.chdir(temp_path)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                results = run_test_files(
+                    ['ann.md', 'bo.md', 'ann_again.md', 'missing_db.md', 'no_config.md'],
+                    str(SCHEMA_PATH),
+                    reset_target=str(watched)
+                )
+        finally:
+            os.chdir(original_cwd)
+            server.shutdown()
+            server.server_close()
+    
+    by_file = {result[0]: result for result in results}
+    
+    # Test 1: Files that share a database are grouped and each gets a reset
+    assert [r[0] for r in results][:2] == ['ann.md', 'ann_again.md'], f"Unexpected order: {results}"
+    for name in ['ann.md', 'bo.md', 'ann_again.md']:
+        assert by_file[name][1:] == (1, 1, 0, False), f"{name} should pass: {by_file[name]}\n{output.getvalue()}"
+    print("  SUCCESS: Each file tested against its own database")
+    
+    # Test 2: A missing database fails the file without running it
+    assert by_file['missing_db.md'] == ('missing_db.md', 0, 0, 0, True), f"Unexpected: {by_file['missing_db.md']}"
+    assert 'Database not found' in output.getvalue()
+    print("  SUCCESS: Missing database fails the file")
+    
+    # Test 3: Files without a test configuration are skipped
+    assert 'no_config.md' not in by_file, "File without test configuration should be skipped"
+    assert 'Skipping no_config.md (no valid test configuration)' in output.getvalue()
+    print("  SUCCESS: File without test configuration skipped")
+    
+    print("  ✓ Batch mode test passed")
+
+
+def _worker_doc(name):
+    """Build a test document that adds a user and reads it back."""
+    return f"""---
+layout: default
+description: Worker test document
+topic_type: reference
+test:
+    test_apps:
+        - json-server@0.17.4
+    server_url: localhost:3000
+    local_database: /db.json
+    testable:
+        - POST example / 201
+        - GET example
+---
+
+### POST example request
+
+```bash
+curl -X POST {{server_url}}/users -H "Content-Type: application/json" -d '{{"name": "{name}"}}'
+```
+
+### POST example response
+
+```json
+{{"name": "{name}", "id": 3}}
+```
+
+### GET example request
+
+```bash
+curl http://localhost:3000/users/3
+```
+
+### GET example response
+
+```json
+{{"name": "{name}", "id": 3}}
+```
+"""
+
+
+def test_test_files_on_mock_workers():
+    """Test files in parallel on per-worker mock servers."""
+    print("\n" + "="*60)
+    print("TEST: test_files() with mock server workers")
+    print("="*60)
+    
+    try:
+        import jsonschema
+    except ImportError:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    original_cwd = Path.cwd()
+    names = ['ann', 'bo', 'cy', 'di', 'ed']
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        users = [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]
+        (temp_path / 'db.json').write_text(json.dumps({"users": users, "tasks": []}), encoding='utf-8')
+        for name in names:
+            (temp_path / f'{name}.md').write_text(_worker_doc(name), encoding='utf-8')
+        (temp_path / 'no_config.md').write_text("---\nlayout: default\n---\n# No tests\n", encoding='utf-8')
+        
+        try:
+            os.chdir(temp_path)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                results = run_test_files(
+                    [f'{name}.md' for name in names] + ['no_config.md'],
+                    str(SCHEMA_PATH),
+                    workers=2
+                )
+        finally:
+            os.chdir(original_cwd)
+    
+    # Test 1: Each file got its own copy of the database on a mock server
+    assert [r[0] for r in results] == [f'{name}.md' for name in names], f"Unexpected order: {results}"
+    for result in results:
+        assert result[1:] == (2, 2, 0, False), f"{result[0]} should pass: {result}\n{output.getvalue()}"
+    print("  SUCCESS: Files isolated on their own database copies")
+    
+    # Test 2: {server_url} and the documented server URL point at the worker's server
+    text = output.getvalue()
+    assert 'localhost:3000' not in text.replace('server_url: localhost:3000', ''), \
+        "Examples should use the worker's server"
+    assert 'Skipping no_config.md' in text
+    print("  SUCCESS: Server URL substituted per worker")
+    
+    # Test 3: Output is printed one file at a time, in order
+    tested = [line.split('Testing file: ', 1)[1] for line in text.splitlines() if 'Testing file: ' in line]
+    assert tested == [f'{name}.md' for name in names], f"Unexpected output order: {tested}"
+    for name in names:
+        section = text.split(f'Testing file: {name}.md', 1)[1].split('Testing file: ', 1)[0]
+        assert section.count('Testing example:') == 2, f"Output of {name}.md is mixed with other files"
+    print("  SUCCESS: Output grouped by file, in order")
+    
+    print("  ✓ All mock server worker tests passed")
+
+
+def test_test_files_result_cache():
+    """Test that passed examples are reported from the result cache."""
+    print("\n" + "="*60)
+    print("TEST: test_files() with a result cache")
+    print("="*60)
+    
+    # Every local module that judges examples expires cached results when edited
+    for module in ('curl_engine', 'markdown_index', 'json_diff'):
+        assert f"{module}.py" in test_api_docs.VERDICT_SOURCES, f"{module}.py not in VERDICT_SOURCES"
+    print("  SUCCESS: Comparison code is part of the cache key")
+    
+    try:
+        import jsonschema
+    except ImportError:
+        print("  SKIPPED: jsonschema not installed")
+        return
+    
+    original_cwd = Path.cwd()
+    
+    def run(cache):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            results = run_test_files(['ann.md'], str(SCHEMA_PATH), workers=1, cache=cache)
+        return results[0], output.getvalue()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        database = {"users": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}], "tasks": []}
+        (temp_path / 'db.json').write_text(json.dumps(database), encoding='utf-8')
+        (temp_path / 'ann.md').write_text(_worker_doc('ann'), encoding='utf-8')
+        
+        try:
+            os.chdir(temp_path)
+            
+            # Test 1: The first run tests every example and stores the passes
+            cache = ResultCache(str(temp_path / 'cache'))
+            result, text = run(cache)
+            assert result[1:] == (2, 2, 0, False), f"Unexpected result: {result}\n{text}"
+            assert 'cached result' not in text and cache.reused == 0
+            print("  SUCCESS: First run tests every example")
+            
+            # Test 2: The second run doesn't send any requests
+            cache = ResultCache(str(temp_path / 'cache'))
+            result, text = run(cache)
+            assert result[1:] == (2, 2, 0, False), f"Unexpected result: {result}\n{text}"
+            assert text.count('PASSED (cached result)') == 2 and cache.reused == 2
+            assert 'Status:' not in text, f"Examples should not run:\n{text}"
+            print("  SUCCESS: Second run uses cached results")
+            
+            # Test 3: A changed database runs every example again
+            database["users"].append({"id": 9, "name": "Z"})
+            (temp_path / 'db.json').write_text(json.dumps(database), encoding='utf-8')
+            cache = ResultCache(str(temp_path / 'cache'))
+            result, text = run(cache)
+            assert cache.reused == 0 and 'cached result' not in text, f"Examples should run:\n{text}"
+            print("  SUCCESS: Changed database runs the examples")
+            
+            # Test 4: A changed response block runs that example and the data
+            # change before it, and failures aren't cached
+            database["users"].pop()
+            (temp_path / 'db.json').write_text(json.dumps(database), encoding='utf-8')
+            content = _worker_doc('ann')
+            changed = content[:content.rindex('"id": 3}')] + '"id": 4}' + content[content.rindex('"id": 3}') + 8:]
+            (temp_path / 'ann.md').write_text(changed, encoding='utf-8')
+            for _ in range(2):
+                cache = ResultCache(str(temp_path / 'cache'))
+                result, text = run(cache)
+                assert result[1:] == (2, 1, 1, True), f"Unexpected result: {result}\n{text}"
+                assert cache.reused == 0, f"Examples should run:\n{text}"
+            print("  SUCCESS: Changed response runs again and failures aren't cached")
+        finally:
+            os.chdir(original_cwd)
+    
+    print("  ✓ All result cache tests passed")
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*70)
@@ -528,9 +1080,15 @@ def run_all_tests():
         test_extract_expected_response,
         test_compare_json_objects_equal,
         test_compare_json_objects_different,
+        test_compare_json_objects_list_key,
         test_validate_front_matter_with_jsonschema,
         test_validate_front_matter_without_jsonschema,
         test_real_test_data_files,
+        test_is_read_only_command,
+        test_test_file_concurrent_jobs,
+        test_test_files_batch_with_reset,
+        test_test_files_on_mock_workers,
+        test_test_files_result_cache,
     ]
     
     passed = 0
@@ -6,6 +6,7 @@ Covers:
 - Filename validation (safe, unsafe characters)
 - Environment variable handling
 - Empty/missing CHANGED_FILES
+- Newline- and NUL-delimited filename streams
 - Edge cases (special characters, Unicode)
 
 Run with:
@@ -16,6 +17,7 @@ Run with:
 
 import sys
 import os
+import io
 from pathlib import Path
 
 # Add parent directory to path to import the script module
@@ -336,6 +338,45 @@ def test_comprehensive_unsafe_characters():
     print("  ✓ All comprehensive unsafe character tests passed")
 
 
+def test_iter_filenames():
+    """Test reading filenames from a stream."""
+    print("\n" + "="*60)
+    print("TEST: iter_filenames()")
+    print("="*60)
+    
+    # Test 1: Newline-delimited, with CRLF line ends and blank lines
+    stream = io.BytesIO(b'file1.py\r\n\nfile,2.md\nlast.txt')
+    files = list(test_filenames.iter_filenames(stream))
+    assert files == ['file1.py', 'file,2.md', 'last.txt'], f"Unexpected: {files}"
+    print("  SUCCESS: Newline-delimited stream read")
+    
+    # Test 2: NUL-delimited names can hold newlines and commas
+    stream = io.BytesIO(b'a.md\0new\nline.md\0b,c.md\0')
+    files = list(test_filenames.iter_filenames(stream, b'\0'))
+    assert files == ['a.md', 'new\nline.md', 'b,c.md'], f"Unexpected: {files}"
+    assert test_filenames.validate_filenames(files) == ['new\nline.md', 'b,c.md']
+    print("  SUCCESS: NUL-delimited stream read")
+    
+    # Test 3: Names split across reads are joined
+    original_size = test_filenames.READ_SIZE
+    try:
+        test_filenames.READ_SIZE = 3
+        stream = io.BytesIO('first.md\nsecond-é.md\n'.encode('utf-8'))
+        files = list(test_filenames.iter_filenames(stream))
+        assert files == ['first.md', 'second-é.md'], f"Unexpected: {files}"
+    finally:
+        test_filenames.READ_SIZE = original_size
+    print("  SUCCESS: Names split across reads joined")
+    
+    # Test 4: Streamed names are checked as they're read
+    checked, unsafe = test_filenames.check_filenames(
+        test_filenames.iter_filenames(io.BytesIO(b'ok.md\nun safe.md\n')))
+    assert (checked, unsafe) == (2, 1), f"Unexpected: {(checked, unsafe)}"
+    print("  SUCCESS: Streamed names checked")
+    
+    print("  ✓ All iter_filenames tests passed")
+
+
 def run_all_tests():
     """Run all test functions and report results."""
     print("\n" + "="*70)
@@ -349,7 +390,8 @@ def run_all_tests():
         test_validate_mixed_filenames,
         test_edge_cases,
         test_environment_variable_handling,
-        test_comprehensive_unsafe_characters
+        test_comprehensive_unsafe_characters,
+        test_iter_filenames
     ]
     
     passed = 0
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Validate the front matter of whole documentation trees in one run.
+
+Files are read and parsed on a process pool and validated against the
+front matter schema with one compiled validator. Results can be printed
+as text, as GitHub Actions annotations, or as JSON with the errors,
+warnings, and line numbers of each file.
+
+Usage:
+    validate-front-matter.py [path ...] [--schema SCHEMA_FILE] [--jobs N]
+                             [--output FORMAT] [--action [LEVEL]]
+
+Arguments:
+    path: Markdown files, directories (searched recursively), or glob
+              patterns. Default: docs assignments
+    --schema: Path to JSON schema file for front matter validation
+              Default: .github/schemas/front-matter-schema.json
+    --jobs: Number of processes to parse files with
+              Default: one per CPU
+    --output: text (default) or json; JSON output lists run warnings,
+              like a missing schema file, in its warnings field
+    --action: Output GitHub Actions annotations with text output
+              Optional LEVEL: all, warning (default), error
+
+Examples:
+    validate-front-matter.py
+    validate-front-matter.py docs 'assignments/**/*.md' --output json
+    validate-front-matter.py docs --action
+
+Exit Codes:
+    0: Every file has valid front matter or doesn't need it
+    1: At least one file has invalid or missing front matter
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any
+
+# Import from shared modules
+sys.path.insert(0, str(Path(__file__).parent))
+from doc_test_utils import log
+from schema_validator import validate_files, DEFAULT_SCHEMA_PATH
+
+DEFAULT_PATHS = ['docs', 'assignments']
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Count the results of validate_files().
+
+    Args:
+        results: Per-file results from validate_files()
+
+    Returns:
+        dict: Numbers of files, valid, invalid, skipped, and with_warnings
+
+    Example:
+        >>> summarize([{'valid': True, 'skipped': False, 'warnings': []}])
+        {'files': 1, 'valid': 1, 'invalid': 0, 'skipped': 0, 'with_warnings': 0}
+    """
+    return {
+        'files': len(results),
+        'valid': sum(1 for r in results if r['valid'] and not r['skipped']),
+        'invalid': sum(1 for r in results if not r['valid']),
+        'skipped': sum(1 for r in results if r['skipped']),
+        'with_warnings': sum(1 for r in results if r['warnings']),
+    }
+
+
+def print_text(results: List[Dict[str, Any]], use_actions: bool, action_level: str) -> None:
+    """Print the problems of each file and a summary."""
+    for result in results:
+        for error in result['errors']:
+            log(error['message'], "error", result['file'], error['line'], use_actions, action_level)
+        for warning in result['warnings']:
+            log(warning['message'], "warning", result['file'], warning['line'], use_actions, action_level)
+
+    summary = summarize(results)
+    log(f"\nValidated front matter of {summary['files']} file(s)", "info")
+    log(f"  Valid: {summary['valid']}", "success" if summary['valid'] else "info")
+    if summary['invalid']:
+        log(f"  Invalid: {summary['invalid']}", "error")
+    if summary['with_warnings']:
+        log(f"  With warnings: {summary['with_warnings']}", "warning")
+    if summary['skipped']:
+        log(f"  Front matter not required: {summary['skipped']}", "info")
+
+
+def main() -> None:
+    """Main entry point for the validate-front-matter tool."""
+    parser = argparse.ArgumentParser(
+        description='Validate the front matter of markdown files against the front matter schema.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                                  # Validate docs/ and assignments/
+  %(prog)s docs 'assignments/**/*.md'       # Validate directories and patterns
+  %(prog)s docs --output json               # Per-file results as JSON
+  %(prog)s docs --action                    # GitHub Actions annotations
+        """
+    )
+
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        default=DEFAULT_PATHS,
+        help='Markdown files, directories, or glob patterns (default: docs assignments)'
+    )
+
+    parser.add_argument(
+        '--schema',
+        default=DEFAULT_SCHEMA_PATH,
+        help='Path to JSON schema file for front matter validation'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of processes to parse files with (default: one per CPU)'
+    )
+
+    parser.add_argument(
+        '--output',
+        default='text',
+        choices=['text', 'json'],
+        help='Output format: text (default) or json'
+    )
+
+    parser.add_argument(
+        '--action', '-a',
+        type=str,
+        nargs='?',
+        const='warning',
+        default=None,
+        choices=['all', 'warning', 'error'],
+        metavar='LEVEL',
+        help='Output GitHub Actions annotations. Optional LEVEL: all, warning (default), error'
+    )
+
+    args = parser.parse_args()
+
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    warnings = []
+    if not Path(args.schema).is_file():
+        warnings.append(f"Schema file not found: {args.schema}; only front matter syntax is checked")
+        # Keep JSON output parseable; its warnings are part of the payload
+        if args.output != 'json':
+            log(warnings[-1], "warning")
+
+    results = validate_files(args.paths, args.schema, args.jobs)
+
+    if args.output == 'json':
+        print(json.dumps({
+            'schema': args.schema,
+            'warnings': warnings,
+            'summary': summarize(results),
+            'files': results,
+        }, indent=2))
+    else:
+        print_text(results, args.action is not None, args.action or 'warning')
+
+    sys.exit(1 if any(not result['valid'] for result in results) else 0)
+
+
+if __name__ == '__main__':
+    main()